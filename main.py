@@ -6,9 +6,9 @@ from services import deepgram_websockets_compat  # noqa: F401
 
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request, WebSocket
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
-from typing import AsyncIterator, Dict, Callable, Optional, Any
+from typing import AsyncIterator, Coroutine, Dict, Callable, Mapping, Optional, Any, Set
 from deepgram import Deepgram
 from dotenv import load_dotenv
 import os
@@ -16,12 +16,16 @@ import sys
 import uuid
 import asyncio
 import logging
-import json
+import orjson
 from datetime import datetime, timezone
 from services.event_publisher import EventPublisher
 from services.cleaner_service import CleanerService
 from services.aws_event_publisher import AWSEventPublisher
+from services.batch_cleaner_service import BatchCleanerService
+from services.batch_service import BatchService
 from services.intelligence_service import IntelligenceService
+from services.s3_service import S3Service
+from services.shared_instances import shared
 from services.transcript_enrichment import TranscriptEnrichmentService
 from services.internal_domains import get_tenant_internal_domains
 from services.dbos_runtime import dbos_lifespan
@@ -34,7 +38,7 @@ from routers import upload
 from routers import queue_actions
 from routers import granola_cron
 from routers import granola
-from routers.upload import reap_stuck_jobs
+from routers.upload import UploadJobQueue, reap_stuck_jobs
 from services.asyncpg_pool import close_asyncpg_pool
 
 load_dotenv()
@@ -45,18 +49,23 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fallback identity for unauthenticated (legacy) sessions. Read once at import
+# rather than per finalized utterance in the Deepgram transcript callback.
+MOCK_TENANT_ID = os.getenv('MOCK_TENANT_ID', 'default_org')
+MOCK_ACCOUNT_ID = os.getenv('MOCK_ACCOUNT_ID', 'default_account')
+
 # Validate required environment variables
 REQUIRED_ENV_VARS = ["DEEPGRAM_API_KEY", "REDIS_URL", "OPENAI_API_KEY", "DATABASE_URL"]
 
-def validate_environment():
+def validate_environment(env: Mapping[str, str]):
     """Validate that all required environment variables are set."""
-    missing = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+    missing = [var for var in REQUIRED_ENV_VARS if not env.get(var)]
     if missing:
-        logger.error(f"Missing required environment variables: {missing}")
+        logger.error("Missing required environment variables: %s", missing)
         sys.exit(1)
     logger.info("Environment validation passed")
 
-def validate_aws_credentials():
+def validate_aws_credentials(env: Mapping[str, str]):
     """
     Validate AWS credentials and log EventBridge integration status.
     
@@ -64,20 +73,20 @@ def validate_aws_credentials():
     If credentials are missing, EventBridge integration will be disabled
     but the application will continue to run.
     """
-    aws_access_key = os.getenv("AWS_ACCESS_KEY_ID")
-    aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
+    aws_access_key = env.get("AWS_ACCESS_KEY_ID")
+    aws_secret_key = env.get("AWS_SECRET_ACCESS_KEY")
     
     if aws_access_key and aws_secret_key:
         # Credentials present - log enabled status
-        aws_region = os.getenv("AWS_REGION", "us-east-1")
-        eventbridge_bus = os.getenv("EVENTBRIDGE_BUS_NAME", "default")
-        event_source = os.getenv("EVENT_SOURCE", "com.yourapp.transcription")
+        aws_region = env.get("AWS_REGION", "us-east-1")
+        eventbridge_bus = env.get("EVENTBRIDGE_BUS_NAME", "default")
+        event_source = env.get("EVENT_SOURCE", "com.yourapp.transcription")
         
         logger.info("=" * 60)
         logger.info("EventBridge integration ENABLED")
-        logger.info(f"  AWS Region: {aws_region}")
-        logger.info(f"  EventBridge Bus: {eventbridge_bus}")
-        logger.info(f"  Event Source: {event_source}")
+        logger.info("  AWS Region: %s", aws_region)
+        logger.info("  EventBridge Bus: %s", eventbridge_bus)
+        logger.info("  Event Source: %s", event_source)
         logger.info("=" * 60)
     else:
         # Credentials missing - log warning
@@ -87,9 +96,10 @@ def validate_aws_credentials():
         logger.warning("Batch processing will continue without event publishing")
         logger.warning("=" * 60)
 
-# Call validation at startup
-validate_environment()
-validate_aws_credentials()
+# Call validation at startup against one snapshot of the environment
+_startup_env = dict(os.environ)
+validate_environment(_startup_env)
+validate_aws_credentials(_startup_env)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -113,16 +123,26 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     (DBOS, already in this codebase) — that's the Phase 2 path. The drain
     is the cheapest mitigation that meaningfully reduces the silent-loss
     surface area.
+
+    Upload jobs run on the ``UploadJobQueue`` worker pool, started here and
+    stopped after the drain. A job cut off mid-run is left in
+    ``processing`` for ``reap_stuck_jobs`` on the next boot; jobs still
+    waiting in the in-memory queue are marked failed (``SHUTDOWN``) by
+    ``UploadJobQueue.stop`` so clients can retry them via /upload/complete.
     """
     try:
         async with dbos_lifespan(app):
             logger.info("Running startup tasks...")
             await reap_stuck_jobs()
+            _warm_openapi_schema(app)
+            _warm_shared_services()
+            shared(UploadJobQueue).start()
             logger.info("Startup tasks completed")
             try:
                 yield
             finally:
                 await _drain_text_clean_background_tasks()
+                await shared(UploadJobQueue).stop()
     finally:
         # Close the shared asyncpg pool AFTER dbos_lifespan.__aexit__ has
         # run DBOS.destroy() (Codex PR-#28 R4 P2). Closing it earlier —
@@ -135,6 +155,38 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         await close_asyncpg_pool()
 
 
+def _warm_openapi_schema(app: FastAPI) -> None:
+    """Build the OpenAPI document once at startup.
+
+    The request/response models' core schemas are already built at import;
+    the JSON schemas FastAPI derives from them are generated on the first
+    /openapi.json (or /docs) hit and cached on ``app.openapi_schema``. Doing
+    it here keeps that one-off cost out of a request. A failure is logged
+    rather than raised so it cannot block startup.
+    """
+    try:
+        app.openapi()
+    except Exception:
+        logger.warning("OpenAPI schema warm-up failed", exc_info=True)
+
+
+def _warm_shared_services() -> None:
+    """Build the serving loop's shared pipeline service instances at startup.
+
+    Constructing them creates the SDK clients (boto3 clients, the OpenAI
+    HTTP client and its SSL context), which otherwise happens inside the
+    first request to need each one. Failures are logged; the instance is
+    then built on first use as before.
+    """
+    for service_cls in (
+        BatchService, BatchCleanerService, AWSEventPublisher, IntelligenceService, S3Service,
+    ):
+        try:
+            shared(service_cls)
+        except Exception:
+            logger.warning("Shared %s warm-up failed", service_cls.__name__, exc_info=True)
+
+
 async def _drain_text_clean_background_tasks(timeout_s: float = 25.0) -> None:
     """Await in-flight /text/clean background tasks during graceful shutdown.
 
@@ -146,8 +198,9 @@ async def _drain_text_clean_background_tasks(timeout_s: float = 25.0) -> None:
     """
     # _BACKGROUND_TASKS moved to services.text_clean_service in PR-X1 of
     # the Granola integration (phase 2d prep); the drain target is shared
-    # with the Granola ingestion adapter so a graceful shutdown awaits
-    # in-flight Lane 2 work from EITHER caller.
+    # with the Granola ingestion adapter (and /batch/process, via
+    # dispatch_lane2) so a graceful shutdown awaits in-flight Lane 2 work
+    # from every caller.
     from services.text_clean_service import _BACKGROUND_TASKS as _TEXT_BG_TASKS
 
     in_flight = list(_TEXT_BG_TASKS)
@@ -156,8 +209,9 @@ async def _drain_text_clean_background_tasks(timeout_s: float = 25.0) -> None:
         return
 
     logger.info(
-        f"Shutdown: draining {len(in_flight)} /text/clean background "
-        f"tasks (timeout={timeout_s:.0f}s)..."
+        "Shutdown: draining %s /text/clean background tasks (timeout=%.0fs)...",
+        len(in_flight),
+        timeout_s,
     )
     # ``asyncio.wait`` instead of ``asyncio.wait_for``: when the timeout
     # fires, pending tasks are NOT cancelled — they keep running on the
@@ -167,20 +221,21 @@ async def _drain_text_clean_background_tasks(timeout_s: float = 25.0) -> None:
     done, pending = await asyncio.wait(in_flight, timeout=timeout_s)
     if pending:
         logger.warning(
-            f"Shutdown: drain budget exhausted ({timeout_s:.0f}s); "
-            f"{len(pending)} /text/clean background tasks still running "
-            f"and were NOT cancelled — they continue until the event loop "
-            f"stops. If they don't finish before SIGKILL, the Lane 2 work "
-            f"is LOST and clients saw HTTP 200. Re-derivable via "
-            f"reconciliation against raw_interactions if needed."
+            "Shutdown: drain budget exhausted (%.0fs); %s /text/clean background tasks still "
+            "running and were NOT cancelled — they continue until the event loop stops. If they "
+            "don't finish before SIGKILL, the Lane 2 work is LOST and clients saw HTTP 200. "
+            "Re-derivable via reconciliation against raw_interactions if needed.",
+            timeout_s,
+            len(pending),
         )
     else:
         logger.info(
-            f"Shutdown: all {len(done)} /text/clean background tasks drained."
+            "Shutdown: all %s /text/clean background tasks drained.",
+            len(done),
         )
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 @app.get("/health")
@@ -202,6 +257,112 @@ cleaner_service = CleanerService()
 
 templates = Jinja2Templates(directory="templates")
 
+# Per-session registry of fire-and-forget Redis publish tasks scheduled from
+# the Deepgram transcript callback. The callback must not block on a Redis
+# round-trip, so publishes run as tasks; websocket_endpoint registers a
+# session's set before opening Deepgram and drains (removes) it before
+# reading the final transcript so no chunk is missed.
+_INFLIGHT_PUBLISHES: Dict[str, Set[asyncio.Task]] = {}
+
+
+def _schedule_publish(session_id: str, coro: Coroutine[Any, Any, None]) -> None:
+    """Run a transcript publish in the background, tracked per session.
+
+    Once the session's drain has started its set is gone, so a late
+    callback's publish is dropped rather than tracked in a new entry
+    nothing would ever drain.
+    """
+    inflight = _INFLIGHT_PUBLISHES.get(session_id)
+    if inflight is None:
+        coro.close()
+        logger.warning("Dropping transcript publish after drain: session_id=%s", session_id)
+        return
+    task = asyncio.create_task(coro)
+    inflight.add(task)
+
+    def _on_done(t: asyncio.Task) -> None:
+        inflight.discard(t)
+        if t.cancelled():
+            return
+        exc = t.exception()
+        if exc is not None:
+            logger.error(
+                "Transcript publish failed: session_id=%s, error=%s",
+                session_id,
+                exc,
+                exc_info=exc,
+            )
+
+    task.add_done_callback(_on_done)
+
+
+async def _send_json(ws: WebSocket, payload: Dict[str, Any]) -> None:
+    """Send a JSON text frame, serialized with orjson.
+
+    Same wire format as ``WebSocket.send_json`` (compact JSON in a text
+    frame) without Starlette's stdlib ``json.dumps`` on the output path.
+    """
+    await ws.send_text(orjson.dumps(payload).decode())
+
+
+# Max characters of cleaned transcript per frame when the client opts in to
+# chunked session results (?chunked_results=true).
+SESSION_RESULT_CHUNK_CHARS = 64 * 1024
+
+
+async def _send_session_complete(
+    ws: WebSocket,
+    meeting_output: Any,
+    raw_transcript: str,
+    chunked: bool = False,
+) -> None:
+    """Deliver the cleaned session output to the client.
+
+    By default this is the single legacy ``session_complete`` frame. With
+    ``chunked=True`` a long meeting goes out as several small frames instead
+    of one multi-MB frame:
+
+    1. ``{type: "session_summary", summary, action_items}``
+    2. ``{type: "cleaned_transcript_chunk", index, text}`` per
+       ``SESSION_RESULT_CHUNK_CHARS`` slice of the cleaned transcript
+    3. ``{type: "session_complete", done: true, chunks: N}``
+
+    The raw transcript is not repeated in chunked mode — the client already
+    received it in ``session_transcript_ready``.
+    """
+    if not chunked:
+        await _send_json(ws, {
+            "type": "session_complete",
+            "summary": meeting_output.summary,
+            "action_items": meeting_output.action_items,
+            "cleaned_transcript": meeting_output.cleaned_transcript,
+            "raw_transcript": raw_transcript
+        })
+        return
+
+    await _send_json(ws, {
+        "type": "session_summary",
+        "summary": meeting_output.summary,
+        "action_items": meeting_output.action_items,
+    })
+    cleaned = meeting_output.cleaned_transcript or ""
+    chunks = 0
+    for start in range(0, len(cleaned), SESSION_RESULT_CHUNK_CHARS):
+        await _send_json(ws, {
+            "type": "cleaned_transcript_chunk",
+            "index": chunks,
+            "text": cleaned[start:start + SESSION_RESULT_CHUNK_CHARS],
+        })
+        chunks += 1
+    await _send_json(ws, {"type": "session_complete", "done": True, "chunks": chunks})
+
+
+async def _drain_inflight_publishes(session_id: str) -> None:
+    """Wait for every scheduled publish for a session to finish."""
+    inflight = _INFLIGHT_PUBLISHES.pop(session_id, None)
+    if inflight:
+        await asyncio.gather(*inflight, return_exceptions=True)
+
 async def process_audio(
     fast_socket: WebSocket,
     session_id: str,
@@ -224,7 +385,7 @@ async def process_audio(
     """
     is_desktop = desktop_config is not None
     user_name = (context.user_name if context else None) or "You"
-    tenant_id = context.tenant_id if context else os.getenv('MOCK_TENANT_ID', 'default_org')
+    tenant_id = context.tenant_id if context else MOCK_TENANT_ID
 
     async def get_transcript(data: Dict) -> None:
         if 'channel' not in data:
@@ -242,7 +403,7 @@ async def process_audio(
             start_time = data.get('start', 0.0)
             confidence = data['channel']['alternatives'][0].get('confidence', 0.0)
 
-            await event_publisher.publish_structured_segment(
+            _schedule_publish(session_id, event_publisher.publish_structured_segment(
                 channel=channel_idx,
                 speaker=speaker,
                 text=transcript,
@@ -251,10 +412,10 @@ async def process_audio(
                 metadata=data,
                 tenant_id=tenant_id,
                 session_id=session_id,
-            )
+            ))
 
             # Stream labeled chunk to desktop client
-            await fast_socket.send_json({
+            await _send_json(fast_socket, {
                 "type": "transcript_chunk",
                 "speaker": speaker,
                 "channel": channel_idx,
@@ -267,43 +428,47 @@ async def process_audio(
             # message shape so consumers can distinguish firm vs. provisional text).
             if not is_final:
                 try:
-                    await fast_socket.send_json({
+                    await _send_json(fast_socket, {
                         "type": "interim_chunk",
                         "text": transcript,
                     })
                 except Exception as send_err:
                     logger.debug(
-                        f"Could not send interim_chunk: session_id={session_id}, error={send_err}"
+                        "Could not send interim_chunk: session_id=%s, error=%s",
+                        session_id,
+                        send_err,
                     )
                 return
 
             try:
-                await fast_socket.send_json({
+                await _send_json(fast_socket, {
                     "type": "transcript_chunk",
                     "text": transcript,
                 })
             except Exception as send_err:
                 logger.debug(
-                    f"Could not send transcript_chunk: session_id={session_id}, error={send_err}"
+                    "Could not send transcript_chunk: session_id=%s, error=%s",
+                    session_id,
+                    send_err,
                 )
 
-            await event_publisher.publish_transcript_event(
+            _schedule_publish(session_id, event_publisher.publish_transcript_event(
                 transcript=transcript,
                 metadata=data,
                 tenant_id=tenant_id,
                 session_id=session_id,
-            )
+            ))
         else:
             # Legacy browser default: send plain text, store plain string on finalization.
             await fast_socket.send_text(transcript)
 
             if is_final:
-                await event_publisher.publish_transcript_event(
+                _schedule_publish(session_id, event_publisher.publish_transcript_event(
                     transcript=transcript,
                     metadata=data,
                     tenant_id=tenant_id,
                     session_id=session_id,
-                )
+                ))
 
     # Build Deepgram options based on session type
     dg_options: Dict[str, Any] = {
@@ -346,8 +511,12 @@ def get(request: Request):
 
 @app.websocket("/listen")
 async def websocket_endpoint(websocket: WebSocket):
-    # Generate unique session ID
-    session_id = str(uuid.uuid4())
+    # Generate unique session ID. Keep the hyphenated form: session_id is
+    # also the interaction_id persisted to Postgres and sent downstream, so
+    # it must match the canonical UUID string other services store. The
+    # UUID object is kept so Lane 1 doesn't re-parse the string.
+    session_uuid = uuid.uuid4()
+    session_id = str(session_uuid)
 
     # --- Opt-in interim results (additive; defaults to False for backward compat) ---
     # Consumers pass ?interim_results=true on the WS URL to receive interim_chunk
@@ -356,6 +525,13 @@ async def websocket_endpoint(websocket: WebSocket):
     interim_results_flag = (
         websocket.query_params.get("interim_results", "false").lower() == "true"
     )
+    # ?chunked_results=true splits the final session output into summary,
+    # cleaned-transcript chunks and a closing session_complete (see
+    # _send_session_complete). Off by default: existing clients expect the
+    # single session_complete frame.
+    chunked_results_flag = (
+        websocket.query_params.get("chunked_results", "false").lower() == "true"
+    )
 
     # --- JWT Authentication (REQUIRED before accept) ---
     # EQ-120: prod connects as the non-owner role, so every session must be
@@ -373,8 +549,8 @@ async def websocket_endpoint(websocket: WebSocket):
 
     if not token:
         logger.warning(
-            f"WebSocket /listen rejected: missing Authorization token, "
-            f"session_id={session_id}"
+            "WebSocket /listen rejected: missing Authorization token, session_id=%s",
+            session_id,
         )
         await websocket.close(code=4001, reason="Authorization token required")
         return
@@ -386,8 +562,8 @@ async def websocket_endpoint(websocket: WebSocket):
         account_id = websocket.headers.get("x-account-id")
         if not account_id:
             logger.warning(
-                f"WebSocket /listen rejected: missing X-Account-ID, "
-                f"session_id={session_id}"
+                "WebSocket /listen rejected: missing X-Account-ID, session_id=%s",
+                session_id,
             )
             await websocket.close(code=1008, reason="X-Account-ID required")
             return
@@ -401,16 +577,17 @@ async def websocket_endpoint(websocket: WebSocket):
             trace_id=str(uuid.uuid4()),
         )
         logger.info(
-            f"WebSocket authenticated via JWT: session_id={session_id}, "
-            f"tenant={claims.tenant_id[:8]}..."
+            "WebSocket authenticated via JWT: session_id=%s, tenant=%s...",
+            session_id,
+            claims.tenant_id[:8],
         )
     except JWTVerificationError as e:
-        logger.warning(f"WebSocket JWT auth failed: {e.code}, session_id={session_id}")
+        logger.warning("WebSocket JWT auth failed: %s, session_id=%s", e.code, session_id)
         await websocket.close(code=4001, reason=e.message)
         return
 
     await websocket.accept()
-    logger.info(f"WebSocket connection established: session_id={session_id}")
+    logger.info("WebSocket connection established: session_id=%s", session_id)
 
     deepgram_socket = None
     desktop_config: Optional[Dict[str, Any]] = None
@@ -419,20 +596,24 @@ async def websocket_endpoint(websocket: WebSocket):
         # --- Wait for first message: could be session_config (desktop) or audio (browser) ---
         first_message = await websocket.receive()
 
-        if "text" in first_message:
+        if first_message.get("text") is not None:
             try:
-                data = json.loads(first_message["text"])
+                data = orjson.loads(first_message["text"])
                 if data.get("type") == "session_config":
                     desktop_config = data
                     logger.info(
-                        f"Desktop session configured: session_id={session_id}, "
-                        f"source={data.get('source')}, platform={data.get('platform')}, "
-                        f"channels={data.get('audio', {}).get('channels', 'N/A')}"
+                        "Desktop session configured: session_id=%s, source=%s, platform=%s, "
+                        "channels=%s",
+                        session_id,
+                        data.get('source'),
+                        data.get('platform'),
+                        data.get('audio', {}).get('channels', 'N/A'),
                     )
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         # --- Create Deepgram connection with appropriate config ---
+        _INFLIGHT_PUBLISHES[session_id] = set()
         deepgram_socket = await process_audio(
             websocket,
             session_id,
@@ -442,22 +623,38 @@ async def websocket_endpoint(websocket: WebSocket):
         )
 
         # If the first message was audio (not session_config), forward it now
-        if desktop_config is None and "bytes" in first_message:
+        if desktop_config is None and first_message.get("bytes") is not None:
             deepgram_socket.send(first_message["bytes"])
 
         # --- Main message loop ---
         while True:
             message = await websocket.receive()
 
-            if "bytes" in message:
-                deepgram_socket.send(message["bytes"])
-            elif "text" in message:
+            # Audio frames are nearly all of the traffic: forward them with a
+            # single dict lookup and no speculative JSON parsing. Only text
+            # frames (control messages) fall through to the parse below.
+            # Starlette allows just one concurrent receiver per socket, so
+            # the single typed-dispatch loop stays rather than racing
+            # receive_bytes/receive_text tasks.
+            # The frame's bytes object is handed to Deepgram as-is: the SDK
+            # queues the same reference and websockets frames it directly,
+            # so wrapping it in a memoryview would add an allocation, not
+            # remove a copy.
+            audio = message.get("bytes")
+            if audio is not None:
+                deepgram_socket.send(audio)
+            elif message["type"] == "websocket.disconnect":
+                # Client went away without stop_recording; calling receive()
+                # again would raise, so finalize now.
+                logger.info("Client disconnected: session_id=%s", session_id)
+                break
+            elif message.get("text") is not None:
                 try:
-                    data = json.loads(message["text"])
+                    data = orjson.loads(message["text"])
                     msg_type = data.get("type")
 
                     if msg_type == "stop_recording":
-                        logger.info(f"Stop signal received: session_id={session_id}")
+                        logger.info("Stop signal received: session_id=%s", session_id)
                         break
 
                     elif msg_type == "session_reauth" and context is not None:
@@ -475,66 +672,78 @@ async def websocket_endpoint(websocket: WebSocket):
                                     interaction_id=context.interaction_id,
                                     trace_id=context.trace_id,
                                 )
-                                logger.info(f"Session reauth successful: session_id={session_id}")
+                                logger.info("Session reauth successful: session_id=%s", session_id)
                             except JWTVerificationError as e:
                                 logger.warning(
-                                    f"Session reauth failed: {e.code}, session_id={session_id}"
+                                    "Session reauth failed: %s, session_id=%s",
+                                    e.code,
+                                    session_id,
                                 )
                                 # Non-fatal: continue with previous context
 
-                except json.JSONDecodeError:
-                    logger.warning(f"Received non-JSON text message: {message['text']}")
+                except orjson.JSONDecodeError:
+                    logger.warning("Received non-JSON text message: %s", message['text'])
 
     except Exception as e:
-        logger.error(f"WebSocket error: session_id={session_id}, error={e}")
+        logger.error("WebSocket error: session_id=%s, error=%s", session_id, e)
     finally:
-        # Close Deepgram connection
-        if deepgram_socket:
-            try:
-                await deepgram_socket.finish()
-                logger.info(f"Deepgram connection closed: session_id={session_id}")
-            except Exception as e:
-                logger.warning(f"Error closing Deepgram socket: {e}")
+        # The tenant's internal-domain lookup (a Postgres round-trip) needs
+        # only the tenant, not the transcript, so start it now and let it
+        # overlap the Deepgram drain and the Redis read below. Cleaning
+        # itself still waits for the complete transcript.
+        _ws_enrich_tenant_id = (
+            context.tenant_id if context else MOCK_TENANT_ID
+        )
+        internal_domains_task = asyncio.create_task(
+            get_tenant_internal_domains(_ws_enrich_tenant_id)
+        )
 
-        # --- Finalization: retrieve transcript, clean, publish ---
         try:
+            # Close Deepgram connection
+            if deepgram_socket:
+                try:
+                    await deepgram_socket.finish()
+                    logger.info("Deepgram connection closed: session_id=%s", session_id)
+                except Exception as e:
+                    logger.warning("Error closing Deepgram socket: %s", e)
+
+            # --- Finalization: retrieve transcript, clean, publish ---
+            # Publishes were scheduled fire-and-forget from get_transcript;
+            # wait for them so the final read sees every chunk in order.
+            await _drain_inflight_publishes(session_id)
             raw_transcript = await event_publisher.get_final_transcript(session_id)
 
             if raw_transcript:
                 logger.info(
-                    f"Retrieved raw transcript: session_id={session_id}, "
-                    f"length={len(raw_transcript)} chars"
+                    "Retrieved raw transcript: session_id=%s, length=%s chars",
+                    session_id,
+                    len(raw_transcript),
                 )
 
                 # Send raw transcript to client immediately (Phase 1)
                 # This arrives in ~2s. Client can save + display while GPT-4o works.
                 try:
-                    await websocket.send_json({
+                    await _send_json(websocket, {
                         "type": "session_transcript_ready",
                         "raw_transcript": raw_transcript,
                         "session_id": session_id,
                     })
-                    logger.info(f"session_transcript_ready sent: session_id={session_id}")
+                    logger.info("session_transcript_ready sent: session_id=%s", session_id)
                 except Exception as e:
                     logger.warning(
-                        f"Could not send session_transcript_ready: "
-                        f"session_id={session_id}, error={e}"
+                        "Could not send session_transcript_ready: session_id=%s, error=%s",
+                        session_id,
+                        e,
                     )
 
                 # Step 2: Enrich transcript with calendar event contacts
                 enrichment_service = TranscriptEnrichmentService()
                 transcript_ts = datetime.now(timezone.utc)
                 conference_url_val = desktop_config.get("conference_url") if desktop_config else None
-                _ws_enrich_tenant_id = (
-                    context.tenant_id if context
-                    else os.getenv('MOCK_TENANT_ID', 'default_org')
-                )
                 _ws_enrich_recording_user_id = (
                     (context.pg_user_id or context.user_id) if context else None
                 )
-                _ws_enrich_internal_domains = await get_tenant_internal_domains(
-                    _ws_enrich_tenant_id
-                )
+                _ws_enrich_internal_domains = await internal_domains_task
                 # `participants=None` for the WebSocket /listen flow:
                 # streaming audio sessions don't accept caller-provided
                 # participants — calendar matching is the sole attendee
@@ -566,39 +775,40 @@ async def websocket_endpoint(websocket: WebSocket):
                     text_for_cleaning = enrichment.front_matter + "\n\n" + raw_transcript
 
                 # Step 3: Clean and structure the transcript
-                logger.info(f"Starting transcript cleaning: session_id={session_id}")
+                logger.info("Starting transcript cleaning: session_id=%s", session_id)
                 meeting_output = await cleaner_service.clean_transcript(
                     text_for_cleaning,
                     session_id
                 )
-                logger.info(f"Transcript cleaning complete: session_id={session_id}")
+                logger.info("Transcript cleaning complete: session_id=%s", session_id)
 
                 # Step 3: Send structured output to client
                 try:
-                    await websocket.send_json({
-                        "type": "session_complete",
-                        "summary": meeting_output.summary,
-                        "action_items": meeting_output.action_items,
-                        "cleaned_transcript": meeting_output.cleaned_transcript,
-                        "raw_transcript": raw_transcript
-                    })
+                    await _send_session_complete(
+                        websocket,
+                        meeting_output,
+                        raw_transcript,
+                        chunked=chunked_results_flag,
+                    )
                     logger.info(
-                        f"Session complete message sent: session_id={session_id}, "
-                        f"action_items={len(meeting_output.action_items)}"
+                        "Session complete message sent: session_id=%s, action_items=%s",
+                        session_id,
+                        len(meeting_output.action_items),
                     )
                 except Exception as e:
                     logger.warning(
-                        f"Could not send session_complete (socket may be closed): "
-                        f"session_id={session_id}, error={e}"
+                        "Could not send session_complete (socket may be closed): session_id=%s, "
+                        "error=%s",
+                        session_id,
+                        e,
                     )
 
                 # Step 5: Async Fork — Lane 1 (publish) + Lane 2 (intelligence)
-                ws_tenant_id = context.tenant_id if context else os.getenv('MOCK_TENANT_ID', 'default_org')
+                ws_tenant_id = context.tenant_id if context else MOCK_TENANT_ID
                 ws_user_id = context.user_id if context else "websocket_user"
                 ws_trace_id = context.trace_id if context else str(uuid.uuid4())
                 ws_account_id = (
-                    context.account_id if context
-                    else os.getenv('MOCK_ACCOUNT_ID', 'default_account')
+                    context.account_id if context else MOCK_ACCOUNT_ID
                 )
                 source = "desktop-companion" if desktop_config else "websocket"
                 extras: Dict[str, Any] = {}
@@ -627,20 +837,24 @@ async def websocket_endpoint(websocket: WebSocket):
                             timestamp=transcript_ts,
                             source=source,
                             extras=extras,
-                            interaction_id=uuid.UUID(session_id),
+                            interaction_id=session_uuid,
                             trace_id=ws_trace_id,
                             account_id=ws_account_id,  # was None — required since Task 1.3
                         )
-                        aws_publisher = AWSEventPublisher()
+                        aws_publisher = shared(AWSEventPublisher)
                         return await aws_publisher.publish_envelope(envelope)
                     except Exception as e:
-                        logger.error(f"Lane 1 (publishing) error: session_id={session_id}, error={e}")
+                        logger.error(
+                            "Lane 1 (publishing) error: session_id=%s, error=%s",
+                            session_id,
+                            e,
+                        )
                         raise
 
                 async def _lane2_intelligence() -> Optional[object]:
                     """Lane 2: Extract and persist intelligence."""
                     try:
-                        intelligence_service = IntelligenceService()
+                        intelligence_service = shared(IntelligenceService)
                         return await intelligence_service.process_transcript(
                             cleaned_transcript=meeting_output.cleaned_transcript,
                             interaction_id=session_id,
@@ -654,7 +868,11 @@ async def websocket_endpoint(websocket: WebSocket):
                             enrichment_match_method=enrichment.match_method,
                         )
                     except Exception as e:
-                        logger.error(f"Lane 2 (intelligence) error: session_id={session_id}, error={e}")
+                        logger.error(
+                            "Lane 2 (intelligence) error: session_id=%s, error=%s",
+                            session_id,
+                            e,
+                        )
                         raise
 
                 results = await asyncio.gather(
@@ -667,25 +885,33 @@ async def websocket_endpoint(websocket: WebSocket):
                     if isinstance(result, Exception):
                         lane_name = "Lane 1 (publishing)" if i == 0 else "Lane 2 (intelligence)"
                         logger.error(
-                            f"{lane_name} failed: session_id={session_id}, error={result}",
-                            exc_info=result
+                            "%s failed: session_id=%s, error=%s",
+                            lane_name,
+                            session_id,
+                            result,
+                            exc_info=result,
                         )
                     else:
                         lane_name = "Lane 1 (publishing)" if i == 0 else "Lane 2 (intelligence)"
-                        logger.info(f"{lane_name} completed: session_id={session_id}")
+                        logger.info("%s completed: session_id=%s", lane_name, session_id)
 
             else:
-                logger.warning(f"Session {session_id} had no transcript to retrieve")
+                logger.warning("Session %s had no transcript to retrieve", session_id)
 
         except Exception as e:
             logger.error(
-                f"Failed to process final transcript: session_id={session_id}, error={e}",
-                exc_info=True
+                "Failed to process final transcript: session_id=%s, error=%s",
+                session_id,
+                e,
+                exc_info=True,
             )
+        finally:
+            if not internal_domains_task.done():
+                internal_domains_task.cancel()
 
         # Close WebSocket
         try:
             await websocket.close()
-            logger.info(f"WebSocket closed: session_id={session_id}")
+            logger.info("WebSocket closed: session_id=%s", session_id)
         except Exception as e:
-            logger.debug(f"WebSocket already closed: session_id={session_id}")
+            logger.debug("WebSocket already closed: session_id=%s", session_id)
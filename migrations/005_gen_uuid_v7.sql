@@ -0,0 +1,29 @@
+-- Migration 005: Time-ordered UUIDv7 defaults for upload_jobs.id
+-- Random v4 keys scatter inserts across the primary-key index; v7 keys put a
+-- millisecond timestamp in the high bits so new rows append at the tail.
+-- The application generates v7 ids itself (utils/uuid_utils.uuid7); this
+-- function only covers rows inserted without an explicit id.
+-- Column type stays UUID, so existing v4 rows are untouched.
+
+CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+CREATE OR REPLACE FUNCTION gen_uuid_v7() RETURNS uuid AS $$
+DECLARE
+    ts_ms BIGINT := FLOOR(EXTRACT(EPOCH FROM clock_timestamp()) * 1000);
+    bytes BYTEA := gen_random_bytes(16);
+BEGIN
+    -- 48-bit big-endian Unix millisecond timestamp
+    bytes := SET_BYTE(bytes, 0, ((ts_ms >> 40) & 255)::INT);
+    bytes := SET_BYTE(bytes, 1, ((ts_ms >> 32) & 255)::INT);
+    bytes := SET_BYTE(bytes, 2, ((ts_ms >> 24) & 255)::INT);
+    bytes := SET_BYTE(bytes, 3, ((ts_ms >> 16) & 255)::INT);
+    bytes := SET_BYTE(bytes, 4, ((ts_ms >> 8) & 255)::INT);
+    bytes := SET_BYTE(bytes, 5, (ts_ms & 255)::INT);
+    -- Version 7 in the high nibble of byte 6, RFC variant (0b10) in byte 8
+    bytes := SET_BYTE(bytes, 6, (GET_BYTE(bytes, 6) & 15) | 112);
+    bytes := SET_BYTE(bytes, 8, (GET_BYTE(bytes, 8) & 63) | 128);
+    RETURN ENCODE(bytes, 'hex')::uuid;
+END
+$$ LANGUAGE plpgsql VOLATILE;
+
+ALTER TABLE upload_jobs ALTER COLUMN id SET DEFAULT gen_uuid_v7();
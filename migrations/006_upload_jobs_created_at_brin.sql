@@ -0,0 +1,9 @@
+-- Migration 006: BRIN index on upload_jobs.created_at
+-- Rows are only ever appended in created_at order (ids are UUIDv7 since 005),
+-- so the physical heap order tracks created_at and a BRIN index answers
+-- time-window scans ("jobs created in the last hour") for a few pages of
+-- index instead of a full B-tree. Combined with the tenant_id B-tree via
+-- BitmapAnd for per-tenant windows.
+
+CREATE INDEX IF NOT EXISTS brin_upload_jobs_created_at
+    ON upload_jobs USING BRIN (created_at) WITH (pages_per_range = 32);
@@ -0,0 +1,19 @@
+-- Migration 007: Maintain upload_jobs.updated_at in the database
+-- Every UPDATE stamps updated_at = now(), so an update path that forgets to
+-- set it (or a manual fix-up in psql) can no longer leave a stale value.
+-- The application still sets updated_at alongside started_at/completed_at;
+-- the trigger overrides it with the transaction's now().
+-- Plain plpgsql rather than the moddatetime extension, which is not
+-- guaranteed to be installable on every Postgres host.
+
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := NOW();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS upload_jobs_set_updated_at ON upload_jobs;
+CREATE TRIGGER upload_jobs_set_updated_at
+    BEFORE UPDATE ON upload_jobs
+    FOR EACH ROW EXECUTE FUNCTION set_updated_at();
@@ -0,0 +1,14 @@
+-- Migration 008: Partial index for the startup reaper
+-- reap_stuck_jobs runs
+--   UPDATE upload_jobs ... WHERE status = 'processing' AND started_at < $cutoff
+-- on every boot. Only in-flight jobs match the predicate, so a partial
+-- index on started_at stays a handful of entries however large the table
+-- grows, instead of walking ix_upload_jobs_status and filtering.
+-- (The /upload/complete lookup on file_key + tenant_id is already served
+-- by the unique ix_upload_jobs_tenant_file_key from migration 001.)
+-- CONCURRENTLY avoids blocking writes; it cannot run inside a transaction
+-- block, so apply this file on its own.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_upload_jobs_processing_started_at
+    ON upload_jobs (started_at)
+    WHERE status = 'processing';
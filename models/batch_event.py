@@ -6,7 +6,7 @@ The schema is versioned to support future evolution while maintaining backward c
 """
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EventData(BaseModel):
@@ -16,6 +16,8 @@ class EventData(BaseModel):
     This model encapsulates both the raw and cleaned transcript data
     from the batch processing pipeline.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     cleaned_transcript: str = Field(
         ...,
         description="Cleaned and structured transcript from CleanerService"
@@ -34,7 +36,10 @@ class BatchProcessingCompletedEvent(BaseModel):
     basic transcript data with tenant, user, and account context.
     
     All events published to EventBridge must conform to this schema.
+    Instances are immutable once validated.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     version: str = Field(
         default="1.0",
         description="Event schema version following semantic versioning"
@@ -1,5 +1,5 @@
 """CleanedChunk model for batch transcript cleaning."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CleanedChunk(BaseModel):
@@ -8,6 +8,8 @@ class CleanedChunk(BaseModel):
     This model is used with OpenAI's Structured Outputs feature
     to ensure reliable parsing of LLM responses.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     cleaned_text: str = Field(
         description="The cleaned transcript chunk with filler words removed, "
                     "grammar fixed, punctuation added, and speaker labels preserved"
@@ -4,16 +4,28 @@ These models use the Mirror Pattern - they exactly match existing Postgres table
 without running migrations. They are used for persisting intelligence data.
 """
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Text, Enum as SAEnum
+from sqlalchemy import Column, Text, Enum as SAEnum, Index, UniqueConstraint
+from sqlalchemy.orm import raiseload
 from typing import Optional
 from datetime import datetime
-from uuid import UUID, uuid4
+from uuid import UUID
 import enum
 
+from utils.uuid_utils import uuid7
+
+
+# Loader options for every select() against these models. The mirrors
+# declare no relationships today; if one is added, any implicit lazy load
+# raises instead of silently issuing a SELECT per row, so the query has to
+# ask for it explicitly (e.g. selectinload) alongside these options.
+default_loader_options = (raiseload("*"),)
+
 
 # --- Enums matching Prisma schema ---
+# StrEnum members are str instances whose str() is the value itself, so they
+# bind to the native Postgres enum columns as plain strings.
 
-class SummaryLevelEnum(str, enum.Enum):
+class SummaryLevelEnum(enum.StrEnum):
     """Summary granularity levels."""
     title = "title"
     headline = "headline"
@@ -23,13 +35,13 @@ class SummaryLevelEnum(str, enum.Enum):
     unknown = "unknown"
 
 
-class ProfileTypeEnum(str, enum.Enum):
+class ProfileTypeEnum(enum.StrEnum):
     """Profile type for summaries."""
     rich = "rich"
     lite = "lite"
 
 
-class InsightTypeEnum(str, enum.Enum):
+class InsightTypeEnum(enum.StrEnum):
     """Types of insights that can be extracted."""
     action_item = "action_item"
     key_takeaway = "key_takeaway"
@@ -40,7 +52,7 @@ class InsightTypeEnum(str, enum.Enum):
     unknown = "unknown"
 
 
-class RiskSeverityDBEnum(str, enum.Enum):
+class RiskSeverityDBEnum(enum.StrEnum):
     """Severity levels for risks in database."""
     low = "low"
     medium = "medium"
@@ -54,7 +66,7 @@ class PersonaModel(SQLModel, table=True):
     """Mirror of personas table for persona lookup."""
     __tablename__ = "personas"
     
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     code: str = Field(unique=True)
     label: str
     description: Optional[str] = Field(default=None, sa_column=Column(Text))
@@ -76,7 +88,7 @@ class InteractionSummaryEntryModel(SQLModel, table=True):
     """
     __tablename__ = "interaction_summary_entries"
     
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     tenant_id: UUID = Field(sa_column_kwargs={"name": "tenant_id"})
     interaction_id: UUID = Field(sa_column_kwargs={"name": "interaction_id"})
     persona_id: UUID = Field(sa_column_kwargs={"name": "persona_id"})
@@ -101,6 +113,16 @@ class InteractionSummaryEntryModel(SQLModel, table=True):
         sa_column_kwargs={"name": "updated_at"}
     )
 
+    # Mirrors the Prisma-managed indexes (schema.prisma is the source of
+    # truth; names follow Prisma's default naming). Tenant-scoped lookups
+    # lead with tenant_id.
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "interaction_id", "persona_id", "level"),
+        Index("interaction_summary_entries_tenant_id_interaction_id_idx", "tenant_id", "interaction_id"),
+        Index("interaction_summary_entries_tenant_id_persona_id_idx", "tenant_id", "persona_id"),
+        Index("interaction_summary_entries_tenant_id_interaction_timestamp_idx", "tenant_id", "interaction_timestamp"),
+    )
+
 
 class InteractionInsightModel(SQLModel, table=True):
     """Mirror of interaction_insights table.
@@ -110,7 +132,7 @@ class InteractionInsightModel(SQLModel, table=True):
     """
     __tablename__ = "interaction_insights"
     
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
     tenant_id: UUID = Field(sa_column_kwargs={"name": "tenant_id"})
     interaction_id: UUID = Field(sa_column_kwargs={"name": "interaction_id"})
     persona_id: UUID = Field(sa_column_kwargs={"name": "persona_id"})
@@ -146,3 +168,13 @@ class InteractionInsightModel(SQLModel, table=True):
         default_factory=datetime.utcnow,
         sa_column_kwargs={"name": "updated_at"}
     )
+
+    # Mirrors the Prisma-managed indexes. The idempotency key is the full
+    # (tenant, interaction, persona, type, content_hash) tuple — the same
+    # insight text may legitimately appear for another persona or type.
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "interaction_id", "persona_id", "type", "content_hash"),
+        Index("interaction_insights_tenant_id_interaction_id_idx", "tenant_id", "interaction_id"),
+        Index("interaction_insights_tenant_id_persona_id_type_idx", "tenant_id", "persona_id", "type"),
+        Index("interaction_insights_tenant_id_interaction_timestamp_idx", "tenant_id", "interaction_timestamp"),
+    )
@@ -6,9 +6,28 @@ The schema provides a consistent structure for events published to Kinesis and E
 """
 
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Dict, Optional
 from uuid import UUID
-from pydantic import BaseModel, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+
+
+def _utc_iso(value: datetime) -> str:
+    """Serialize datetime to ISO 8601 format with Z suffix for UTC."""
+    iso_str = value.isoformat()
+    # Replace +00:00 with Z for cleaner UTC representation
+    if iso_str.endswith('+00:00'):
+        return iso_str[:-6] + 'Z'
+    elif not iso_str.endswith('Z'):
+        return iso_str + 'Z'
+    return iso_str
+
+
+# Serialization is attached to the field types rather than to per-model
+# @field_serializer methods, so pydantic-core calls the converter directly
+# (``str`` for UUIDs is the C builtin) without a bound-method dispatch, and
+# ``None`` short-circuits in the nullable schema before any Python runs.
+UtcIsoDatetime = Annotated[datetime, PlainSerializer(_utc_iso, return_type=str)]
+UuidStr = Annotated[UUID, PlainSerializer(str, return_type=str)]
 
 
 class ContentModel(BaseModel):
@@ -18,6 +37,8 @@ class ContentModel(BaseModel):
     This model encapsulates the primary content payload for any interaction,
     supporting multiple format types for different content sources.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     text: str = Field(
         ...,
         description="The actual content text"
@@ -39,7 +60,12 @@ class EnvelopeV1(BaseModel):
     - Strict Core: Required fields that must always be present
     - Flexible Edges: Optional fields for extensibility
     - Processing Metadata: Optional fields for tracing and identification
+
+    Envelopes are immutable once built: they are constructed once per
+    interaction and then only serialized.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     # Schema Version
     schema_version: str = Field(
         default="v1",
@@ -47,7 +73,7 @@ class EnvelopeV1(BaseModel):
     )
     
     # Strict Core - Identity
-    tenant_id: UUID = Field(
+    tenant_id: UuidStr = Field(
         ...,
         description="Tenant/organization UUID"
     )
@@ -65,7 +91,7 @@ class EnvelopeV1(BaseModel):
         ...,
         description="The actual content payload"
     )
-    timestamp: datetime = Field(
+    timestamp: UtcIsoDatetime = Field(
         ...,
         description="Event creation timestamp (UTC)"
     )
@@ -81,7 +107,7 @@ class EnvelopeV1(BaseModel):
     )
     
     # Processing Metadata
-    interaction_id: Optional[UUID] = Field(
+    interaction_id: Optional[UuidStr] = Field(
         None,
         description="Unique identifier for this interaction"
     )
@@ -97,22 +123,6 @@ class EnvelopeV1(BaseModel):
         None,
         description="Postgres User UUID from identity bridge"
     )
-    
-    @field_serializer('timestamp')
-    def serialize_timestamp(self, value: datetime) -> str:
-        """Serialize datetime to ISO 8601 format with Z suffix for UTC."""
-        iso_str = value.isoformat()
-        # Replace +00:00 with Z for cleaner UTC representation
-        if iso_str.endswith('+00:00'):
-            return iso_str[:-6] + 'Z'
-        elif not iso_str.endswith('Z'):
-            return iso_str + 'Z'
-        return iso_str
-    
-    @field_serializer('tenant_id', 'interaction_id')
-    def serialize_uuid(self, value: Optional[UUID]) -> Optional[str]:
-        """Serialize UUID to string."""
-        return str(value) if value else None
 
 
 class KinesisPayloadWrapper(BaseModel):
@@ -123,6 +133,8 @@ class KinesisPayloadWrapper(BaseModel):
     to provide easy access to routing fields without parsing the full envelope.
     This enables Step Functions and other consumers to route events efficiently.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     envelope: Dict[str, Any] = Field(
         ...,
         description="Complete EnvelopeV1 as JSON object"
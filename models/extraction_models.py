@@ -6,10 +6,10 @@ They are used with the instructor library to ensure structured LLM outputs.
 from pydantic import BaseModel, Field
 from typing import List, Optional
 from datetime import date
-from enum import Enum
+from enum import StrEnum
 
 
-class RiskSeverityEnum(str, Enum):
+class RiskSeverityEnum(StrEnum):
     """Severity levels for identified risks."""
     low = "low"
     medium = "medium"
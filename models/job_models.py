@@ -13,12 +13,14 @@ Design Decision: Postgres over Redis
     - Redis remains for transient session data (WebSocket transcripts)
 """
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Column, Text, Index, DateTime
+from sqlalchemy import Column, Text, Index, DateTime, text
 from typing import Optional
 from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from uuid import UUID
 import enum
 
+from utils.uuid_utils import uuid7
+
 
 class JobStatus(str, enum.Enum):
     """Job processing status.
@@ -53,11 +55,18 @@ class UploadJob(SQLModel, table=True):
         - Primary: id
         - Composite: (tenant_id, status) for queue polling
         - Unique: (tenant_id, file_key) prevents duplicate processing
+        - BRIN: created_at for time-window scans (migration 006)
+        - Partial: started_at WHERE status = 'processing' for the
+          startup reaper (migration 008)
     """
     __tablename__ = "upload_jobs"
 
-    # Primary key
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    # Primary key (time-ordered UUIDv7; DB default from migration 005)
+    id: UUID = Field(
+        default_factory=uuid7,
+        primary_key=True,
+        sa_column_kwargs={"server_default": text("gen_uuid_v7()")},
+    )
 
     # Tenant isolation (required for all queries)
     tenant_id: UUID = Field(index=True, sa_column_kwargs={"name": "tenant_id"})
@@ -72,6 +81,7 @@ class UploadJob(SQLModel, table=True):
     # File reference (S3 key)
     file_key: str = Field(sa_column=Column(Text, name="file_key"))
     file_name: Optional[str] = Field(default=None, sa_column=Column(Text, name="file_name"))
+    # Stored canonical: the upload router normalizes aliases before writing.
     mime_type: Optional[str] = Field(default=None, sa_column=Column(Text, name="mime_type"))
     file_size: Optional[int] = Field(default=None, sa_column_kwargs={"name": "file_size"})
 
@@ -107,7 +117,9 @@ class UploadJob(SQLModel, table=True):
     # schema-first by construction. (Codex Round 5 P2 — acknowledged + mitigated.)
     participants_json: Optional[str] = Field(default=None, sa_column=Column(Text, name="participants_json"))
 
-    # Timestamps (explicit timezone-aware columns for asyncpg compatibility)
+    # Timestamps (explicit timezone-aware columns for asyncpg compatibility).
+    # updated_at is also stamped by the BEFORE UPDATE trigger from
+    # migration 007, so it stays current even on paths that don't set it.
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         sa_column=Column(DateTime(timezone=True), name="created_at", nullable=False)
@@ -129,6 +141,17 @@ class UploadJob(SQLModel, table=True):
     __table_args__ = (
         Index("ix_upload_jobs_tenant_status", "tenant_id", "status"),
         Index("ix_upload_jobs_tenant_file_key", "tenant_id", "file_key", unique=True),
+        Index(
+            "brin_upload_jobs_created_at",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_upload_jobs_processing_started_at",
+            "started_at",
+            postgresql_where=text("status = 'processing'"),
+        ),
     )
 
 
@@ -1,5 +1,5 @@
 """MeetingOutput model for structured transcript cleaning results."""
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import List
 
 
@@ -9,6 +9,8 @@ class MeetingOutput(BaseModel):
     This model is used with OpenAI's Structured Outputs feature
     to ensure reliable parsing of LLM responses.
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     summary: str = Field(
         description="A concise summary of the meeting or conversation (2-3 sentences)"
     )
@@ -5,11 +5,12 @@ This module defines the RequestContext dataclass for extracting and storing
 tenant, user, and account identity information from request headers.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RequestContext:
     """
     Context information extracted from request headers and environment.
@@ -30,6 +31,11 @@ class RequestContext:
             the verified-JWT path — legacy headers, the lenient/websocket
             fallback, or a bare construction — is untrusted by default. Trust
             is never inferred from a header.
+
+    Immutable: built once per request by the auth helpers and only read after.
+    ``tenant_uuid`` / ``interaction_uuid`` parse the corresponding string
+    fields on first access and cache the result, so envelope construction
+    does not re-parse them.
     """
     tenant_id: str
     user_id: str
@@ -39,3 +45,23 @@ class RequestContext:
     pg_user_id: Optional[str] = None
     user_name: Optional[str] = None
     trusted_event_time: bool = False
+    _tenant_uuid: Optional[UUID] = field(default=None, init=False, repr=False, compare=False)
+    _interaction_uuid: Optional[UUID] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def tenant_uuid(self) -> UUID:
+        """``tenant_id`` as a UUID (raises ValueError if it is not one)."""
+        value = self._tenant_uuid
+        if value is None:
+            value = UUID(self.tenant_id)
+            object.__setattr__(self, "_tenant_uuid", value)
+        return value
+
+    @property
+    def interaction_uuid(self) -> UUID:
+        """``interaction_id`` as a UUID (raises ValueError if it is not one)."""
+        value = self._interaction_uuid
+        if value is None:
+            value = UUID(self.interaction_id)
+            object.__setattr__(self, "_interaction_uuid", value)
+        return value
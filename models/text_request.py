@@ -5,12 +5,18 @@ This module defines the Pydantic models for the text cleaning endpoint.
 These models handle validation and serialization for the POST /text/clean API.
 """
 
+import re
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from models.participant_spec import ParticipantSpec
 
+# Finds the first non-whitespace character (same set as str.isspace). Used
+# for the emptiness check so a large body is neither copied by strip() nor
+# scanned past its leading whitespace.
+NON_WHITESPACE = re.compile(r"\S")
+
 
 class TextCleanRequest(BaseModel):
     """
@@ -21,12 +27,11 @@ class TextCleanRequest(BaseModel):
         metadata: Optional metadata to include in the event extras
         source: Content source identifier (default: "api")
     """
-    # validate_assignment re-runs field validators on attribute assignment, not
-    # just at construction. This closes a bypass where ``req.occurred_at = <naive
-    # or numeric>`` after construction would otherwise skip the validators below
-    # and smuggle an un-normalized value downstream. (No code path mutates this
-    # model today, so enabling it is purely defensive.)
-    model_config = ConfigDict(validate_assignment=True)
+    # frozen rejects attribute assignment after construction outright. This
+    # closes a bypass where ``req.occurred_at = <naive or numeric>`` would
+    # otherwise skip the validators below and smuggle an un-normalized value
+    # downstream. (No code path mutates this model.)
+    model_config = ConfigDict(frozen=True, extra="ignore")
 
     text: str = Field(
         ...,
@@ -70,7 +75,7 @@ class TextCleanRequest(BaseModel):
     @classmethod
     def text_must_not_be_empty(cls, v: str) -> str:
         """Validate that text is not empty or whitespace-only."""
-        if not v or not v.strip():
+        if not NON_WHITESPACE.search(v):
             raise ValueError("text field cannot be empty or contain only whitespace")
         return v
 
@@ -139,6 +144,8 @@ class TextCleanResponse(BaseModel):
         cleaned_text: Cleaned/processed text
         interaction_id: Unique identifier for this interaction
     """
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     raw_text: str = Field(
         ...,
         description="Original text that was submitted"
@@ -5,27 +5,32 @@ This router provides the POST /batch/process endpoint for processing audio
 files through transcription and cleaning, publishing EnvelopeV1 events.
 """
 import asyncio
+import itertools
 import logging
-import uuid
+import os
+import secrets
 from datetime import datetime, timezone
-from typing import Optional
-from uuid import UUID
-from fastapi import APIRouter, UploadFile, HTTPException, Request
+from types import MappingProxyType
+from typing import Annotated, Callable, Coroutine, Final, NamedTuple, Optional
+from fastapi import APIRouter, Depends, UploadFile, HTTPException, Request, Response
+from fastapi.routing import APIRoute
 from pydantic import BaseModel, Field
 
 from models.envelope import EnvelopeV1, ContentModel
-from services.batch_service import BatchService
+from models.enrichment_models import EnrichmentResult
+from models.request_context import RequestContext
+from services.batch_service import BatchService, DeepgramUnavailableError
 from services.batch_cleaner_service import BatchCleanerService
 from services.aws_event_publisher import AWSEventPublisher
 from services.intelligence_service import IntelligenceService
+from services.shared_instances import shared
+from services import text_clean_service
 from services.transcript_enrichment import TranscriptEnrichmentService
 from services.internal_domains import get_tenant_internal_domains
-from utils.context_utils import get_auth_context_ingestion
+from utils.context_utils import ingestion_context
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/batch", tags=["batch"])
-
 
 class BatchProcessResponse(BaseModel):
     """Response from the batch processing endpoint."""
@@ -34,276 +39,456 @@ class BatchProcessResponse(BaseModel):
     interaction_id: str = Field(..., description="Unique identifier for this interaction")
 
 # File validation constants
-ALLOWED_EXTENSIONS = {"wav", "mp3", "flac", "m4a", "webm", "mp4"}
-MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB in bytes
+MAX_FILE_SIZE: Final = 100 * 1024 * 1024  # 100MB in bytes
 
+# Extension -> MIME type sent to Deepgram. Doubles as the allow-list: an
+# extension with no entry is rejected (read-only; built once at import).
+MIME_TYPE_MAP: Final = MappingProxyType({
+    "wav": "audio/wav",
+    "mp3": "audio/mpeg",
+    "flac": "audio/flac",
+    "m4a": "audio/mp4",
+    "webm": "audio/webm",
+    "mp4": "audio/mp4",
+})
 
-@router.post("/process", response_model=BatchProcessResponse)
-async def process_batch_audio(file: UploadFile, request: Request):
+# Per-request log correlation id: a random per-process prefix plus a
+# counter. Unique across workers and restarts without a urandom read or
+# UUID formatting per request; it is never persisted or used as a key.
+_PROCESSING_ID_PREFIX: Final = f"b-{secrets.token_hex(4)}"
+_processing_seq = itertools.count(1)
+
+# Allowance for multipart boundaries and part headers on top of the file
+# itself when bounding the whole request body.
+MULTIPART_OVERHEAD_ALLOWANCE: Final = 1024 * 1024  # 1MB
+
+
+def _request_body_limit() -> int:
+    return MAX_FILE_SIZE + MULTIPART_OVERHEAD_ALLOWANCE
+
+
+def _body_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024 * 1024):.0f}MB"
+    )
+
+
+class UploadSizeLimitedRoute(APIRoute):
+    """Route that bounds the request body before FastAPI parses the form.
+
+    FastAPI reads and spools the whole multipart body before the handler
+    runs, so a size check in the handler only fires after an oversized
+    upload has been received. This rejects a declared ``Content-Length``
+    over the limit up front, and counts body bytes as they are received so
+    a chunked or under-declared upload is cut off once it crosses the limit.
     """
-    Process an uploaded audio file through transcription and cleaning pipeline.
-    
-    Args:
-        file: Audio file upload (WAV, MP3, FLAC, or M4A format, max 100MB)
-        request: FastAPI Request object for context extraction
-        
-    Returns:
-        BatchProcessResponse with raw_transcript, cleaned_transcript, and interaction_id
-        
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[None, None, Response]]:
+        route_handler = super().get_route_handler()
+
+        async def size_limited_route_handler(request: Request) -> Response:
+            limit = _request_body_limit()
+            declared = request.headers.get("content-length")
+            if declared is not None and declared.isdigit() and int(declared) > limit:
+                logger.warning(
+                    "Upload rejected before reading: path=%s, "
+                    "content_length=%s, max=%s",
+                    request.url.path,
+                    declared,
+                    limit,
+                )
+                raise _body_too_large()
+
+            receive = request.receive
+            bytes_seen = 0
+
+            async def limited_receive():
+                nonlocal bytes_seen
+                message = await receive()
+                if message["type"] == "http.request":
+                    bytes_seen += len(message.get("body", b""))
+                    if bytes_seen > limit:
+                        logger.warning(
+                            "Upload rejected while reading: path=%s, "
+                            "bytes_seen=%s, max=%s",
+                            request.url.path,
+                            bytes_seen,
+                            limit,
+                        )
+                        raise _body_too_large()
+                return message
+
+            return await route_handler(Request(request.scope, limited_receive))
+
+        return size_limited_route_handler
+
+
+router = APIRouter(prefix="/batch", tags=["batch"], route_class=UploadSizeLimitedRoute)
+
+
+class AudioUpload(NamedTuple):
+    """An upload that passed :func:`validate_audio_upload`, rewound to byte 0."""
+    file: UploadFile
+    mime_type: str
+
+
+async def validate_audio_upload(
+    file: UploadFile,
+    context: Annotated[RequestContext, Depends(ingestion_context)],
+) -> AudioUpload:
+    """Check the upload's extension and size; return it with its Deepgram MIME type.
+
+    Depends on :func:`utils.context_utils.ingestion_context` so an
+    unauthenticated request gets its 401 before any upload validation. The request body was already
+    bounded by :class:`UploadSizeLimitedRoute`; the size check here covers
+    the file part itself.
+
     Raises:
-        HTTPException: 400 for validation errors, 500 for processing errors
-        
-    Requirements: 1.1, 1.2, 2.1, 2.2, 2.3, 2.4, 2.5
+        HTTPException: 400 for a missing or unlisted extension or an
+            unreadable file, 413 for a file over ``MAX_FILE_SIZE``
     """
-    # Extract and validate request context (raises HTTPException 401/400 on failure)
-    # Supports JWT from gateway (preferred) or legacy headers (when ALLOW_LEGACY_HEADER_AUTH=true)
-    # Requirements: 1.1, 1.2
-    context = get_auth_context_ingestion(request)
-    
-    processing_id = str(uuid.uuid4())
-    logger.info(
-        f"Batch processing started: processing_id={processing_id}, "
-        f"interaction_id={context.interaction_id}, filename={file.filename}"
-    )
-    
-    # Validate file extension
     if not file.filename:
         logger.warning(
-            f"No filename provided: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}"
+            "No filename provided: interaction_id=%s",
+            context.interaction_id,
         )
         raise HTTPException(status_code=400, detail="No filename provided")
-    
-    file_extension = file.filename.split(".")[-1].lower()
-    if file_extension not in ALLOWED_EXTENSIONS:
+
+    file_extension = file.filename.rpartition(".")[2].lower()
+    mime_type = MIME_TYPE_MAP.get(file_extension)
+    if mime_type is None:
         logger.warning(
-            f"Invalid file format: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, "
-            f"extension={file_extension}, allowed={ALLOWED_EXTENSIONS}"
+            "Invalid file format: interaction_id=%s, extension=%s, allowed=%s",
+            context.interaction_id,
+            file_extension,
+            list(MIME_TYPE_MAP),
         )
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid file format. Allowed formats: {', '.join(ALLOWED_EXTENSIONS)}"
+            detail=f"Invalid file format. Allowed formats: {', '.join(MIME_TYPE_MAP)}"
         )
-    
-    # Read file bytes
+
+    # Size the upload without reading it into memory. Starlette has already
+    # spooled the multipart body to a SpooledTemporaryFile (on disk past
+    # 1MB), so the file object is streamed to Deepgram as-is.
     try:
-        audio_bytes = await file.read()
+        file_size = file.size
+        if file_size is None:
+            file_size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)
     except Exception as e:
         logger.error(
-            f"Failed to read file: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, error={e}"
+            "Failed to read file: interaction_id=%s, error=%s",
+            context.interaction_id,
+            e,
         )
         raise HTTPException(status_code=400, detail="Failed to read uploaded file")
-    
-    # Validate file size
-    file_size = len(audio_bytes)
+
     if file_size > MAX_FILE_SIZE:
         logger.warning(
-            f"File too large: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, "
-            f"size={file_size}, max={MAX_FILE_SIZE}"
+            "File too large: interaction_id=%s, size=%s, max=%s",
+            context.interaction_id,
+            file_size,
+            MAX_FILE_SIZE,
         )
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size: {MAX_FILE_SIZE / (1024 * 1024):.0f}MB"
-        )
-    
+        raise _body_too_large()
+
     logger.info(
-        f"File validated: processing_id={processing_id}, "
-        f"interaction_id={context.interaction_id}, "
-        f"size={file_size} bytes, extension={file_extension}"
+        "File validated: interaction_id=%s, filename=%s, size=%s bytes, extension=%s",
+        context.interaction_id,
+        file.filename,
+        file_size,
+        file_extension,
     )
-    
-    # Determine MIME type
-    mime_type_map = {
-        "wav": "audio/wav",
-        "mp3": "audio/mpeg",
-        "flac": "audio/flac",
-        "m4a": "audio/mp4",
-        "webm": "audio/webm",
-        "mp4": "audio/mp4"
-    }
-    mime_type = mime_type_map.get(file_extension, "audio/wav")
-    
-    # Step 1: Transcribe audio
+    return AudioUpload(file, mime_type)
+
+
+async def _lane2_intelligence(
+    cleaned_transcript: str,
+    context: RequestContext,
+    enrichment: EnrichmentResult,
+    processing_id: str,
+) -> Optional[object]:
+    """Lane 2: Extract and persist intelligence (background task)."""
     try:
-        batch_service = BatchService()
-        logger.info(
-            f"Starting transcription: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}"
-        )
-        raw_transcript = await batch_service.transcribe_audio(audio_bytes, mime_type)
-        logger.info(
-            f"Transcription complete: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, "
-            f"length={len(raw_transcript)} chars"
+        intelligence_service = shared(IntelligenceService)
+        return await intelligence_service.process_transcript(
+            cleaned_transcript=cleaned_transcript,
+            interaction_id=context.interaction_id,
+            tenant_id=context.tenant_id,
+            account_id=context.account_id,
+            trace_id=context.trace_id,
+            interaction_type="batch_upload",
+            contact_ids=enrichment.contact_ids or None,
+            calendar_event_id=enrichment.calendar_event_id,
+            enrichment_confidence=enrichment.match_confidence,
+            enrichment_match_method=enrichment.match_method,
         )
     except Exception as e:
         logger.error(
-            f"Transcription failed: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, error={e}",
-            exc_info=True
-        )
-        raise HTTPException(
-            status_code=500,
-            detail="Transcription service failed. Please try again."
+            "Lane 2 (intelligence) error: processing_id=%s, "
+            "interaction_id=%s, error=%s",
+            processing_id,
+            context.interaction_id,
+            e,
+            exc_info=True,
         )
-    
-    # Step 2: Enrich transcript with calendar event contacts.
-    # `participants=None` explicitly: /batch/process accepts an audio file
-    # and lets calendar matching be the sole attendee source. (Task 1.26.6)
-    enrichment_service = TranscriptEnrichmentService()
-    transcript_ts = datetime.now(timezone.utc)
-    enrichment = await enrichment_service.enrich(
-        tenant_id=context.tenant_id,
-        transcript_timestamp=transcript_ts,
-        raw_transcript=raw_transcript,
-        user_name=context.user_name,
-        account_id=context.account_id,
-        recording_user_id=context.pg_user_id or context.user_id,
-        tenant_internal_domains=await get_tenant_internal_domains(context.tenant_id),
-        participants=None,
-        # Codex Round 4 P2: thread the request's interaction_id so queue-signal
-        # rows anchor to it when there's no calendar match. /batch/process
-        # passes participants=None, so today this only matters defensively
-        # (no participants → no queue-signal path), but the caller-side
-        # invariant is "always thread interaction_id" — keep it symmetrical.
-        interaction_id=context.interaction_id,
-    )
+        raise
 
-    # Prepend front-matter before cleaning
-    text_for_cleaning = raw_transcript
-    if enrichment.front_matter:
-        text_for_cleaning = enrichment.front_matter + "\n\n" + raw_transcript
 
-    # Step 3: Clean transcript
-    try:
-        cleaner_service = BatchCleanerService()
-        logger.info(
-            f"Starting cleaning: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}"
-        )
-        cleaned_transcript = await cleaner_service.clean_transcript(text_for_cleaning)
-        logger.info(
-            f"Cleaning complete: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, "
-            f"length={len(cleaned_transcript)} chars"
-        )
-    except Exception as e:
-        logger.error(
-            f"Cleaning failed: processing_id={processing_id}, "
-            f"interaction_id={context.interaction_id}, error={e}",
-            exc_info=True
+@router.post("/process", response_model=BatchProcessResponse)
+async def process_batch_audio(
+    upload: Annotated[AudioUpload, Depends(validate_audio_upload)],
+    context: Annotated[RequestContext, Depends(ingestion_context)],
+):
+    """
+    Process an uploaded audio file through transcription and cleaning pipeline.
+    
+    Args:
+        upload: Validated audio upload (WAV, MP3, FLAC, M4A, WebM or MP4,
+            max 100MB) and its MIME type
+        context: Request context (shared with the upload validator)
+        
+    Returns:
+        BatchProcessResponse with raw_transcript, cleaned_transcript, and interaction_id
+        
+    Raises:
+        HTTPException: 400 for validation errors, 413 for oversized uploads,
+            503 when the Lane 2 queue is full, 500 for processing errors
+        
+    Requirements: 1.1, 1.2, 2.1, 2.2, 2.3, 2.4, 2.5
+    """
+    file, mime_type = upload
+    processing_id = f"{_PROCESSING_ID_PREFIX}-{next(_processing_seq):x}"
+    logger.info(
+        "Batch processing started: processing_id=%s, interaction_id=%s, filename=%s",
+        processing_id,
+        context.interaction_id,
+        file.filename,
+    )
+    
+    # Backpressure: Lane 2 (intelligence) runs in the background after the
+    # response is sent, so reserve its slot from the cap shared with
+    # /text/clean and Granola BEFORE any Deepgram / LLM spend. A 503 here
+    # has no side effects.
+    if not text_clean_service.try_reserve_lane2_slot():
+        in_flight = text_clean_service.get_lane2_in_flight()
+        cap = text_clean_service.get_lane2_cap()
+        logger.warning(
+            "Lane 2 backpressure: %s tasks in flight "
+            "(cap %s); rejecting processing_id=%s, interaction_id=%s with 503",
+            in_flight,
+            cap,
+            processing_id,
+            context.interaction_id,
         )
         raise HTTPException(
-            status_code=500,
-            detail="Transcript cleaning service failed. Please try again."
+            status_code=503,
+            detail=(
+                "Server intelligence-extraction queue is full; retry after "
+                "Retry-After seconds."
+            ),
+            headers={"Retry-After": "60"},
         )
-
-    # Step 4: Async Fork - Execute Lane 1 (publishing) and Lane 2 (intelligence) concurrently
-    # Build extras dict with optional user_name for downstream speaker attribution
-    extras = {}
-    if context.user_name:
-        extras["user_name"] = context.user_name
-
-    # Add enrichment metadata to extras
-    extras.update(enrichment.to_extras_dict())
-
-    # Include front-matter in content.text for downstream LLMs
-    content_text = cleaned_transcript
-    if enrichment.front_matter:
-        content_text = enrichment.front_matter + "\n\n" + cleaned_transcript
-
-    envelope = EnvelopeV1(
-        tenant_id=UUID(context.tenant_id),
-        user_id=context.user_id,
-        interaction_type="transcript",
-        content=ContentModel(text=content_text, format="diarized"),
-        timestamp=transcript_ts,
-        source="upload",
-        extras=extras,
-        interaction_id=UUID(context.interaction_id),
-        trace_id=context.trace_id,
-        account_id=context.account_id,
-        pg_user_id=context.pg_user_id,
-    )
     
-    async def _lane1_publish() -> Optional[dict]:
-        """Lane 1: Publish envelope to Kinesis/EventBridge."""
+    # ``slot_held`` is cleared once the Lane 2 task owns the slot (its
+    # done-callback releases it); any raise before that releases it here.
+    slot_held = True
+    # The tenant's internal-domain lookup (a Postgres round-trip) needs only
+    # the tenant, not the transcript, so let it overlap transcription.
+    internal_domains_task = asyncio.create_task(
+        get_tenant_internal_domains(context.tenant_id)
+    )
+    try:
+        # Step 1: Transcribe audio
         try:
-            event_publisher = AWSEventPublisher()
-            return await event_publisher.publish_envelope(envelope)
+            batch_service = shared(BatchService)
+            logger.info(
+                "Starting transcription: processing_id=%s, interaction_id=%s",
+                processing_id,
+                context.interaction_id,
+            )
+            raw_transcript = await batch_service.transcribe_audio(file.file, mime_type)
+            logger.info(
+                "Transcription complete: processing_id=%s, interaction_id=%s, "
+                "length=%s chars",
+                processing_id,
+                context.interaction_id,
+                len(raw_transcript),
+            )
+        except DeepgramUnavailableError as e:
+            # Breaker open after repeated Deepgram outages: shed without
+            # calling Deepgram so a degraded upstream isn't piled onto.
+            logger.warning(
+                "Transcription shed (Deepgram circuit open): processing_id=%s, "
+                "interaction_id=%s, retry_after=%.0fs",
+                processing_id,
+                context.interaction_id,
+                e.retry_after_s,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail="Transcription service temporarily unavailable. Please retry later.",
+                headers={"Retry-After": str(max(1, round(e.retry_after_s)))},
+            )
         except Exception as e:
             logger.error(
-                f"Lane 1 (publishing) error: processing_id={processing_id}, "
-                f"interaction_id={context.interaction_id}, error={e}"
+                "Transcription failed: processing_id=%s, interaction_id=%s, error=%s",
+                processing_id,
+                context.interaction_id,
+                e,
+                exc_info=True,
             )
-            raise
-    
-    async def _lane2_intelligence() -> Optional[object]:
-        """Lane 2: Extract and persist intelligence."""
+            raise HTTPException(
+                status_code=500,
+                detail="Transcription service failed. Please try again."
+            )
+        
+        # Step 2: Enrich transcript with calendar event contacts.
+        # `participants=None` explicitly: /batch/process accepts an audio file
+        # and lets calendar matching be the sole attendee source. (Task 1.26.6)
+        enrichment_service = TranscriptEnrichmentService()
+        transcript_ts = datetime.now(timezone.utc)
+        enrichment = await enrichment_service.enrich(
+            tenant_id=context.tenant_id,
+            transcript_timestamp=transcript_ts,
+            raw_transcript=raw_transcript,
+            user_name=context.user_name,
+            account_id=context.account_id,
+            recording_user_id=context.pg_user_id or context.user_id,
+            tenant_internal_domains=await internal_domains_task,
+            participants=None,
+            # Codex Round 4 P2: thread the request's interaction_id so queue-signal
+            # rows anchor to it when there's no calendar match. /batch/process
+            # passes participants=None, so today this only matters defensively
+            # (no participants → no queue-signal path), but the caller-side
+            # invariant is "always thread interaction_id" — keep it symmetrical.
+            interaction_id=context.interaction_id,
+        )
+
+        # Prepend front-matter before cleaning
+        text_for_cleaning = raw_transcript
+        if enrichment.front_matter:
+            text_for_cleaning = enrichment.front_matter + "\n\n" + raw_transcript
+
+        # Step 3: Clean transcript
         try:
-            intelligence_service = IntelligenceService()
-            return await intelligence_service.process_transcript(
-                cleaned_transcript=cleaned_transcript,
-                interaction_id=context.interaction_id,
-                tenant_id=context.tenant_id,
-                account_id=context.account_id,
-                trace_id=context.trace_id,
-                interaction_type="batch_upload",
-                contact_ids=enrichment.contact_ids or None,
-                calendar_event_id=enrichment.calendar_event_id,
-                enrichment_confidence=enrichment.match_confidence,
-                enrichment_match_method=enrichment.match_method,
+            cleaner_service = shared(BatchCleanerService)
+            logger.info(
+                "Starting cleaning: processing_id=%s, interaction_id=%s",
+                processing_id,
+                context.interaction_id,
+            )
+            cleaned_transcript = await cleaner_service.clean_transcript(text_for_cleaning)
+            logger.info(
+                "Cleaning complete: processing_id=%s, interaction_id=%s, "
+                "length=%s chars",
+                processing_id,
+                context.interaction_id,
+                len(cleaned_transcript),
             )
         except Exception as e:
             logger.error(
-                f"Lane 2 (intelligence) error: processing_id={processing_id}, "
-                f"interaction_id={context.interaction_id}, error={e}"
+                "Cleaning failed: processing_id=%s, interaction_id=%s, error=%s",
+                processing_id,
+                context.interaction_id,
+                e,
+                exc_info=True,
             )
-            raise
-    
-    # Execute both lanes concurrently with error isolation
-    results = await asyncio.gather(
-        _lane1_publish(),
-        _lane2_intelligence(),
-        return_exceptions=True
-    )
-    
-    # Log results without failing the request
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            lane_name = "Lane 1 (publishing)" if i == 0 else "Lane 2 (intelligence)"
+            raise HTTPException(
+                status_code=500,
+                detail="Transcript cleaning service failed. Please try again."
+            )
+
+        # Step 4: Lane 1 (publishing) is awaited inline; Lane 2 (intelligence)
+        # is dispatched to the background so the response does not wait on it.
+        # Build extras dict with optional user_name for downstream speaker attribution
+        extras = {}
+        if context.user_name:
+            extras["user_name"] = context.user_name
+
+        # Add enrichment metadata to extras
+        extras.update(enrichment.to_extras_dict())
+
+        # Include front-matter in content.text for downstream LLMs
+        content_text = cleaned_transcript
+        if enrichment.front_matter:
+            content_text = enrichment.front_matter + "\n\n" + cleaned_transcript
+
+        # Built with model_construct: the fields come from the validated auth
+        # context, literals and our own clock. Only ContentModel (LLM output)
+        # goes through validation.
+        envelope = EnvelopeV1.model_construct(
+            tenant_id=context.tenant_uuid,
+            user_id=context.user_id,
+            interaction_type="transcript",
+            content=ContentModel(text=content_text, format="diarized"),
+            timestamp=transcript_ts,
+            source="upload",
+            extras=extras,
+            interaction_id=context.interaction_uuid,
+            trace_id=context.trace_id,
+            account_id=context.account_id,
+            pg_user_id=context.pg_user_id,
+        )
+        
+        # Lane 1: publish failures stay non-critical for /batch/process — the
+        # transcript is still returned to the caller.
+        try:
+            event_publisher = shared(AWSEventPublisher)
+            publish_result = await event_publisher.publish_envelope(envelope)
+        except Exception as e:
             logger.error(
-                f"{lane_name} failed (non-critical): processing_id={processing_id}, "
-                f"interaction_id={context.interaction_id}, "
-                f"error={type(result).__name__}: {str(result)}",
-                exc_info=result
+                "Lane 1 (publishing) failed (non-critical): processing_id=%s, "
+                "interaction_id=%s, error=%s: %s",
+                processing_id,
+                context.interaction_id,
+                type(e).__name__,
+                e,
+                exc_info=True,
             )
         else:
-            lane_name = "Lane 1 (publishing)" if i == 0 else "Lane 2 (intelligence)"
-            if i == 0 and result:
+            if publish_result:
                 logger.info(
-                    f"Envelope published: processing_id={processing_id}, "
-                    f"interaction_id={context.interaction_id}, "
-                    f"kinesis={'success' if result.get('kinesis_sequence') else 'failed'}, "
-                    f"eventbridge={'success' if result.get('eventbridge_id') else 'failed'}"
+                    "Envelope published: processing_id=%s, interaction_id=%s, "
+                    "kinesis=%s, eventbridge=%s",
+                    processing_id,
+                    context.interaction_id,
+                    "success" if publish_result.get("kinesis_sequence") else "failed",
+                    "success" if publish_result.get("eventbridge_id") else "failed",
                 )
             else:
                 logger.info(
-                    f"{lane_name} completed: processing_id={processing_id}, "
-                    f"interaction_id={context.interaction_id}"
+                    "Lane 1 (publishing) completed: processing_id=%s, "
+                    "interaction_id=%s",
+                    processing_id,
+                    context.interaction_id,
                 )
-    
-    logger.info(
-        f"Batch processing complete: processing_id={processing_id}, "
-        f"interaction_id={context.interaction_id}"
-    )
-    
-    # Requirement 2.3 - return response with interaction_id
-    return BatchProcessResponse(
-        raw_transcript=raw_transcript,
-        cleaned_transcript=cleaned_transcript,
-        interaction_id=context.interaction_id
-    )
+        
+        # Lane 2: hand the reserved slot to a tracked background task. It is
+        # awaited by the lifespan shutdown drain alongside /text/clean's.
+        text_clean_service.dispatch_lane2(
+            _lane2_intelligence(cleaned_transcript, context, enrichment, processing_id),
+            interaction_id=context.interaction_id,
+        )
+        slot_held = False
+        
+        logger.info(
+            "Batch processing complete (Lane 2 running in background): "
+            "processing_id=%s, interaction_id=%s",
+            processing_id,
+            context.interaction_id,
+        )
+        
+        # Requirement 2.3 - return response with interaction_id
+        return BatchProcessResponse(
+            raw_transcript=raw_transcript,
+            cleaned_transcript=cleaned_transcript,
+            interaction_id=context.interaction_id
+        )
+    finally:
+        if slot_held:
+            text_clean_service.release_lane2_slot()
+        if not internal_domains_task.done():
+            internal_domains_task.cancel()
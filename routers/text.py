@@ -14,12 +14,12 @@ enrichment, LLM text cleaning, and envelope construction.
 
 import logging
 from datetime import datetime, timezone
-from uuid import UUID
 from fastapi import APIRouter, HTTPException, Request
 
-from models.text_request import TextCleanRequest, TextCleanResponse
+from models.text_request import NON_WHITESPACE, TextCleanRequest, TextCleanResponse
 from models.envelope import EnvelopeV1, ContentModel
 from services.batch_cleaner_service import BatchCleanerService
+from services.shared_instances import shared
 from services.transcript_enrichment import TranscriptEnrichmentService
 from services.internal_domains import get_tenant_internal_domains
 from services import text_clean_service
@@ -58,16 +58,20 @@ async def clean_text(body: TextCleanRequest, request: Request):
     context = get_auth_context_ingestion(request)
 
     logger.info(
-        f"Text cleaning started: interaction_id={context.interaction_id}, "
-        f"tenant_id={context.tenant_id}, user_id={context.user_id}, "
-        f"text_length={len(body.text)}"
+        "Text cleaning started: interaction_id=%s, tenant_id=%s, user_id=%s, "
+        "text_length=%s",
+        context.interaction_id,
+        context.tenant_id,
+        context.user_id,
+        len(body.text),
     )
 
     # Additional whitespace validation (Pydantic validator handles this,
     # but we add explicit check for clearer error message)
-    if not body.text.strip():
+    if not NON_WHITESPACE.search(body.text):
         logger.warning(
-            f"Empty text rejected: interaction_id={context.interaction_id}"
+            "Empty text rejected: interaction_id=%s",
+            context.interaction_id,
         )
         raise HTTPException(
             status_code=400,
@@ -80,8 +84,11 @@ async def clean_text(body: TextCleanRequest, request: Request):
     # than silently picking one source. (Phase 1 / T1.26.2)
     if body.account_id != context.account_id:
         logger.warning(
-            f"account_id mismatch: interaction_id={context.interaction_id}, "
-            f"body.account_id={body.account_id}, context.account_id={context.account_id}"
+            "account_id mismatch: interaction_id=%s, "
+            "body.account_id=%s, context.account_id=%s",
+            context.interaction_id,
+            body.account_id,
+            context.account_id,
         )
         raise HTTPException(
             status_code=400,
@@ -121,9 +128,11 @@ async def clean_text(body: TextCleanRequest, request: Request):
         in_flight = text_clean_service.get_lane2_in_flight()
         cap = text_clean_service.get_lane2_cap()
         logger.warning(
-            f"Lane 2 backpressure: {in_flight} tasks in flight "
-            f"(cap {cap}); rejecting "
-            f"interaction_id={context.interaction_id} with 503"
+            "Lane 2 backpressure: %s tasks in flight (cap %s); rejecting "
+            "interaction_id=%s with 503",
+            in_flight,
+            cap,
+            context.interaction_id,
         )
         raise HTTPException(
             status_code=503,
@@ -172,22 +181,26 @@ async def clean_text(body: TextCleanRequest, request: Request):
 
         # Clean text using BatchCleanerService
         try:
-            cleaner_service = BatchCleanerService()
+            cleaner_service = shared(BatchCleanerService)
             logger.info(
-                f"Starting text cleaning: interaction_id={context.interaction_id}"
+                "Starting text cleaning: interaction_id=%s",
+                context.interaction_id,
             )
             cleaned_text = await cleaner_service.clean_transcript(text_for_cleaning)
             logger.info(
-                f"Text cleaning complete: interaction_id={context.interaction_id}, "
-                f"cleaned_length={len(cleaned_text)}"
+                "Text cleaning complete: interaction_id=%s, cleaned_length=%s",
+                context.interaction_id,
+                len(cleaned_text),
             )
         except Exception as e:
             # Requirement 3.6: Return original text on cleaning failure
             logger.error(
-                f"Text cleaning failed, returning original: "
-                f"interaction_id={context.interaction_id}, "
-                f"error={type(e).__name__}: {str(e)}",
-                exc_info=True
+                "Text cleaning failed, returning original: interaction_id=%s, "
+                "error=%s: %s",
+                context.interaction_id,
+                type(e).__name__,
+                e,
+                exc_info=True,
             )
             cleaned_text = body.text
 
@@ -204,16 +217,20 @@ async def clean_text(body: TextCleanRequest, request: Request):
         if enrichment.front_matter:
             content_text = enrichment.front_matter + "\n\n" + cleaned_text
 
-        # Build EnvelopeV1 with interaction_type from request body
-        envelope = EnvelopeV1(
-            tenant_id=UUID(context.tenant_id),
+        # Build EnvelopeV1 with interaction_type from request body.
+        # Every field is already typed and validated (auth context, validated
+        # request body, our own clock), so skip a second validation pass with
+        # model_construct. ContentModel is still validated: its text comes
+        # back from the cleaning LLM.
+        envelope = EnvelopeV1.model_construct(
+            tenant_id=context.tenant_uuid,
             user_id=context.user_id,
             interaction_type=body.interaction_type,
             content=ContentModel(text=content_text, format="plain"),
             timestamp=transcript_ts,
             source=body.source,
             extras=extras,
-            interaction_id=UUID(context.interaction_id),
+            interaction_id=context.interaction_uuid,
             trace_id=context.trace_id,
             account_id=context.account_id,
             pg_user_id=context.pg_user_id,
@@ -248,7 +265,7 @@ async def clean_text(body: TextCleanRequest, request: Request):
                 # if a future refactor lets envelope tenant/account drift
                 # from the request context.
                 result = await text_clean_service.process(
-                    tenant_id=UUID(context.tenant_id),
+                    tenant_id=context.tenant_uuid,
                     user_id=context.user_id,
                     account_id=context.account_id,
                     envelope=envelope,
@@ -273,8 +290,9 @@ async def clean_text(body: TextCleanRequest, request: Request):
             )
 
         logger.info(
-            f"Text cleaning response dispatched (Lane 2 running in background): "
-            f"interaction_id={result.interaction_id}"
+            "Text cleaning response dispatched (Lane 2 running in background): "
+            "interaction_id=%s",
+            result.interaction_id,
         )
 
         return TextCleanResponse(
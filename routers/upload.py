@@ -28,11 +28,13 @@ Security:
 import asyncio
 import json
 import logging
+import os
 import uuid
 from datetime import datetime, timezone
-from typing import Optional
+from types import MappingProxyType
+from typing import Annotated, Final, Optional
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from models.job_models import (
@@ -44,16 +46,22 @@ from models.job_models import (
     UploadCompleteRequest,
     UploadCompleteResponse,
 )
+from models.envelope import EnvelopeV1, ContentModel
 from models.participant_spec import ParticipantSpec
+from models.request_context import RequestContext
+from services.aws_event_publisher import AWSEventPublisher
+from services.batch_cleaner_service import BatchCleanerService
+from services.batch_service import BatchService
+from services.intelligence_service import IntelligenceService
 from services.s3_service import S3Service, S3ServiceError
+from services.transcript_enrichment import TranscriptEnrichmentService
 from services.database import get_async_session
 from services.internal_domains import get_tenant_internal_domains
-from utils.context_utils import (
-    get_auth_context_ingestion,
-    get_auth_context_polling,
-)
+from services.shared_instances import shared
+from utils.context_utils import ingestion_context, polling_context
+from utils.uuid_utils import uuid7
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +77,15 @@ _MIME_ALIASES: dict[str, str] = {
     "video/webm": "audio/webm",
 }
 
+# Exact-spelling lookup covering the canonical types (mapped to themselves)
+# and the aliases as browsers send them, so the usual request resolves in
+# one dict hit without lower()/strip() copies. Misses fall back to the
+# normalized lookup in _normalize_audio_mime_type.
+_EXACT_MIME_LOOKUP: Final = MappingProxyType({
+    **{canonical: canonical for canonical in _MIME_ALIASES.values()},
+    **_MIME_ALIASES,
+})
+
 
 def _normalize_audio_mime_type(mime_type: str) -> str:
     """Normalize browser-reported MIME types to standard IANA types.
@@ -82,7 +99,9 @@ def _normalize_audio_mime_type(mime_type: str) -> str:
        for format detection
     3. Non-standard types can cause Deepgram to return empty transcripts
     """
-    normalized = _MIME_ALIASES.get(mime_type.lower().strip(), mime_type)
+    normalized = _EXACT_MIME_LOOKUP.get(mime_type)
+    if normalized is None:
+        normalized = _MIME_ALIASES.get(mime_type.lower().strip(), mime_type)
     if normalized != mime_type:
         logger.info(f"Normalized MIME type: {mime_type} → {normalized}")
     return normalized
@@ -107,7 +126,10 @@ class UploadInitRequest(BaseModel):
 # --- Endpoints ---
 
 @router.post("/init", response_model=UploadInitResponse)
-async def upload_init(body: UploadInitRequest, request: Request):
+async def upload_init(
+    body: UploadInitRequest,
+    context: Annotated[RequestContext, Depends(ingestion_context)],
+):
     """Initialize an upload and get a presigned URL.
 
     This endpoint:
@@ -122,7 +144,7 @@ async def upload_init(body: UploadInitRequest, request: Request):
 
     Args:
         body: UploadInitRequest with filename, mime_type, file_size
-        request: FastAPI Request for auth context
+        context: Auth context (ingestion: X-Account-ID required)
 
     Returns:
         UploadInitResponse with upload_url, file_key, job_id, expires_at
@@ -131,10 +153,8 @@ async def upload_init(body: UploadInitRequest, request: Request):
         HTTPException 401: Invalid/missing JWT
         HTTPException 500: S3 or database error
     """
-    # Authenticate and get tenant context (ingestion: X-Account-ID required)
-    context = get_auth_context_ingestion(request)
-
-    job_id = str(uuid.uuid4())
+    job_uuid = uuid7()
+    job_id = str(job_uuid)
     interaction_id = context.interaction_id
 
     # Reject body/header account_id mismatch. The auth-context account_id
@@ -165,7 +185,7 @@ async def upload_init(body: UploadInitRequest, request: Request):
     )
 
     # Generate S3 key
-    s3_service = S3Service()
+    s3_service = shared(S3Service)
     file_key = s3_service.generate_file_key(
         tenant_id=context.tenant_id,
         job_id=job_id,
@@ -199,10 +219,11 @@ async def upload_init(body: UploadInitRequest, request: Request):
         else None
     )
 
-    # Create job record
+    # Create job record (one clock read for both timestamps)
+    created_at = datetime.now(timezone.utc)
     job = UploadJob(
-        id=uuid.UUID(job_id),
-        tenant_id=uuid.UUID(context.tenant_id),
+        id=job_uuid,
+        tenant_id=context.tenant_uuid,
         user_id=context.user_id,
         pg_user_id=context.pg_user_id,
         account_id=context.account_id,
@@ -213,9 +234,11 @@ async def upload_init(body: UploadInitRequest, request: Request):
         file_name=body.filename,
         mime_type=normalized_mime,
         file_size=body.file_size,
-        interaction_id=uuid.UUID(interaction_id),
+        interaction_id=context.interaction_uuid,
         trace_id=context.trace_id,
         participants_json=participants_json,
+        created_at=created_at,
+        updated_at=created_at,
     )
 
     try:
@@ -237,7 +260,10 @@ async def upload_init(body: UploadInitRequest, request: Request):
 
 
 @router.post("/complete", response_model=UploadCompleteResponse)
-async def upload_complete(body: UploadCompleteRequest, request: Request):
+async def upload_complete(
+    body: UploadCompleteRequest,
+    context: Annotated[RequestContext, Depends(ingestion_context)],
+):
     """Trigger processing after successful S3 upload.
 
     This endpoint:
@@ -249,7 +275,7 @@ async def upload_complete(body: UploadCompleteRequest, request: Request):
 
     Args:
         body: UploadCompleteRequest with file_key
-        request: FastAPI Request for auth context
+        context: Auth context (ingestion: X-Account-ID required)
 
     Returns:
         UploadCompleteResponse with job_id, interaction_id, status
@@ -258,18 +284,15 @@ async def upload_complete(body: UploadCompleteRequest, request: Request):
         HTTPException 401: Invalid/missing JWT
         HTTPException 403: File key doesn't belong to tenant
         HTTPException 404: Job not found or file not in S3
+        HTTPException 503: Processing queue is full (job stays queued)
     """
-    # Authenticate and get tenant context (ingestion: X-Account-ID required —
-    # /upload/complete triggers async write/persist via _process_upload_job)
-    context = get_auth_context_ingestion(request)
-
     logger.info(
         f"Upload complete: file_key={body.file_key[:50]}..., "
         f"tenant_id={context.tenant_id[:8]}..."
     )
 
     # Security: Verify file_key belongs to this tenant
-    s3_service = S3Service()
+    s3_service = shared(S3Service)
     if not s3_service.validate_key_belongs_to_tenant(body.file_key, context.tenant_id):
         logger.warning(
             f"Cross-tenant access attempt: file_key={body.file_key[:50]}..., "
@@ -277,60 +300,79 @@ async def upload_complete(body: UploadCompleteRequest, request: Request):
         )
         raise HTTPException(status_code=403, detail="File does not belong to this tenant")
 
-    # Verify object exists in S3
-    if not s3_service.verify_object_exists(body.file_key):
-        logger.warning(f"File not found in S3: {body.file_key[:50]}...")
-        raise HTTPException(status_code=404, detail="File not found in storage")
-
-    # Find the job by file_key and tenant_id
-    async with get_async_session() as session:
-        stmt = select(UploadJob).where(
-            UploadJob.file_key == body.file_key,
-            UploadJob.tenant_id == uuid.UUID(context.tenant_id)
-        )
-        result = await session.execute(stmt)
-        job = result.scalar_one_or_none()
-
-        if not job:
-            logger.warning(f"Job not found for file_key: {body.file_key[:50]}...")
-            raise HTTPException(status_code=404, detail="Job not found")
-
-        # Idempotency check: if job is already processing or succeeded, return immediately
-        if job.status in (JobStatus.processing, JobStatus.succeeded):
-            logger.info(f"Idempotent return: job_id={str(job.id)}, status={job.status}")
-            return UploadCompleteResponse(
-                job_id=str(job.id),
-                interaction_id=str(job.interaction_id),
-                status=job.status
+    # Verify the object exists in S3 (HeadObject, on a worker thread) while
+    # the job is looked up; the two are independent. The S3 result is
+    # checked first, so a missing file is still reported before a missing job.
+    head_task = asyncio.create_task(
+        asyncio.to_thread(s3_service.verify_object_exists, body.file_key)
+    )
+    try:
+        # Find the job by file_key and tenant_id
+        async with get_async_session() as session:
+            stmt = select(UploadJob).where(
+                UploadJob.file_key == body.file_key,
+                UploadJob.tenant_id == context.tenant_uuid
             )
+            result = await session.execute(stmt)
+            job = result.scalar_one_or_none()
 
-        # Allow retry of failed jobs - reset to queued
-        if job.status == JobStatus.failed:
-            logger.info(f"Retrying failed job: job_id={str(job.id)}")
-            job.status = JobStatus.queued
-            job.error_message = None
-            job.error_code = None
-
-        # Update job with any additional metadata
-        if body.file_name:
-            job.file_name = body.file_name
-        if body.mime_type:
-            job.mime_type = _normalize_audio_mime_type(body.mime_type)
-        if body.file_size:
-            job.file_size = body.file_size
-        job.updated_at = datetime.now(timezone.utc)
+            if not await head_task:
+                logger.warning(f"File not found in S3: {body.file_key[:50]}...")
+                raise HTTPException(status_code=404, detail="File not found in storage")
 
-        await session.commit()
-        await session.refresh(job)
+            if not job:
+                logger.warning(f"Job not found for file_key: {body.file_key[:50]}...")
+                raise HTTPException(status_code=404, detail="Job not found")
+
+            # Idempotency check: if job is already processing or succeeded, or
+            # still waiting on the worker pool, return immediately
+            if job.status in (JobStatus.processing, JobStatus.succeeded) or (
+                job.status == JobStatus.queued and str(job.id) in shared(UploadJobQueue)
+            ):
+                logger.info(f"Idempotent return: job_id={str(job.id)}, status={job.status}")
+                return UploadCompleteResponse(
+                    job_id=str(job.id),
+                    interaction_id=str(job.interaction_id),
+                    status=job.status
+                )
 
-        job_id = str(job.id)
-        interaction_id = str(job.interaction_id)
+            # Allow retry of failed jobs - reset to queued
+            if job.status == JobStatus.failed:
+                logger.info(f"Retrying failed job: job_id={str(job.id)}")
+                job.status = JobStatus.queued
+                job.error_message = None
+                job.error_code = None
+
+            # Update job with any additional metadata
+            if body.file_name:
+                job.file_name = body.file_name
+            if body.mime_type:
+                job.mime_type = _normalize_audio_mime_type(body.mime_type)
+            if body.file_size:
+                job.file_size = body.file_size
+            job.updated_at = datetime.now(timezone.utc)
+
+            # Sessions don't expire on commit and neither id is server-side,
+            # so no refresh round-trip is needed to read them back.
+            await session.commit()
 
-    # Trigger async processing (fire-and-forget within same process)
-    # In production, this could be a separate worker process or queue
-    asyncio.create_task(_process_upload_job(job_id, context.tenant_id))
+            job_id = str(job.id)
+            interaction_id = str(job.interaction_id)
+    finally:
+        if not head_task.done():
+            head_task.cancel()
+
+    # Hand off to the in-process worker pool. A full queue is backpressure:
+    # the job stays queued and a retried /complete enqueues it again.
+    if not shared(UploadJobQueue).submit(job_id, context.tenant_id):
+        logger.warning(f"Upload job queue full, rejecting: job_id={job_id}")
+        raise HTTPException(
+            status_code=503,
+            detail="Upload processing queue is full, retry shortly",
+            headers={"Retry-After": "5"},
+        )
 
-    logger.info(f"Processing triggered: job_id={job_id}")
+    logger.info(f"Processing queued: job_id={job_id}")
 
     return UploadCompleteResponse(
         job_id=job_id,
@@ -339,8 +381,27 @@ async def upload_complete(body: UploadCompleteRequest, request: Request):
     )
 
 
+# Columns the status poll reads: a plain row, so queued jobs skip ORM
+# hydration and the fields JobStatusResponse never shows.
+_JOB_STATUS_COLUMNS = (
+    UploadJob.id,
+    UploadJob.tenant_id,
+    UploadJob.status,
+    UploadJob.interaction_id,
+    UploadJob.created_at,
+    UploadJob.started_at,
+    UploadJob.completed_at,
+    UploadJob.result_summary,
+    UploadJob.error_message,
+    UploadJob.error_code,
+)
+
+
 @router.get("/status/{job_id}", response_model=JobStatusResponse)
-async def upload_status(job_id: str, request: Request):
+async def upload_status(
+    job_id: str,
+    context: Annotated[RequestContext, Depends(polling_context)],
+):
     """Get status of an upload job.
 
     This endpoint:
@@ -351,7 +412,8 @@ async def upload_status(job_id: str, request: Request):
 
     Args:
         job_id: UUID string of the job
-        request: FastAPI Request for auth context
+        context: Auth context (polling: X-Account-ID NOT required — tenant
+            ownership of the job is enforced below; this is a read-only route)
 
     Returns:
         JobStatusResponse with status, timestamps, and result/error
@@ -361,10 +423,6 @@ async def upload_status(job_id: str, request: Request):
         HTTPException 403: Job doesn't belong to tenant
         HTTPException 404: Job not found
     """
-    # Authenticate and get tenant context (polling: X-Account-ID NOT required —
-    # tenant ownership of the job is enforced below; this is a read-only route)
-    context = get_auth_context_polling(request)
-
     # Validate job_id format
     try:
         job_uuid = uuid.UUID(job_id)
@@ -372,15 +430,15 @@ async def upload_status(job_id: str, request: Request):
         raise HTTPException(status_code=400, detail="Invalid job ID format")
 
     async with get_async_session() as session:
-        stmt = select(UploadJob).where(UploadJob.id == job_uuid)
+        stmt = select(*_JOB_STATUS_COLUMNS).where(UploadJob.id == job_uuid)
         result = await session.execute(stmt)
-        job = result.scalar_one_or_none()
+        job = result.one_or_none()
 
         if not job:
             raise HTTPException(status_code=404, detail="Job not found")
 
         # Security: Verify job belongs to tenant
-        if str(job.tenant_id) != context.tenant_id:
+        if job.tenant_id != context.tenant_uuid:
             logger.warning(
                 f"Cross-tenant job access attempt: job_id={job_id}, "
                 f"job_tenant={job.tenant_id}, request_tenant={context.tenant_id}"
@@ -402,11 +460,43 @@ async def upload_status(job_id: str, request: Request):
 
 # --- Background Processing ---
 
+# Columns the worker reads back when it claims a job (UPDATE ... RETURNING).
+_JOB_PROCESSING_COLUMNS = (
+    UploadJob.file_key,
+    UploadJob.file_name,
+    UploadJob.file_size,
+    UploadJob.mime_type,
+    UploadJob.interaction_id,
+    UploadJob.user_id,
+    UploadJob.pg_user_id,
+    UploadJob.user_name,
+    UploadJob.trace_id,
+    UploadJob.account_id,
+    UploadJob.participants_json,
+)
+
+
+async def _finish_job(job_uuid: uuid.UUID, *, status: JobStatus, **values) -> None:
+    """Move a job to a terminal status in one UPDATE (no SELECT first).
+
+    A job that no longer exists is a no-op, as before.
+    """
+    now = datetime.now(timezone.utc)
+    async with get_async_session() as session:
+        await session.execute(
+            update(UploadJob)
+            .where(UploadJob.id == job_uuid)
+            .values(status=status, completed_at=now, updated_at=now, **values)
+            .execution_options(synchronize_session=False)
+        )
+        await session.commit()
+
+
 async def _process_upload_job(job_id: str, tenant_id: str):
     """Process an upload job asynchronously.
 
     This function:
-    1. Updates job to 'processing' status
+    1. Claims the job ('queued' -> 'processing'), or skips it if not queued
     2. Generates presigned GET URL for the file
     3. Transcribes via Deepgram (URL-based)
     4. Cleans transcript
@@ -420,51 +510,60 @@ async def _process_upload_job(job_id: str, tenant_id: str):
         job_id: UUID string of the job
         tenant_id: UUID string of the tenant (for logging)
     """
-    from services.batch_service import BatchService
-    from services.batch_cleaner_service import BatchCleanerService
-    from services.aws_event_publisher import AWSEventPublisher
-    from services.intelligence_service import IntelligenceService
-    from models.envelope import EnvelopeV1, ContentModel
-
     logger.info(f"Starting async processing: job_id={job_id}")
 
     try:
         job_uuid = uuid.UUID(job_id)
 
-        # Update job to processing
+        # Claim the job (queued -> processing); RETURNING hands back the
+        # fields the worker needs, so there is no SELECT before the UPDATE.
+        # The status guard keeps a duplicate submit from re-running a job
+        # another worker already claimed or finished.
+        now = datetime.now(timezone.utc)
         async with get_async_session() as session:
-            stmt = select(UploadJob).where(UploadJob.id == job_uuid)
-            result = await session.execute(stmt)
-            job = result.scalar_one_or_none()
+            result = await session.execute(
+                update(UploadJob)
+                .where(UploadJob.id == job_uuid, UploadJob.status == JobStatus.queued)
+                .values(status=JobStatus.processing, started_at=now, updated_at=now)
+                .returning(*_JOB_PROCESSING_COLUMNS)
+                .execution_options(synchronize_session=False)
+            )
+            job = result.one_or_none()
 
             if not job:
-                logger.error(f"Job not found for processing: {job_id}")
+                logger.info(f"Job already claimed or not queued, skipping: job_id={job_id}")
                 return
 
-            job.status = JobStatus.processing
-            job.started_at = datetime.now(timezone.utc)
-            job.updated_at = datetime.now(timezone.utc)
             await session.commit()
 
-            # Capture job data for processing
-            file_key = job.file_key
-            mime_type = _normalize_audio_mime_type(job.mime_type or "audio/wav")
-            interaction_id = str(job.interaction_id)
-            user_id = job.user_id
-            pg_user_id = job.pg_user_id
-            user_name = job.user_name
-            trace_id = job.trace_id
-            account_id = job.account_id
-            participants_json = job.participants_json
+        # Capture job data for processing
+        file_key = job.file_key
+        # Already canonical: upload_init and upload_complete normalize on write.
+        mime_type = job.mime_type or "audio/wav"
+        interaction_id = str(job.interaction_id)
+        user_id = job.user_id
+        pg_user_id = job.pg_user_id
+        user_name = job.user_name
+        trace_id = job.trace_id
+        account_id = job.account_id
+        participants_json = job.participants_json
 
         # Generate presigned GET URL for Deepgram
-        s3_service = S3Service()
+        s3_service = shared(S3Service)
         audio_url = s3_service.generate_presigned_get_url(file_key)
 
+        # The tenant's internal-domain lookup needs only tenant_id, so it runs
+        # while Deepgram transcribes (it never raises; empty set on error).
+        internal_domains_task = asyncio.create_task(get_tenant_internal_domains(tenant_id))
+
         # Transcribe from URL
-        batch_service = BatchService()
+        batch_service = shared(BatchService)
         logger.info(f"Transcribing from URL: job_id={job_id}, mime_type={mime_type}")
-        tx_result = await batch_service.transcribe_from_url(audio_url, mime_type)
+        try:
+            tx_result = await batch_service.transcribe_from_url(audio_url, mime_type)
+        except BaseException:
+            internal_domains_task.cancel()
+            raise
         raw_transcript = tx_result.transcript
 
         # Fail explicitly if Deepgram returned nothing
@@ -475,23 +574,19 @@ async def _process_upload_job(job_id: str, tenant_id: str):
                 f"duration={tx_result.duration_seconds}s, "
                 f"channels={tx_result.channels}, words={tx_result.words}"
             )
-            async with get_async_session() as session:
-                stmt = select(UploadJob).where(UploadJob.id == job_uuid)
-                result = await session.execute(stmt)
-                job = result.scalar_one_or_none()
-                if job:
-                    job.status = JobStatus.failed
-                    job.completed_at = datetime.now(timezone.utc)
-                    job.updated_at = datetime.now(timezone.utc)
-                    job.error_code = "EMPTY_TRANSCRIPT"
-                    job.error_message = (
-                        f"Audio decoded successfully (duration={tx_result.duration_seconds}s, "
-                        f"channels={tx_result.channels}) but Deepgram detected 0 words. "
-                        f"The file may contain silence, music, or unintelligible audio. "
-                        f"mime_type={mime_type}, file_size={job.file_size or 'unknown'}, "
-                        f"file_name={job.file_name or 'unknown'}"
-                    )
-                    await session.commit()
+            internal_domains_task.cancel()
+            await _finish_job(
+                job_uuid,
+                status=JobStatus.failed,
+                error_code="EMPTY_TRANSCRIPT",
+                error_message=(
+                    f"Audio decoded successfully (duration={tx_result.duration_seconds}s, "
+                    f"channels={tx_result.channels}) but Deepgram detected 0 words. "
+                    f"The file may contain silence, music, or unintelligible audio. "
+                    f"mime_type={mime_type}, file_size={job.file_size or 'unknown'}, "
+                    f"file_name={job.file_name or 'unknown'}"
+                ),
+            )
             return
 
         # Deserialize caller-provided participants from the persisted JSON
@@ -519,7 +614,6 @@ async def _process_upload_job(job_id: str, tenant_id: str):
         # carries body.participants from /upload/init through the async worker
         # so manual-notes / no-calendar-match workflows still get contact_ids
         # and front-matter.
-        from services.transcript_enrichment import TranscriptEnrichmentService
         enrichment_service = TranscriptEnrichmentService()
         transcript_ts = datetime.now(timezone.utc)
         enrichment = await enrichment_service.enrich(
@@ -529,7 +623,7 @@ async def _process_upload_job(job_id: str, tenant_id: str):
             user_name=user_name,
             account_id=account_id,
             recording_user_id=pg_user_id or user_id,
-            tenant_internal_domains=await get_tenant_internal_domains(tenant_id),
+            tenant_internal_domains=await internal_domains_task,
             participants=participants,
             # Codex Round 4 P2: thread the job's interaction_id so queue-signal
             # rows anchor to it when there's no calendar match. The /upload
@@ -545,7 +639,7 @@ async def _process_upload_job(job_id: str, tenant_id: str):
             text_for_cleaning = enrichment.front_matter + "\n\n" + raw_transcript
 
         # Clean transcript
-        cleaner_service = BatchCleanerService()
+        cleaner_service = shared(BatchCleanerService)
         logger.info(f"Cleaning transcript: job_id={job_id}")
         cleaned_transcript = await cleaner_service.clean_transcript(text_for_cleaning)
 
@@ -580,7 +674,7 @@ async def _process_upload_job(job_id: str, tenant_id: str):
         # Execute Lane 1 (publish) and Lane 2 (intelligence) concurrently
         async def _lane1():
             try:
-                publisher = AWSEventPublisher()
+                publisher = shared(AWSEventPublisher)
                 return await publisher.publish_envelope(envelope)
             except Exception as e:
                 logger.error(f"Lane 1 error: job_id={job_id}, error={e}")
@@ -588,7 +682,7 @@ async def _process_upload_job(job_id: str, tenant_id: str):
 
         async def _lane2():
             try:
-                intelligence = IntelligenceService()
+                intelligence = shared(IntelligenceService)
                 return await intelligence.process_transcript(
                     cleaned_transcript=cleaned_transcript,
                     interaction_id=interaction_id,
@@ -608,17 +702,11 @@ async def _process_upload_job(job_id: str, tenant_id: str):
         await asyncio.gather(_lane1(), _lane2(), return_exceptions=True)
 
         # Update job to succeeded
-        async with get_async_session() as session:
-            stmt = select(UploadJob).where(UploadJob.id == job_uuid)
-            result = await session.execute(stmt)
-            job = result.scalar_one_or_none()
-
-            if job:
-                job.status = JobStatus.succeeded
-                job.completed_at = datetime.now(timezone.utc)
-                job.updated_at = datetime.now(timezone.utc)
-                job.result_summary = f"Transcribed {len(raw_transcript)} chars, cleaned to {len(cleaned_transcript)} chars"
-                await session.commit()
+        await _finish_job(
+            job_uuid,
+            status=JobStatus.succeeded,
+            result_summary=f"Transcribed {len(raw_transcript)} chars, cleaned to {len(cleaned_transcript)} chars",
+        )
 
         logger.info(f"Job completed successfully: job_id={job_id}")
 
@@ -627,22 +715,143 @@ async def _process_upload_job(job_id: str, tenant_id: str):
 
         # Update job to failed
         try:
-            async with get_async_session() as session:
-                stmt = select(UploadJob).where(UploadJob.id == uuid.UUID(job_id))
-                result = await session.execute(stmt)
-                job = result.scalar_one_or_none()
-
-                if job:
-                    job.status = JobStatus.failed
-                    job.completed_at = datetime.now(timezone.utc)
-                    job.updated_at = datetime.now(timezone.utc)
-                    job.error_message = str(e)[:500]  # Truncate long errors
-                    job.error_code = type(e).__name__
-                    await session.commit()
+            await _finish_job(
+                uuid.UUID(job_id),
+                status=JobStatus.failed,
+                error_message=str(e)[:500],  # Truncate long errors
+                error_code=type(e).__name__,
+            )
         except Exception as update_error:
             logger.error(f"Failed to update job status: {update_error}")
 
 
+class UploadJobQueue:
+    """Bounded queue of upload jobs drained by a fixed pool of workers.
+
+    ``/upload/complete`` enqueues instead of starting a task per call, so a
+    burst of uploads runs at most ``workers`` Deepgram + OpenAI + DB
+    pipelines at once and queues up to ``maxsize`` more. Use through
+    :func:`shared` (one queue per event loop). Workers start on the first
+    :meth:`submit` if :meth:`start` was not called at startup.
+
+    The queue lives in process memory, so :meth:`stop` marks jobs that were
+    never started as failed (``SHUTDOWN``); the reaper only recovers rows
+    left in ``processing``, and a failed job can be retried via /complete.
+    """
+
+    def __init__(self):
+        self.workers = max(1, int(os.getenv(
+            "UPLOAD_JOB_WORKERS", str(min(32, (os.cpu_count() or 1) * 4))
+        )))
+        self.maxsize = max(1, int(os.getenv("UPLOAD_JOB_QUEUE_SIZE", "1000")))
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(self.maxsize)
+        self._tasks: list[asyncio.Task] = []
+        # Job ids waiting in the queue, so a retried /complete is not enqueued twice
+        self._waiting: set[str] = set()
+        # Job each worker is running, by worker index (may still be 'queued')
+        self._current: dict[int, str] = {}
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._waiting
+
+    def start(self) -> None:
+        """Start the worker tasks (no-op if already running)."""
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._worker(i), name=f"upload-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info(f"Upload job workers started: workers={self.workers}, maxsize={self.maxsize}")
+
+    def submit(self, job_id: str, tenant_id: str) -> bool:
+        """Enqueue a job; False if the queue is full.
+
+        A job already waiting in the queue is not enqueued again.
+        """
+        self.start()
+        if job_id in self._waiting:
+            return True
+        try:
+            self._queue.put_nowait((job_id, tenant_id))
+        except asyncio.QueueFull:
+            return False
+        self._waiting.add(job_id)
+        return True
+
+    async def stop(self) -> None:
+        """Cancel the workers and fail the jobs that never started.
+
+        A job cut off mid-run is already ``processing`` and is left to
+        :func:`reap_stuck_jobs`. Jobs still waiting in the queue (or
+        dequeued but not yet claimed) would otherwise stay ``queued``
+        forever, so they are marked failed with ``error_code="SHUTDOWN"``.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        job_ids = set(self._current.values())
+        self._current.clear()
+        self._waiting.clear()
+        while not self._queue.empty():
+            job_id, _ = self._queue.get_nowait()
+            self._queue.task_done()
+            job_ids.add(job_id)
+        if job_ids:
+            await _fail_unstarted_jobs(job_ids)
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job_id, tenant_id = await self._queue.get()
+            self._waiting.discard(job_id)
+            self._current[index] = job_id
+            try:
+                await _process_upload_job(job_id, tenant_id)
+            except Exception as e:
+                logger.error(f"Upload job worker error: job_id={job_id}, error={e}", exc_info=True)
+            finally:
+                self._queue.task_done()
+            # Skipped on cancellation so stop() still sees the job
+            del self._current[index]
+
+
+async def _fail_unstarted_jobs(job_ids: set[str]) -> None:
+    """Mark still-``queued`` jobs failed at shutdown in one UPDATE.
+
+    The status guard leaves any job a worker already claimed untouched.
+    Errors are logged, not raised, so shutdown carries on.
+    """
+    now = datetime.now(timezone.utc)
+    try:
+        async with get_async_session() as session:
+            result = await session.execute(
+                update(UploadJob)
+                .where(
+                    UploadJob.id.in_([uuid.UUID(job_id) for job_id in job_ids]),
+                    UploadJob.status == JobStatus.queued,
+                )
+                .values(
+                    status=JobStatus.failed,
+                    error_message="Server shut down before processing started; retry /upload/complete",
+                    error_code="SHUTDOWN",
+                    completed_at=now,
+                    updated_at=now,
+                )
+                .returning(UploadJob.id)
+                .execution_options(synchronize_session=False)
+            )
+            failed = result.all()
+            await session.commit()
+        logger.warning(f"Failed {len(failed)} queued upload jobs at shutdown")
+    except Exception as e:
+        logger.error(
+            f"Failed to mark queued upload jobs at shutdown: count={len(job_ids)}, error={e}",
+            exc_info=True,
+        )
+
+
 # --- Startup Tasks ---
 
 async def reap_stuck_jobs(max_age_minutes: int = 30):
@@ -658,27 +867,35 @@ async def reap_stuck_jobs(max_age_minutes: int = 30):
     """
     from datetime import timedelta
 
-    cutoff = datetime.now(timezone.utc) - timedelta(minutes=max_age_minutes)
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(minutes=max_age_minutes)
 
     try:
         async with get_async_session() as session:
-            stmt = select(UploadJob).where(
-                UploadJob.status == JobStatus.processing,
-                UploadJob.started_at < cutoff
+            # One UPDATE for every stuck job; RETURNING keeps the per-job log.
+            result = await session.execute(
+                update(UploadJob)
+                .where(
+                    UploadJob.status == JobStatus.processing,
+                    UploadJob.started_at < cutoff
+                )
+                .values(
+                    status=JobStatus.failed,
+                    error_message="Job timed out (server restart or crash)",
+                    error_code="PROCESSING_TIMEOUT",
+                    completed_at=now,
+                    updated_at=now,
+                )
+                .returning(UploadJob.id, UploadJob.started_at)
+                .execution_options(synchronize_session=False)
             )
-            result = await session.execute(stmt)
-            stuck_jobs = result.scalars().all()
-
-            for job in stuck_jobs:
-                logger.warning(f"Reaping stuck job: job_id={job.id}, started_at={job.started_at}")
-                job.status = JobStatus.failed
-                job.error_message = "Job timed out (server restart or crash)"
-                job.error_code = "PROCESSING_TIMEOUT"
-                job.completed_at = datetime.now(timezone.utc)
-                job.updated_at = datetime.now(timezone.utc)
+            stuck_jobs = result.all()
 
             await session.commit()
 
+            for job in stuck_jobs:
+                logger.warning(f"Reaped stuck job: job_id={job.id}, started_at={job.started_at}")
+
             if stuck_jobs:
                 logger.info(f"Reaped {len(stuck_jobs)} stuck jobs")
             else:
@@ -7,6 +7,7 @@ This script:
 3. Saves formatted results to cleaned_result.md
 """
 import asyncio
+import shutil
 import sys
 import os
 from pathlib import Path
@@ -34,9 +35,8 @@ async def main():
     
     print(f"Reading transcript from: {input_file}")
     
-    # Read the raw transcript
-    with open(input_file, 'r', encoding='utf-8') as f:
-        raw_transcript = f.read()
+    # Read the raw transcript (the cleaner needs all of it at once)
+    raw_transcript = input_file.read_text(encoding='utf-8')
     
     print(f"Transcript length: {len(raw_transcript)} characters")
     print("Processing with CleanerService...")
@@ -51,8 +51,10 @@ async def main():
         
         print("✓ Processing complete!")
         
-        # Format the output as Markdown
-        markdown_output = f"""# Cleaned Transcript Results
+        # Write the Markdown section by section rather than building one
+        # string that holds a second copy of both transcripts
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(f"""# Cleaned Transcript Results
 
 ## Summary
 
@@ -60,30 +62,22 @@ async def main():
 
 ## Action Items
 
-"""
-        
-        if result.action_items:
-            for i, item in enumerate(result.action_items, 1):
-                markdown_output += f"{i}. {item}\n"
-        else:
-            markdown_output += "*No action items identified*\n"
-        
-        markdown_output += f"""
-
-## Cleaned Transcript
+""")
 
-{result.cleaned_transcript}
+            if result.action_items:
+                for i, item in enumerate(result.action_items, 1):
+                    f.write(f"{i}. {item}\n")
+            else:
+                f.write("*No action items identified*\n")
 
----
+            f.write("\n\n## Cleaned Transcript\n\n")
+            f.write(result.cleaned_transcript)
+            f.write("\n\n---\n\n## Original Transcript (for comparison)\n\n")
 
-## Original Transcript (for comparison)
-
-{raw_transcript}
-"""
-        
-        # Write to output file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(markdown_output)
+            # Copy the original straight from the input file in chunks
+            with open(input_file, 'r', encoding='utf-8') as src:
+                shutil.copyfileobj(src, f)
+            f.write("\n")
         
         print(f"✓ Results saved to: {output_file}")
         print(f"\nSummary preview: {result.summary[:100]}...")
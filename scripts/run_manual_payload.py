@@ -6,9 +6,11 @@ Reads test_payload.json and POSTs to the production /text/clean endpoint.
 Captures and displays the interaction_id and trace_id for verification.
 """
 
-import json
+import atexit
+import os
 import sys
 import httpx
+import orjson
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +18,18 @@ from datetime import datetime
 PRODUCTION_URL = "https://live-transcription-fastapi-production.up.railway.app/text/clean"
 PAYLOAD_FILE = Path(__file__).parent.parent / "test_payload.json"
 
+# VERBOSE=1 also dumps the request headers/metadata and the full response
+VERBOSE = os.getenv("VERBOSE") == "1"
+
+# One keep-alive client for the process, so repeated calls (a loop, or an
+# orchestration script importing run_e2e_test) reuse the TLS connection.
+# Large transcripts can take 3-5 minutes to process with OpenAI.
+_CLIENT = httpx.Client(
+    timeout=300.0,
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+)
+atexit.register(_CLIENT.close)
+
 
 def load_payload() -> dict:
     """Load the test payload from JSON file."""
@@ -23,8 +37,14 @@ def load_payload() -> dict:
         print(f"ERROR: Payload file not found: {PAYLOAD_FILE}")
         sys.exit(1)
     
-    with open(PAYLOAD_FILE, "r") as f:
-        return json.load(f)
+    return orjson.loads(PAYLOAD_FILE.read_bytes())
+
+
+def _print_json(obj) -> None:
+    """Write indented JSON to stdout as UTF-8 bytes (no str round-trip)."""
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    sys.stdout.buffer.flush()
 
 
 def run_e2e_test():
@@ -46,8 +66,11 @@ def run_e2e_test():
     metadata = payload_data.get("metadata", {})
     
     print(f"  Text length: {len(text)} characters")
-    print(f"  Headers: {json.dumps(headers, indent=4)}")
-    print(f"  Metadata: {json.dumps(metadata, indent=4)}")
+    if VERBOSE:
+        print("  Headers:")
+        _print_json(headers)
+        print("  Metadata:")
+        _print_json(metadata)
     print()
     
     # Build request body (text and metadata only, headers go in HTTP headers)
@@ -61,19 +84,17 @@ def run_e2e_test():
     print("-" * 60)
     
     try:
-        # Large transcripts can take 3-5 minutes to process with OpenAI
-        with httpx.Client(timeout=300.0) as client:
-            response = client.post(
-                PRODUCTION_URL,
-                json=request_body,
-                headers=headers
-            )
+        response = _CLIENT.post(
+            PRODUCTION_URL,
+            json=request_body,
+            headers=headers
+        )
         
         print(f"Status Code: {response.status_code}")
         print()
         
         if response.status_code == 200:
-            response_json = response.json()
+            response_json = orjson.loads(response.content)
             
             # Extract critical IDs
             interaction_id = response_json.get("interaction_id", "NOT FOUND")
@@ -87,9 +108,12 @@ def run_e2e_test():
             print("=" * 60)
             print()
             
-            print("FULL RESPONSE:")
-            print("-" * 60)
-            print(json.dumps(response_json, indent=2))
+            if VERBOSE:
+                print("FULL RESPONSE:")
+                print("-" * 60)
+                _print_json(response_json)
+            else:
+                print("(set VERBOSE=1 to print the full response)")
             
             # Return IDs for downstream verification
             return {
@@ -12,10 +12,14 @@ All operations are idempotent - safe to run multiple times.
 """
 
 import boto3
-import json
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import orjson
+import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -25,6 +29,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=20,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+
+_RULE_NAME = "capture-transcripts-rule"
+
+# GetQueueUrl error codes for a missing queue (query and JSON protocols)
+_QUEUE_MISSING_CODES = frozenset({
+    "AWS.SimpleQueueService.NonExistentQueue",
+    "QueueDoesNotExist",
+})
+
+# The rule's event pattern is fixed, so it is serialized once at import
+_EVENT_PATTERN_JSON = orjson.dumps({
+    "source": ["com.yourapp.transcription"],
+    "detail-type": ["BatchProcessingCompleted"]
+}).decode()
+
+
+@functools.lru_cache(maxsize=None)
+def _client(service: str, region: str):
+    """Shared boto3 client per (service, region); credentials resolve once."""
+    return boto3.client(service, region_name=region, config=_BOTO_CLIENT_CONFIG)
+
 
 class AWSInfrastructureProvisioner:
     """
@@ -47,17 +77,56 @@ class AWSInfrastructureProvisioner:
             region: AWS region to provision resources in
         """
         self.region = region
-        self.sqs_client = boto3.client("sqs", region_name=region)
-        self.events_client = boto3.client("events", region_name=region)
+        self.sqs_client = _client("sqs", region)
+        self.events_client = _client("events", region)
         
-        # Get AWS account ID
+        # Get AWS account ID (AWS_ACCOUNT_ID skips the STS round-trip)
         try:
-            sts_client = boto3.client("sts")
-            self.account_id = sts_client.get_caller_identity()["Account"]
+            self.account_id = (
+                os.getenv("AWS_ACCOUNT_ID")
+                or _client("sts", region).get_caller_identity()["Account"]
+            )
             logger.info(f"Initialized provisioner for account {self.account_id} in region {region}")
         except Exception as e:
             logger.error(f"Failed to get AWS account ID: {e}")
             raise
+        
+        # ARN of the rule allowed to send to the main queue (fixed per account/region)
+        self._rule_source_arn = f"arn:aws:events:{region}:{self.account_id}:rule/{_RULE_NAME}"
+    
+    def _arn_for(self, queue_name: str) -> str:
+        """ARN of a queue this provisioner created (same account and region)."""
+        return f"arn:aws:sqs:{self.region}:{self.account_id}:{queue_name}"
+    
+    def _existing_queue_arn(self, queue_url: str) -> str:
+        """Read the ARN of a pre-existing queue from SQS."""
+        attributes = self.sqs_client.get_queue_attributes(
+            QueueUrl=queue_url,
+            AttributeNames=["QueueArn"]
+        )
+        return attributes["Attributes"]["QueueArn"]
+    
+    def _ensure_queue(self, queue_name: str, attributes: Dict[str, str]) -> Tuple[str, str]:
+        """
+        Return ``(queue_url, queue_arn)``, creating the queue only if missing.
+        
+        GetQueueUrl is tried first: on a re-run the queue exists and the
+        heavier CreateQueue call (and its QueueAlreadyExists error when
+        attributes differ) is skipped. Existing queues keep their attributes,
+        as before.
+        """
+        try:
+            queue_url = self.sqs_client.get_queue_url(QueueName=queue_name)["QueueUrl"]
+        except ClientError as e:
+            if e.response["Error"]["Code"] not in _QUEUE_MISSING_CODES:
+                raise
+        else:
+            logger.warning(f"Queue already exists: {queue_name}")
+            return queue_url, self._existing_queue_arn(queue_url)
+        
+        response = self.sqs_client.create_queue(QueueName=queue_name, Attributes=attributes)
+        logger.info(f"Created queue: {queue_name}")
+        return response["QueueUrl"], self._arn_for(queue_name)
     
     def create_dlq(self) -> Dict[str, str]:
         """
@@ -69,32 +138,15 @@ class AWSInfrastructureProvisioner:
         queue_name = "meeting-transcripts-dlq"
         
         try:
-            # Try to create the queue
-            response = self.sqs_client.create_queue(
-                QueueName=queue_name,
-                Attributes={
+            queue_url, queue_arn = self._ensure_queue(
+                queue_name,
+                {
                     "MessageRetentionPeriod": "1209600"  # 14 days
                 }
             )
-            queue_url = response["QueueUrl"]
-            logger.info(f"Created DLQ: {queue_name}")
-            
         except ClientError as e:
-            if e.response["Error"]["Code"] == "QueueAlreadyExists":
-                logger.warning(f"DLQ already exists: {queue_name}")
-                # Get existing queue URL
-                response = self.sqs_client.get_queue_url(QueueName=queue_name)
-                queue_url = response["QueueUrl"]
-            else:
-                logger.error(f"Failed to create DLQ: {e}")
-                raise
-        
-        # Get queue ARN
-        attributes = self.sqs_client.get_queue_attributes(
-            QueueUrl=queue_url,
-            AttributeNames=["QueueArn"]
-        )
-        queue_arn = attributes["Attributes"]["QueueArn"]
+            logger.error(f"Failed to create DLQ: {e}")
+            raise
         
         logger.info(f"DLQ URL: {queue_url}")
         logger.info(f"DLQ ARN: {queue_arn}")
@@ -123,34 +175,17 @@ class AWSInfrastructureProvisioner:
         }
         
         try:
-            # Try to create the queue
-            response = self.sqs_client.create_queue(
-                QueueName=queue_name,
-                Attributes={
+            queue_url, queue_arn = self._ensure_queue(
+                queue_name,
+                {
                     "VisibilityTimeout": "30",  # 30 seconds
                     "MessageRetentionPeriod": "1209600",  # 14 days
-                    "RedrivePolicy": json.dumps(redrive_policy)
+                    "RedrivePolicy": orjson.dumps(redrive_policy).decode()
                 }
             )
-            queue_url = response["QueueUrl"]
-            logger.info(f"Created main queue: {queue_name}")
-            
         except ClientError as e:
-            if e.response["Error"]["Code"] == "QueueAlreadyExists":
-                logger.warning(f"Main queue already exists: {queue_name}")
-                # Get existing queue URL
-                response = self.sqs_client.get_queue_url(QueueName=queue_name)
-                queue_url = response["QueueUrl"]
-            else:
-                logger.error(f"Failed to create main queue: {e}")
-                raise
-        
-        # Get queue ARN
-        attributes = self.sqs_client.get_queue_attributes(
-            QueueUrl=queue_url,
-            AttributeNames=["QueueArn"]
-        )
-        queue_arn = attributes["Attributes"]["QueueArn"]
+            logger.error(f"Failed to create main queue: {e}")
+            raise
         
         # Set queue policy to allow EventBridge to send messages
         queue_policy = {
@@ -165,7 +200,7 @@ class AWSInfrastructureProvisioner:
                     "Resource": queue_arn,
                     "Condition": {
                         "ArnEquals": {
-                            "aws:SourceArn": f"arn:aws:events:{self.region}:{self.account_id}:rule/capture-transcripts-rule"
+                            "aws:SourceArn": self._rule_source_arn
                         }
                     }
                 }
@@ -175,7 +210,7 @@ class AWSInfrastructureProvisioner:
         self.sqs_client.set_queue_attributes(
             QueueUrl=queue_url,
             Attributes={
-                "Policy": json.dumps(queue_policy)
+                "Policy": orjson.dumps(queue_policy).decode()
             }
         )
         logger.info("Set queue policy to allow EventBridge access")
@@ -195,19 +230,13 @@ class AWSInfrastructureProvisioner:
         Returns:
             Rule ARN
         """
-        rule_name = "capture-transcripts-rule"
-        
-        # Define event pattern
-        event_pattern = {
-            "source": ["com.yourapp.transcription"],
-            "detail-type": ["BatchProcessingCompleted"]
-        }
+        rule_name = _RULE_NAME
         
         try:
             # Try to create the rule
             response = self.events_client.put_rule(
                 Name=rule_name,
-                EventPattern=json.dumps(event_pattern),
+                EventPattern=_EVENT_PATTERN_JSON,
                 State="ENABLED",
                 Description="Routes batch transcription completion events to SQS queue"
             )
@@ -256,21 +285,28 @@ class AWSInfrastructureProvisioner:
         """
         logger.info("Starting infrastructure provisioning...")
         
-        # Step 1: Create DLQ
-        logger.info("Step 1: Creating Dead Letter Queue...")
-        dlq_info = self.create_dlq()
-        
-        # Step 2: Create main queue with DLQ configuration
-        logger.info("Step 2: Creating main SQS queue...")
-        queue_info = self.create_main_queue(dlq_info["queue_arn"])
-        
-        # Step 3: Create EventBridge rule
-        logger.info("Step 3: Creating EventBridge rule...")
-        rule_arn = self.create_eventbridge_rule()
+        # The EventBridge rule doesn't depend on either queue, so it is
+        # created on a second thread while the DLQ and main queue are set up
+        # (boto3 clients are thread-safe; the calls overlap on network I/O).
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            # Step 3: Create EventBridge rule
+            logger.info("Step 3: Creating EventBridge rule (in parallel)...")
+            rule_future = executor.submit(self.create_eventbridge_rule)
+            
+            # Step 1: Create DLQ
+            logger.info("Step 1: Creating Dead Letter Queue...")
+            dlq_info = self.create_dlq()
+            
+            # Step 2: Create main queue with DLQ configuration
+            logger.info("Step 2: Creating main SQS queue...")
+            queue_info = self.create_main_queue(dlq_info["queue_arn"])
+            
+            # Re-raises the rule's failure, if any
+            rule_arn = rule_future.result()
         
         # Step 4: Add queue as target to rule
         logger.info("Step 4: Adding SQS queue as target...")
-        self.add_queue_target("capture-transcripts-rule", queue_info["queue_arn"])
+        self.add_queue_target(_RULE_NAME, queue_info["queue_arn"])
         
         logger.info("Infrastructure provisioning completed successfully!")
         
@@ -294,7 +330,6 @@ def main():
     """Main entry point for the provisioning script."""
     try:
         # Get region from environment or use default
-        import os
         region = os.getenv("AWS_REGION", "us-east-1")
         
         # Create provisioner and run
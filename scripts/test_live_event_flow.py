@@ -11,14 +11,15 @@ This script performs a comprehensive end-to-end test of the event-driven archite
 6. Cleans up test data
 """
 
+import asyncio
+import functools
+import mmap
 import os
 import sys
-import json
-import time
 import wave
-import struct
-import requests
 import boto3
+import httpx
+import orjson
 from datetime import datetime
 
 # Configuration
@@ -26,6 +27,18 @@ RAILWAY_URL = "https://live-transcription-fastapi-production.up.railway.app"
 SQS_QUEUE_NAME = "meeting-transcripts-queue"
 AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 
+# Keep-alive client shared by every request this script makes (closed by main)
+_CLIENT = httpx.AsyncClient(
+    timeout=60.0,
+    limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=30),
+)
+
+
+@functools.cache
+def _sqs():
+    """One boto3 SQS client for the script; boto3 calls run via asyncio.to_thread."""
+    return boto3.client('sqs', region_name=AWS_REGION)
+
 # Colors for output
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -54,16 +67,15 @@ def generate_dummy_wav(filename="test_audio.wav", duration_seconds=1):
         wav_file.setsampwidth(sample_width)
         wav_file.setframerate(sample_rate)
         
-        # Write silence (zeros)
-        for _ in range(num_frames):
-            wav_file.writeframes(struct.pack('<h', 0))
+        # Write silence (zeros) in one call
+        wav_file.writeframes(bytes(num_frames * sample_width))
     
     file_size = os.path.getsize(filename)
     print(f"{GREEN}✓ Generated {filename} ({file_size} bytes){RESET}")
     return filename
 
 
-def send_to_endpoint(filename):
+async def send_to_endpoint(filename):
     """
     Send the audio file to the live Railway endpoint.
     
@@ -76,39 +88,38 @@ def send_to_endpoint(filename):
     print(f"\n{BLUE}[2/6] Sending file to live endpoint...{RESET}")
     print(f"  URL: {RAILWAY_URL}/batch/process")
     
-    with open(filename, 'rb') as f:
-        files = {'file': (filename, f, 'audio/wav')}
-        
-        try:
-            response = requests.post(
+    try:
+        # Map the file rather than reading it into a bytes copy; httpx
+        # streams the multipart body from the page cache in chunks.
+        with open(filename, 'rb') as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as audio:
+            response = await _CLIENT.post(
                 f"{RAILWAY_URL}/batch/process",
-                files=files,
-                timeout=60
+                files={'file': (filename, audio, 'audio/wav')},
             )
+        
+        if response.status_code == 200:
+            print(f"{GREEN}✓ Request successful (200 OK){RESET}")
+            data = orjson.loads(response.content)
+            print(f"  Raw transcript length: {len(data.get('raw_transcript', ''))} chars")
+            print(f"  Cleaned transcript length: {len(data.get('cleaned_transcript', ''))} chars")
+            return response, None
+        else:
+            print(f"{RED}✗ Request failed: {response.status_code}{RESET}")
+            print(f"  Response: {response.text}")
+            return response, None
             
-            if response.status_code == 200:
-                print(f"{GREEN}✓ Request successful (200 OK){RESET}")
-                data = response.json()
-                print(f"  Raw transcript length: {len(data.get('raw_transcript', ''))} chars")
-                print(f"  Cleaned transcript length: {len(data.get('cleaned_transcript', ''))} chars")
-                return response, None
-            else:
-                print(f"{RED}✗ Request failed: {response.status_code}{RESET}")
-                print(f"  Response: {response.text}")
-                return response, None
-                
-        except Exception as e:
-            print(f"{RED}✗ Request error: {e}{RESET}")
-            return None, None
+    except Exception as e:
+        print(f"{RED}✗ Request error: {e}{RESET}")
+        return None, None
 
 
-def get_sqs_queue_url():
+async def get_sqs_queue_url():
     """Get the SQS queue URL."""
     print(f"\n{BLUE}[3/6] Getting SQS queue URL...{RESET}")
     
     try:
-        sqs = boto3.client('sqs', region_name=AWS_REGION)
-        response = sqs.get_queue_url(QueueName=SQS_QUEUE_NAME)
+        response = await asyncio.to_thread(_sqs().get_queue_url, QueueName=SQS_QUEUE_NAME)
         queue_url = response['QueueUrl']
         print(f"{GREEN}✓ Queue URL: {queue_url}{RESET}")
         return queue_url
@@ -117,70 +128,90 @@ def get_sqs_queue_url():
         return None
 
 
-def poll_sqs_for_message(queue_url, max_attempts=10, wait_seconds=3):
+async def poll_sqs_for_message(queue_url, max_attempts=3, concurrent_polls=3, wait_time_seconds=20):
     """
     Poll SQS queue for messages.
     
+    Each attempt runs ``concurrent_polls`` long polls side by side; SQS
+    spreads a queue over several servers, so parallel receives pick up a
+    message sooner than one receive at a time.
+    
     Args:
         queue_url: SQS queue URL
-        max_attempts: Maximum number of polling attempts
-        wait_seconds: Seconds to wait between attempts
+        max_attempts: Maximum number of polling rounds
+        concurrent_polls: Long polls in flight per round
+        wait_time_seconds: SQS long-poll wait per receive (max 20)
         
     Returns:
-        Message dict or None
+        List of every message received in the first non-empty round
+        (empty if none arrived)
     """
     print(f"\n{BLUE}[4/6] Polling SQS queue for event...{RESET}")
     print(f"  Max attempts: {max_attempts}")
-    print(f"  Wait between attempts: {wait_seconds}s")
+    print(f"  Concurrent long polls: {concurrent_polls} x {wait_time_seconds}s")
+    
+    sqs = _sqs()
     
-    sqs = boto3.client('sqs', region_name=AWS_REGION)
+    def _receive():
+        return sqs.receive_message(
+            QueueUrl=queue_url,
+            MaxNumberOfMessages=10,
+            WaitTimeSeconds=wait_time_seconds,
+            # Long enough to verify and delete before another run sees them
+            VisibilityTimeout=60,
+            AttributeNames=['All'],
+            MessageAttributeNames=['All']
+        )
     
     for attempt in range(1, max_attempts + 1):
-        print(f"  Attempt {attempt}/{max_attempts}...", end=" ")
+        print(f"  Attempt {attempt}/{max_attempts}...", end=" ", flush=True)
         
-        try:
-            response = sqs.receive_message(
-                QueueUrl=queue_url,
-                MaxNumberOfMessages=10,
-                WaitTimeSeconds=2,
-                AttributeNames=['All'],
-                MessageAttributeNames=['All']
-            )
-            
-            messages = response.get('Messages', [])
-            
-            if messages:
-                print(f"{GREEN}Found {len(messages)} message(s){RESET}")
-                # Return the most recent message
-                return messages[0]
+        # Every poll is awaited: a receive that returns messages hides them
+        # for the visibility timeout, so none may be dropped unread.
+        responses = await asyncio.gather(
+            *(asyncio.to_thread(_receive) for _ in range(concurrent_polls)),
+            return_exceptions=True,
+        )
+        
+        messages = []
+        for response in responses:
+            if isinstance(response, Exception):
+                print(f"{RED}Error: {response}{RESET}", end=" ")
             else:
-                print(f"{YELLOW}No messages yet{RESET}")
-                
-        except Exception as e:
-            print(f"{RED}Error: {e}{RESET}")
+                messages.extend(response.get('Messages', []))
         
-        if attempt < max_attempts:
-            time.sleep(wait_seconds)
+        if messages:
+            print(f"{GREEN}Found {len(messages)} message(s){RESET}")
+            return messages
+        else:
+            print(f"{YELLOW}No messages yet{RESET}")
     
     print(f"{RED}✗ No messages received after {max_attempts} attempts{RESET}")
-    return None
+    return []
 
 
-def verify_message_schema(message):
+def verify_message_schema(messages):
     """
-    Verify the message matches the expected schema.
+    Verify every received message matches the expected schema.
     
     Args:
-        message: SQS message dict
+        messages: SQS message dicts
         
     Returns:
-        True if valid, False otherwise
+        True if all are valid, False otherwise
     """
     print(f"\n{BLUE}[5/6] Verifying message schema...{RESET}")
     
+    # Check every message (no short-circuit) so each failure is reported
+    results = [_verify_one_message(message) for message in messages]
+    return all(results)
+
+
+def _verify_one_message(message):
+    """Verify one SQS message; prints its details. True if valid."""
     try:
         # Parse the message body
-        body = json.loads(message['Body'])
+        body = orjson.loads(message['Body'])
         
         # EventBridge wraps the event in a specific structure
         if 'detail' in body:
@@ -229,7 +260,7 @@ def verify_message_schema(message):
         
         return True
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"{RED}✗ Failed to parse message body: {e}{RESET}")
         return False
     except Exception as e:
@@ -237,28 +268,38 @@ def verify_message_schema(message):
         return False
 
 
-def cleanup(queue_url, message, filename):
+def cleanup(queue_url, messages, filename):
     """
     Clean up test data.
     
     Args:
         queue_url: SQS queue URL
-        message: SQS message to delete
+        messages: SQS messages to delete
         filename: Audio file to delete
     """
     print(f"\n{BLUE}[6/6] Cleaning up...{RESET}")
     
-    # Delete SQS message
-    if queue_url and message:
-        try:
-            sqs = boto3.client('sqs', region_name=AWS_REGION)
-            sqs.delete_message(
-                QueueUrl=queue_url,
-                ReceiptHandle=message['ReceiptHandle']
-            )
-            print(f"{GREEN}✓ Deleted test message from SQS{RESET}")
-        except Exception as e:
-            print(f"{RED}✗ Failed to delete SQS message: {e}{RESET}")
+    # Delete SQS messages, up to 10 per DeleteMessageBatch call
+    if queue_url and messages:
+        deleted = 0
+        for start in range(0, len(messages), 10):
+            batch = messages[start:start + 10]
+            entries = [
+                {"Id": str(i), "ReceiptHandle": message['ReceiptHandle']}
+                for i, message in enumerate(batch)
+            ]
+            try:
+                response = _sqs().delete_message_batch(QueueUrl=queue_url, Entries=entries)
+            except Exception as e:
+                print(f"{RED}✗ Failed to delete SQS messages: {e}{RESET}")
+                continue
+            for failure in response.get('Failed', []):
+                message_id = batch[int(failure['Id'])].get('MessageId')
+                print(f"{RED}✗ Failed to delete SQS message {message_id}: "
+                      f"{failure.get('Code')} {failure.get('Message', '')}{RESET}")
+            deleted += len(response.get('Successful', []))
+        if deleted:
+            print(f"{GREEN}✓ Deleted {deleted} test message(s) from SQS{RESET}")
     
     # Delete audio file
     if filename and os.path.exists(filename):
@@ -269,7 +310,7 @@ def cleanup(queue_url, message, filename):
             print(f"{RED}✗ Failed to delete file: {e}{RESET}")
 
 
-def main():
+async def main():
     """Main test execution."""
     print(f"\n{BLUE}{'='*60}{RESET}")
     print(f"{BLUE}Live Event Flow Test{RESET}")
@@ -277,40 +318,39 @@ def main():
     
     filename = None
     queue_url = None
-    message = None
+    messages = []
     
     try:
         # Step 1: Generate dummy WAV file
         filename = generate_dummy_wav()
         
-        # Step 2: Send to endpoint
-        response, interaction_id = send_to_endpoint(filename)
+        # Steps 2 + 3: send to endpoint while looking up the SQS queue URL
+        (response, interaction_id), queue_url = await asyncio.gather(
+            send_to_endpoint(filename), get_sqs_queue_url()
+        )
         
         if not response or response.status_code != 200:
             print(f"\n{RED}✗ Test failed: Endpoint request unsuccessful{RESET}")
             sys.exit(1)
         
-        # Step 3: Get SQS queue URL
-        queue_url = get_sqs_queue_url()
-        
         if not queue_url:
             print(f"\n{RED}✗ Test failed: Could not get SQS queue URL{RESET}")
             sys.exit(1)
         
         # Step 4: Poll SQS for message
-        message = poll_sqs_for_message(queue_url)
+        messages = await poll_sqs_for_message(queue_url)
         
-        if not message:
+        if not messages:
             print(f"\n{RED}✗ Test failed: No message received in SQS{RESET}")
             sys.exit(1)
         
         # Step 5: Verify message schema
-        if not verify_message_schema(message):
+        if not verify_message_schema(messages):
             print(f"\n{RED}✗ Test failed: Message schema validation failed{RESET}")
             sys.exit(1)
         
         # Step 6: Cleanup
-        cleanup(queue_url, message, filename)
+        cleanup(queue_url, messages, filename)
         
         # Success!
         print(f"\n{GREEN}{'='*60}{RESET}")
@@ -321,17 +361,19 @@ def main():
         
         sys.exit(0)
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print(f"\n{YELLOW}Test interrupted by user{RESET}")
-        cleanup(queue_url, message, filename)
+        cleanup(queue_url, messages, filename)
         sys.exit(1)
     except Exception as e:
         print(f"\n{RED}✗ Unexpected error: {e}{RESET}")
         import traceback
         traceback.print_exc()
-        cleanup(queue_url, message, filename)
+        cleanup(queue_url, messages, filename)
         sys.exit(1)
+    finally:
+        await _CLIENT.aclose()
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
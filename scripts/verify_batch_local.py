@@ -69,7 +69,7 @@ async def main():
         
         start_time = time.time()
         raw_transcript = await batch_service.transcribe_audio(
-            audio_bytes=audio_bytes,
+            audio=audio_bytes,
             mimetype="audio/wav"
         )
         transcription_duration = time.time() - start_time
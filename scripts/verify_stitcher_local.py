@@ -44,7 +44,7 @@ async def main():
     print("\n🔄 Writing transcript chunks to Redis...")
     print("-" * 80)
     
-    # Manually push chunks to Redis List (simulating dual-write)
+    # Publish chunks through the dual-write path (shared + per-session Stream)
     for i, chunk in enumerate(test_chunks, 1):
         print(f"  {i}. Writing: '{chunk}'")
         await publisher.publish_transcript_event(
@@ -87,15 +87,15 @@ async def main():
         print("   - Transcript does not match expected output")
         sys.exit(1)
     
-    # Verify cleanup (list should be deleted)
+    # Verify cleanup (session stream should be deleted)
     print("\n🧹 Verifying cleanup...")
-    list_key = f"session:{session_id}:transcript"
-    remaining = await publisher.redis_client.lrange(list_key, 0, -1)
+    session_key = f"transcript:{session_id}"
+    remaining = await publisher.redis_client.xrange(session_key)
     
     if not remaining:
-        print("✅ Redis List was properly cleaned up after retrieval")
+        print("✅ Session Stream was properly cleaned up after retrieval")
     else:
-        print(f"⚠️  Warning: Redis List still contains {len(remaining)} items")
+        print(f"⚠️  Warning: Session Stream still contains {len(remaining)} entries")
     
     print("\n" + "=" * 80)
     print("VERIFICATION COMPLETE")
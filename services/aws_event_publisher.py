@@ -10,18 +10,171 @@ The publisher implements a fan-out pattern:
 2. Publish to EventBridge for queue-based processors
 """
 
+import asyncio
 import boto3
-import json
 import logging
+import orjson
 import os
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from models.batch_event import BatchProcessingCompletedEvent, EventData
 from models.envelope import EnvelopeV1
 
 logger = logging.getLogger(__name__)
 
+# Shared by the Kinesis and EventBridge clients. The publisher is one
+# long-lived instance per event loop whose batched calls run on worker
+# threads, so the connection pool is sized past botocore's default of 10
+# and idle connections are kept alive between bursts. Adaptive retries
+# back off client-side on throttling (e.g. Kinesis shard limits).
+_BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "64")),
+    tcp_keepalive=True,
+    retries={"mode": "adaptive"},
+)
+
+# PutEvents accepts at most 10 entries and 256 KB per call; an entry's size
+# is its Source + DetailType + Detail in UTF-8 (plus fields we don't set).
+EVENTBRIDGE_MAX_BATCH_ENTRIES = 10
+EVENTBRIDGE_MAX_BATCH_BYTES = 256 * 1024
+
+# PutRecords accepts at most 500 records and 5 MiB (data + partition keys)
+# per call.
+KINESIS_MAX_BATCH_RECORDS = 500
+KINESIS_MAX_BATCH_BYTES = 5 * 1024 * 1024
+
+
+class _EntryBatcher:
+    """
+    Coalesces concurrent entries into shared batch API calls.
+
+    Each ``submit`` waits until its entry has been sent and returns that
+    entry's slot from the response (a success or a per-entry
+    ``ErrorCode``/``ErrorMessage`` dict). A batch is sent as soon as it
+    reaches ``max_entries`` entries (or ``max_bytes``), otherwise after
+    ``max_wait_s``. API-level errors (e.g. ClientError) are raised from
+    every ``submit`` in the failed batch. Subclasses supply the API call
+    and how to read per-entry results from its response.
+    """
+
+    max_entries: int
+    max_bytes: Optional[int] = None
+    api_name: str
+
+    def __init__(self, client: Any, max_wait_s: float):
+        self._client = client
+        self._max_wait_s = max_wait_s
+        self._pending: List[Tuple[Dict[str, Any], int, asyncio.Future]] = []
+        self._pending_bytes = 0
+        self._timer: Optional[asyncio.Task] = None
+        self._sends: Set[asyncio.Task] = set()
+
+    async def submit(self, entry: Dict[str, Any], size: int = 0) -> Dict[str, Any]:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((entry, size, future))
+        self._pending_bytes += size
+
+        if len(self._pending) >= self.max_entries or (
+            self.max_bytes is not None and self._pending_bytes >= self.max_bytes
+        ):
+            task = asyncio.create_task(self._send(self._take_batch()))
+            self._sends.add(task)
+            task.add_done_callback(self._sends.discard)
+        if self._pending and (self._timer is None or self._timer.done()):
+            self._timer = asyncio.create_task(self._flush_after_wait())
+
+        return await future
+
+    def _take_batch(self) -> List[Tuple[Dict[str, Any], int, asyncio.Future]]:
+        """Pop the next batch: up to max_entries, within max_bytes (at least one)."""
+        count, size = 0, 0
+        for _, entry_size, _ in self._pending[:self.max_entries]:
+            if self.max_bytes is not None and count and size + entry_size > self.max_bytes:
+                break
+            count += 1
+            size += entry_size
+        batch = self._pending[:count]
+        self._pending = self._pending[count:]
+        self._pending_bytes -= size
+        return batch
+
+    async def _flush_after_wait(self) -> None:
+        await asyncio.sleep(self._max_wait_s)
+        while self._pending:
+            await self._send(self._take_batch())
+
+    def _call(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _entry_results(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    async def _send(self, batch: List[Tuple[Dict[str, Any], int, asyncio.Future]]) -> None:
+        try:
+            # boto3 is sync; keep the event loop free during the HTTPS call.
+            response = await asyncio.to_thread(self._call, [entry for entry, _, _ in batch])
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        result_entries = self._entry_results(response)
+        for i, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            if i < len(result_entries):
+                future.set_result(result_entries[i])
+            else:
+                future.set_result({
+                    "ErrorCode": "MissingResponseEntry",
+                    "ErrorMessage": f"{self.api_name} response had fewer entries than requested",
+                })
+
+
+class _PutEventsBatcher(_EntryBatcher):
+    """Coalesces concurrent EventBridge entries into shared PutEvents calls."""
+
+    max_entries = EVENTBRIDGE_MAX_BATCH_ENTRIES
+    max_bytes = EVENTBRIDGE_MAX_BATCH_BYTES
+    api_name = "PutEvents"
+
+    def _call(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self._client.put_events(Entries=entries)
+
+    def _entry_results(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return response.get("Entries", [])
+
+
+class _PutRecordsBatcher(_EntryBatcher):
+    """
+    Coalesces concurrent Kinesis records into shared PutRecords calls.
+
+    Entries are ``{"Data": bytes, "PartitionKey": str}``; results are
+    ``{"SequenceNumber", "ShardId"}`` on success.
+    """
+
+    max_entries = KINESIS_MAX_BATCH_RECORDS
+    max_bytes = KINESIS_MAX_BATCH_BYTES
+    api_name = "PutRecords"
+
+    def __init__(self, client: Any, stream_name: str, max_wait_s: float):
+        super().__init__(client, max_wait_s)
+        self._stream_name = stream_name
+
+    def _call(self, entries: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self._client.put_records(StreamName=self._stream_name, Records=entries)
+
+    def _entry_results(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return response.get("Records", [])
+
+
+async def _skipped() -> None:
+    """Stand-in for a disabled destination in publish_envelope's gather."""
+    return None
+
 
 class AWSEventPublisher:
     """
@@ -44,6 +197,10 @@ class AWSEventPublisher:
             EVENTBRIDGE_BUS_NAME: Event bus name (default: default)
             EVENT_SOURCE: Event source identifier (default: com.yourapp.transcription)
             KINESIS_STREAM_NAME: Kinesis stream name (default: eq-interactions-stream-dev)
+            EVENTBRIDGE_BATCH_WINDOW_MS: Max time an envelope waits to share a
+                PutEvents call with concurrent publishes (default: 50)
+            KINESIS_BATCH_WINDOW_MS: Max time an envelope waits to share a
+                PutRecords call with concurrent publishes (default: 20)
         """
         self.region = os.getenv("AWS_REGION", "us-east-1")
         self.bus_name = os.getenv("EVENTBRIDGE_BUS_NAME", "default")
@@ -55,6 +212,17 @@ class AWSEventPublisher:
         
         # Initialize Kinesis client
         self.kinesis_client = self._init_kinesis_client()
+
+        # Envelope publishes share PutEvents calls (up to 10 entries / 256 KB each);
+        # the batcher is built on first publish.
+        self._eventbridge_batch_window_s = (
+            int(os.getenv("EVENTBRIDGE_BATCH_WINDOW_MS", "50")) / 1000
+        )
+        self._eventbridge_batcher: Optional[_PutEventsBatcher] = None
+        self._kinesis_batch_window_s = (
+            int(os.getenv("KINESIS_BATCH_WINDOW_MS", "20")) / 1000
+        )
+        self._kinesis_batcher: Optional[_PutRecordsBatcher] = None
     
     def _init_eventbridge_client(self):
         """
@@ -64,7 +232,7 @@ class AWSEventPublisher:
             boto3 EventBridge client or None if initialization fails
         """
         try:
-            client = boto3.client("events", region_name=self.region)
+            client = boto3.client("events", region_name=self.region, config=_BOTO_CLIENT_CONFIG)
             logger.info(
                 f"EventBridge client initialized: region={self.region}, "
                 f"bus={self.bus_name}, source={self.event_source}"
@@ -90,7 +258,7 @@ class AWSEventPublisher:
         Requirements: 7.1
         """
         try:
-            client = boto3.client("kinesis", region_name=self.region)
+            client = boto3.client("kinesis", region_name=self.region, config=_BOTO_CLIENT_CONFIG)
             logger.info(
                 f"Kinesis client initialized: region={self.region}, "
                 f"stream={self.kinesis_stream}"
@@ -106,7 +274,9 @@ class AWSEventPublisher:
             logger.error(f"Failed to initialize Kinesis client: {e}")
             return None
     
-    def _build_kinesis_payload(self, envelope: EnvelopeV1) -> Dict[str, Any]:
+    def _build_kinesis_payload(
+        self, envelope: EnvelopeV1, envelope_dict: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Build the Kinesis payload wrapper for an EnvelopeV1.
         
@@ -115,6 +285,8 @@ class AWSEventPublisher:
         
         Args:
             envelope: The EnvelopeV1 instance to wrap
+            envelope_dict: ``envelope.model_dump(mode="json")`` if the
+                caller already has it
             
         Returns:
             Dict with structure:
@@ -127,14 +299,20 @@ class AWSEventPublisher:
         
         Requirements: 5.2, 6.1, 6.2, 6.3, 6.4, 6.5
         """
+        # Dump once; the routing fields are read back from the dumped dict
+        # so they are the exact strings consumers see inside the envelope.
+        if envelope_dict is None:
+            envelope_dict = envelope.model_dump(mode="json")
         return {
-            "envelope": envelope.model_dump(mode="json"),
-            "trace_id": envelope.trace_id,
-            "tenant_id": str(envelope.tenant_id),
-            "schema_version": envelope.schema_version
+            "envelope": envelope_dict,
+            "trace_id": envelope_dict["trace_id"],
+            "tenant_id": envelope_dict["tenant_id"],
+            "schema_version": envelope_dict["schema_version"]
         }
     
-    async def _publish_to_kinesis(self, envelope: EnvelopeV1) -> Optional[str]:
+    async def _publish_to_kinesis(
+        self, envelope: EnvelopeV1, envelope_dict: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Publish wrapped envelope to Kinesis stream.
         
@@ -143,6 +321,7 @@ class AWSEventPublisher:
         
         Args:
             envelope: The EnvelopeV1 instance to publish
+            envelope_dict: Pre-dumped envelope (see publish_envelope)
             
         Returns:
             Sequence number on success, None on failure
@@ -159,19 +338,38 @@ class AWSEventPublisher:
         
         try:
             # Build wrapper payload
-            wrapper = self._build_kinesis_payload(envelope)
+            wrapper = self._build_kinesis_payload(envelope, envelope_dict)
             
             # Use tenant_id as partition key for ordering guarantees (Requirement 5.3)
-            partition_key = str(envelope.tenant_id)
+            partition_key = wrapper["tenant_id"]
             
-            # Publish to Kinesis
-            response = self.kinesis_client.put_record(
-                StreamName=self.kinesis_stream,
-                Data=json.dumps(wrapper).encode("utf-8"),
-                PartitionKey=partition_key
+            # Publish to Kinesis (batched with concurrent publishes via
+            # PutRecords). The envelope was already reduced to JSON
+            # primitives by model_dump(mode="json") (Z-suffixed timestamps,
+            # UUID strings), so orjson only has to encode the wrapper; it
+            # emits UTF-8 bytes directly, without an intermediate str.
+            data = orjson.dumps(wrapper)
+            if self._kinesis_batcher is None:
+                self._kinesis_batcher = _PutRecordsBatcher(
+                    self.kinesis_client, self.kinesis_stream, self._kinesis_batch_window_s
+                )
+            result_record = await self._kinesis_batcher.submit(
+                {"Data": data, "PartitionKey": partition_key},
+                size=len(data) + len(partition_key.encode("utf-8")),
             )
-            
-            sequence_number = response["SequenceNumber"]
+
+            # Check for a per-record failure
+            if "ErrorCode" in result_record or "SequenceNumber" not in result_record:
+                logger.error(
+                    f"Kinesis publish failed: "
+                    f"interaction_id={envelope.interaction_id}, "
+                    f"tenant_id={envelope.tenant_id}, "
+                    f"error_code={result_record.get('ErrorCode', 'Unknown')}, "
+                    f"error_message={result_record.get('ErrorMessage', 'Unknown error')}"
+                )
+                return None
+
+            sequence_number = result_record["SequenceNumber"]
             logger.info(
                 f"Kinesis publish success: "
                 f"interaction_id={envelope.interaction_id}, "
@@ -204,7 +402,9 @@ class AWSEventPublisher:
             )
             return None
     
-    async def _publish_to_eventbridge(self, envelope: EnvelopeV1) -> Optional[str]:
+    async def _publish_to_eventbridge(
+        self, envelope: EnvelopeV1, envelope_dict: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Publish EnvelopeV1 to EventBridge.
         
@@ -213,6 +413,7 @@ class AWSEventPublisher:
         
         Args:
             envelope: The EnvelopeV1 instance to publish
+            envelope_dict: Pre-dumped envelope (see publish_envelope)
             
         Returns:
             Event ID on success, None on failure
@@ -229,21 +430,35 @@ class AWSEventPublisher:
         
         try:
             # Construct EventBridge entry from envelope
+            detail = (
+                orjson.dumps(envelope_dict)
+                if envelope_dict is not None
+                else envelope.model_dump_json().encode()
+            )
             entry = {
                 "Source": self.event_source,
                 "DetailType": f"EnvelopeV1.{envelope.interaction_type}",
-                "Detail": envelope.model_dump_json(),
+                "Detail": detail.decode(),
                 "EventBusName": self.bus_name
             }
+            # PutEvents counts Source + DetailType + Detail toward its limit
+            entry_size = (
+                len(detail)
+                + len(entry["Source"].encode("utf-8"))
+                + len(entry["DetailType"].encode("utf-8"))
+            )
             
-            # Publish to EventBridge
-            response = self.client.put_events(Entries=[entry])
+            # Publish to EventBridge (batched with concurrent publishes)
+            if self._eventbridge_batcher is None:
+                self._eventbridge_batcher = _PutEventsBatcher(
+                    self.client, self._eventbridge_batch_window_s
+                )
+            result_entry = await self._eventbridge_batcher.submit(entry, size=entry_size)
             
-            # Check for failures
-            if response["FailedEntryCount"] > 0:
-                failed_entry = response["Entries"][0]
-                error_code = failed_entry.get("ErrorCode", "Unknown")
-                error_message = failed_entry.get("ErrorMessage", "Unknown error")
+            # Check for a per-entry failure
+            if "ErrorCode" in result_entry or "EventId" not in result_entry:
+                error_code = result_entry.get("ErrorCode", "Unknown")
+                error_message = result_entry.get("ErrorMessage", "Unknown error")
                 
                 logger.error(
                     f"EventBridge publish failed: "
@@ -255,7 +470,7 @@ class AWSEventPublisher:
                 return None
             
             # Success - extract event ID
-            event_id = response["Entries"][0]["EventId"]
+            event_id = result_entry["EventId"]
             
             logger.info(
                 f"EventBridge publish success: "
@@ -293,9 +508,10 @@ class AWSEventPublisher:
         """
         Publish envelope to all configured destinations using fan-out pattern.
         
-        This method implements the fan-out publishing strategy:
-        1. Attempt Kinesis publish first (for real-time streaming)
-        2. Attempt EventBridge publish second (for queue-based consumers)
+        This method implements the fan-out publishing strategy, with both
+        destinations published concurrently from a single envelope dump:
+        1. Kinesis (for real-time streaming), started first
+        2. EventBridge (for queue-based consumers)
         
         Publishing failures are logged but never raise exceptions - the user
         request should succeed regardless of publishing failures.
@@ -323,46 +539,59 @@ class AWSEventPublisher:
             "eventbridge_id": None
         }
         
-        # 1. Attempt Kinesis publish first (Requirement 5.1)
-        if kinesis_enabled:
-            try:
-                results["kinesis_sequence"] = await self._publish_to_kinesis(envelope)
-            except Exception as e:
-                # Should never happen since _publish_to_kinesis catches all exceptions,
-                # but handle defensively
-                logger.error(
-                    f"Unexpected error in Kinesis publish: "
-                    f"interaction_id={envelope.interaction_id}, "
-                    f"tenant_id={envelope.tenant_id}, "
-                    f"error={type(e).__name__}: {str(e)}",
-                    exc_info=True
-                )
-        else:
+        # Dump the envelope once for both destinations, then publish to
+        # Kinesis and EventBridge concurrently: the two legs are independent
+        # network round-trips, so the caller waits for the slower one rather
+        # than their sum. Kinesis is still started first (Requirement 5.1)
+        # and a Kinesis failure never stops EventBridge (Requirement 5.5).
+        envelope_dict = (
+            envelope.model_dump(mode="json")
+            if kinesis_enabled or eventbridge_enabled
+            else None
+        )
+        kinesis_result, eventbridge_result = await asyncio.gather(
+            self._publish_to_kinesis(envelope, envelope_dict) if kinesis_enabled else _skipped(),
+            self._publish_to_eventbridge(envelope, envelope_dict) if eventbridge_enabled else _skipped(),
+            return_exceptions=True,
+        )
+        
+        # 1. Kinesis (Requirement 5.1)
+        if not kinesis_enabled:
             logger.info(
                 f"Kinesis publishing disabled via ENABLE_KINESIS_PUBLISHING. "
                 f"interaction_id={envelope.interaction_id}, tenant_id={envelope.tenant_id}"
             )
-        
-        # 2. Attempt EventBridge publish second (Requirement 5.4)
-        # Continue even if Kinesis failed (Requirement 5.5)
-        if eventbridge_enabled:
-            try:
-                results["eventbridge_id"] = await self._publish_to_eventbridge(envelope)
-            except Exception as e:
-                # Should never happen since _publish_to_eventbridge catches all exceptions,
-                # but handle defensively
-                logger.error(
-                    f"Unexpected error in EventBridge publish: "
-                    f"interaction_id={envelope.interaction_id}, "
-                    f"tenant_id={envelope.tenant_id}, "
-                    f"error={type(e).__name__}: {str(e)}",
-                    exc_info=True
-                )
+        elif isinstance(kinesis_result, BaseException):
+            # Should never happen since _publish_to_kinesis catches all exceptions,
+            # but handle defensively
+            logger.error(
+                f"Unexpected error in Kinesis publish: "
+                f"interaction_id={envelope.interaction_id}, "
+                f"tenant_id={envelope.tenant_id}, "
+                f"error={type(kinesis_result).__name__}: {str(kinesis_result)}",
+                exc_info=kinesis_result
+            )
         else:
+            results["kinesis_sequence"] = kinesis_result
+        
+        # 2. EventBridge (Requirement 5.4)
+        if not eventbridge_enabled:
             logger.info(
                 f"EventBridge publishing disabled via ENABLE_EVENTBRIDGE_PUBLISHING. "
                 f"interaction_id={envelope.interaction_id}, tenant_id={envelope.tenant_id}"
             )
+        elif isinstance(eventbridge_result, BaseException):
+            # Should never happen since _publish_to_eventbridge catches all exceptions,
+            # but handle defensively
+            logger.error(
+                f"Unexpected error in EventBridge publish: "
+                f"interaction_id={envelope.interaction_id}, "
+                f"tenant_id={envelope.tenant_id}, "
+                f"error={type(eventbridge_result).__name__}: {str(eventbridge_result)}",
+                exc_info=eventbridge_result
+            )
+        else:
+            results["eventbridge_id"] = eventbridge_result
         
         # Log summary of publish results (Requirement 5.7)
         kinesis_status = "disabled" if not kinesis_enabled else ("success" if results["kinesis_sequence"] else "failed")
@@ -465,11 +694,12 @@ class AWSEventPublisher:
             )
             raise
         
-        # Construct EventBridge entry
+        # Construct EventBridge entry. Serialize the validated model directly
+        # (pydantic-core) rather than re-encoding the dict with json.dumps.
         entry = {
             "Source": self.event_source,
             "DetailType": "BatchProcessingCompleted",
-            "Detail": json.dumps(event_detail),
+            "Detail": validated_event.model_dump_json(),
             "EventBusName": self.bus_name
         }
         
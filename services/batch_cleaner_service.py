@@ -1,6 +1,9 @@
 """BatchCleanerService for cleaning diarized transcripts using OpenAI."""
+import asyncio
+import hashlib
 import os
 import logging
+import re
 from typing import List
 from openai import AsyncOpenAI
 from utils.text_utils import split_long_lines
@@ -8,6 +11,11 @@ from models.cleaned_chunk import CleanedChunk
 
 logger = logging.getLogger(__name__)
 
+# A transcript that ends a sentence is taken as already formatted.
+_SENTENCE_TERMINATORS = (".", "?", "!")
+# Diarized turn labels as produced by BatchService ("SPEAKER_0:").
+_SPEAKER_LABEL = re.compile(r"SPEAKER_\w+:")
+
 
 class BatchCleanerService:
     """Service for cleaning diarized transcripts using OpenAI GPT-4o."""
@@ -20,7 +28,40 @@ class BatchCleanerService:
         
         self.client = AsyncOpenAI(api_key=api_key)
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o")
-        logger.info(f"BatchCleanerService initialized with model={self.model}")
+        # Chunks are independent prompts, so up to this many are in flight
+        # at once per transcript instead of one after another.
+        self.max_concurrent_chunks = max(1, int(os.getenv("CLEANER_MAX_CONCURRENT_CHUNKS", "4")))
+        # Short, already-punctuated transcripts (e.g. voice notes) skip the
+        # LLM round-trip. 0 disables the shortcut.
+        self.skip_below_chars = max(0, int(os.getenv("CLEANER_SKIP_BELOW_CHARS", "160")))
+        # Every chunk request starts with the same system message, so build
+        # it once: a byte-identical prefix is what OpenAI's prompt cache
+        # matches on, and the cache key routes chunks of all transcripts
+        # for this prompt/model to the same cache.
+        system_prompt = self._get_system_prompt()
+        self._system_message = {"role": "system", "content": system_prompt}
+        self._prompt_cache_key = "batch-cleaner-" + hashlib.sha256(
+            f"{self.model}\n{system_prompt}".encode()
+        ).hexdigest()[:16]
+        logger.info(
+            f"BatchCleanerService initialized with model={self.model}, "
+            f"max_concurrent_chunks={self.max_concurrent_chunks}, "
+            f"skip_below_chars={self.skip_below_chars}"
+        )
+
+    def _is_already_clean(self, raw_transcript: str) -> bool:
+        """True for a short, single-turn transcript ending in terminal punctuation.
+
+        The final character says nothing about earlier lines, so anything
+        with more than one line or speaker turn is always cleaned.
+        """
+        text = raw_transcript.strip()
+        return (
+            len(raw_transcript) < self.skip_below_chars
+            and text.endswith(_SENTENCE_TERMINATORS)
+            and "\n" not in text
+            and len(_SPEAKER_LABEL.findall(text)) <= 1
+        )
     
     async def clean_transcript(self, raw_transcript: str) -> str:
         """
@@ -30,11 +71,21 @@ class BatchCleanerService:
             raw_transcript: Formatted transcript with SPEAKER_X labels
             
         Returns:
-            Cleaned transcript with preserved speaker labels
+            Cleaned transcript with preserved speaker labels. A single-line,
+            single-speaker transcript under ``skip_below_chars`` that already
+            ends in ``.``, ``?`` or ``!`` is returned unchanged without
+            calling OpenAI.
             
         Raises:
             Exception: If OpenAI API call fails
         """
+        if self._is_already_clean(raw_transcript):
+            logger.info(
+                f"Skipping transcript cleaning: {len(raw_transcript)} chars, "
+                f"already punctuated"
+            )
+            return raw_transcript
+
         try:
             logger.info("Starting transcript cleaning")
             
@@ -46,12 +97,18 @@ class BatchCleanerService:
             
             logger.info(f"Processing {len(chunked_lines)} chunks")
             
-            # Clean each chunk
-            cleaned_chunks = []
-            for i, chunk in enumerate(chunked_lines):
-                logger.info(f"Cleaning chunk {i+1}/{len(chunked_lines)}")
-                cleaned_chunk = await self._clean_chunk(chunk)
-                cleaned_chunks.append(cleaned_chunk)
+            # Clean chunks concurrently (bounded); gather keeps input order.
+            # _clean_chunk falls back to the raw chunk on its own failure.
+            semaphore = asyncio.Semaphore(self.max_concurrent_chunks)
+
+            async def _clean(i: int, chunk: str) -> str:
+                async with semaphore:
+                    logger.info(f"Cleaning chunk {i+1}/{len(chunked_lines)}")
+                    return await self._clean_chunk(chunk)
+
+            cleaned_chunks = await asyncio.gather(
+                *(_clean(i, chunk) for i, chunk in enumerate(chunked_lines))
+            )
             
             # Join cleaned chunks with newlines
             cleaned_transcript = '\n'.join(cleaned_chunks)
@@ -76,18 +133,18 @@ class BatchCleanerService:
             Cleaned text
         """
         try:
-            system_prompt = self._get_system_prompt()
-            
-            # Use OpenAI's Structured Outputs for reliable JSON parsing
+            # Use OpenAI's Structured Outputs for reliable JSON parsing.
+            # Static system prefix first, transcript chunk last.
             completion = await self.client.beta.chat.completions.parse(
                 model=self.model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    self._system_message,
                     {"role": "user", "content": chunk}
                 ],
                 response_format=CleanedChunk,
                 temperature=0.5,
-                timeout=60
+                timeout=60,
+                extra_body={"prompt_cache_key": self._prompt_cache_key},
             )
             
             # Access the parsed object directly (guaranteed valid)
@@ -1,13 +1,104 @@
 """BatchService for Deepgram prerecorded API integration with speaker diarization."""
+import asyncio
 import os
 import logging
+import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, BinaryIO, Callable, Optional, Union
+
+import aiohttp
 from deepgram import Deepgram
 
 logger = logging.getLogger(__name__)
 
 
+class DeepgramUnavailableError(Exception):
+    """Raised without calling Deepgram while the circuit breaker is open.
+
+    ``retry_after_s`` is how long until the breaker lets a probe through;
+    HTTP callers surface it as a 503 ``Retry-After``.
+    """
+
+    def __init__(self, retry_after_s: float):
+        super().__init__(f"Deepgram circuit open; retry in {retry_after_s:.0f}s")
+        self.retry_after_s = retry_after_s
+
+
+def _is_deepgram_outage(exc: BaseException) -> bool:
+    """True when a failed call says Deepgram is unhealthy rather than the request bad.
+
+    429s, 5xx responses, transport errors and timeouts count; a 4xx for an
+    unreadable file or an error body on a 200 does not.
+    """
+    http_error = getattr(exc, "http_library_error", None) or exc
+    status = getattr(http_error, "status", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    return isinstance(http_error, (aiohttp.ClientError, asyncio.TimeoutError))
+
+
+class DeepgramCircuitBreaker:
+    """Consecutive-failure circuit breaker for Deepgram prerecorded calls.
+
+    After ``failure_threshold`` consecutive outage failures the breaker
+    opens and :meth:`before_call` raises :class:`DeepgramUnavailableError`
+    for ``reset_timeout_s``. Then a single probe call is let through
+    (half-open): success closes the breaker, another outage failure
+    re-opens it for a fresh timeout. State is only touched between awaits,
+    so no lock is needed on the event loop.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        reset_timeout_s: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout_s = reset_timeout_s
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._probe_in_flight = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self) -> None:
+        """Raise if calls are currently being shed; otherwise admit the call."""
+        if self._opened_at is None:
+            return
+        remaining = self._opened_at + self.reset_timeout_s - self._clock()
+        if remaining > 0 or self._probe_in_flight:
+            raise DeepgramUnavailableError(retry_after_s=max(remaining, 1.0))
+        self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        """Deepgram answered (including a non-outage error): close the breaker."""
+        if self._opened_at is not None:
+            logger.info("Deepgram circuit breaker closed after successful probe")
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Count an outage failure, opening the breaker at the threshold."""
+        self._probe_in_flight = False
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            logger.warning(
+                f"Deepgram circuit breaker open: "
+                f"consecutive_failures={self._consecutive_failures}, "
+                f"shedding calls for {self.reset_timeout_s:.0f}s"
+            )
+
+    def record_abandoned(self) -> None:
+        """The admitted call was cancelled before an outcome; free the probe."""
+        self._probe_in_flight = False
+
+
 @dataclass
 class TranscriptionResult:
     """Result from Deepgram transcription with diagnostic metadata."""
@@ -27,28 +118,66 @@ class BatchService:
             raise ValueError("DEEPGRAM_API_KEY environment variable is required")
         
         self.client = Deepgram(api_key)
-        logger.info("BatchService initialized")
+        # Deepgram caps concurrent requests per account (shared with the
+        # live /listen streams), so bound this instance's prerecorded calls
+        # below that cap; excess calls queue here instead of being rejected.
+        self.max_concurrency = max(1, int(os.getenv("DEEPGRAM_MAX_CONCURRENCY", "80")))
+        self._deepgram_slots = asyncio.Semaphore(self.max_concurrency)
+        self.breaker = DeepgramCircuitBreaker(
+            failure_threshold=int(os.getenv("DEEPGRAM_BREAKER_FAILURES", "5")),
+            reset_timeout_s=float(os.getenv("DEEPGRAM_BREAKER_RESET_SECONDS", "30")),
+        )
+        logger.info(f"BatchService initialized with max_concurrency={self.max_concurrency}")
+
+    async def _prerecorded(self, source: dict, options: dict) -> Any:
+        """Call Deepgram's prerecorded API behind the concurrency cap and breaker.
+
+        Raises:
+            DeepgramUnavailableError: If the circuit breaker is open.
+        """
+        self.breaker.before_call()
+        try:
+            async with self._deepgram_slots:
+                response = await self.client.transcription.prerecorded(source, options)
+        except asyncio.CancelledError:
+            self.breaker.record_abandoned()
+            raise
+        except Exception as e:
+            if _is_deepgram_outage(e):
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+            raise
+        self.breaker.record_success()
+        return response
     
-    async def transcribe_audio(self, audio_bytes: bytes, mimetype: str) -> str:
+    async def transcribe_audio(self, audio: Union[bytes, BinaryIO], mimetype: str) -> str:
         """
         Transcribe audio with diarization and return formatted transcript.
 
         Args:
-            audio_bytes: Raw audio file bytes
+            audio: Raw audio bytes, or a binary file object positioned at the
+                start of the audio. File objects (e.g. an upload's spooled
+                temp file) are streamed to Deepgram in chunks instead of
+                being loaded into memory first.
             mimetype: MIME type (audio/wav, audio/mpeg, etc.)
 
         Returns:
             Formatted transcript with speaker labels (SPEAKER_X: text)
 
         Raises:
+            DeepgramUnavailableError: If the Deepgram circuit breaker is open
             Exception: If Deepgram API call fails
         """
         try:
-            logger.info(f"Starting Deepgram transcription, mimetype={mimetype}, size={len(audio_bytes)} bytes")
+            source_label = "buffer" if isinstance(audio, (bytes, bytearray)) else "stream"
+            size = len(audio) if source_label == "buffer" else "unknown"
+            logger.info(f"Starting Deepgram transcription, mimetype={mimetype}, source={source_label}, size={size} bytes")
 
-            # Configure source and options for SDK v2
+            # Configure source and options for SDK v2. The SDK hands the
+            # buffer to aiohttp as-is, which streams file objects.
             source = {
-                'buffer': audio_bytes,
+                'buffer': audio,
                 'mimetype': mimetype
             }
 
@@ -59,16 +188,18 @@ class BatchService:
             }
 
             # Call Deepgram API (SDK v2 syntax)
-            response = await self.client.transcription.prerecorded(source, options)
+            response = await self._prerecorded(source, options)
 
             # Log Deepgram response metadata for diagnostics
-            self._log_deepgram_metadata(response, source_label="buffer")
+            self._log_deepgram_metadata(response, source_label=source_label)
 
             # Format response into SPEAKER_X: text format
             formatted_transcript = self._format_deepgram_response(response)
 
             return formatted_transcript
 
+        except DeepgramUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Deepgram transcription failed: {e}", exc_info=True)
             raise
@@ -105,7 +236,7 @@ class BatchService:
             }
 
             # Call Deepgram API with URL source (SDK v2 syntax)
-            response = await self.client.transcription.prerecorded(source, options)
+            response = await self._prerecorded(source, options)
 
             # Log and extract Deepgram response metadata
             meta = self._log_deepgram_metadata(response, source_label="url")
@@ -120,6 +251,8 @@ class BatchService:
                 words=meta.get("words", 0),
             )
 
+        except DeepgramUnavailableError:
+            raise
         except Exception as e:
             logger.error(f"Deepgram URL transcription failed: {e}", exc_info=True)
             raise
@@ -19,6 +19,32 @@ logger = logging.getLogger(__name__)
 _engine: AsyncEngine | None = None
 _async_session_maker: sessionmaker | None = None
 
+# Pool sizing, env-overridable. Upload-job writes, Lane 2 persistence and
+# the status routes share this pool; 10 + 20 overflow covers concurrent
+# bursts without queueing on checkout. The engine sits behind Neon's
+# PgBouncer endpoint, so these are client-side connections, not backends.
+_DEFAULT_POOL_SIZE = 10
+_DEFAULT_MAX_OVERFLOW = 20
+
+
+def _int_env(name: str, default: int) -> int:
+    """Read a non-negative integer setting, falling back to ``default``.
+
+    A malformed value logs a warning instead of failing engine creation.
+    """
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={raw!r}; using {default}")
+        return default
+    if value < 0:
+        logger.warning(f"Ignoring negative {name}={raw!r}; using {default}")
+        return default
+    return value
+
 
 def get_database_url() -> tuple[str, dict]:
     """Get and validate DATABASE_URL from environment.
@@ -85,6 +111,7 @@ def get_engine() -> AsyncEngine:
     """Get or create the async database engine.
     
     Uses connection pool settings appropriate for serverless environments.
+    Pool size and overflow come from ``DB_POOL_SIZE`` / ``DB_MAX_OVERFLOW``.
     
     Returns:
         The AsyncEngine instance.
@@ -97,9 +124,11 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             database_url,
             pool_pre_ping=True,  # Verify connections before use
-            pool_size=5,  # Base pool size
-            max_overflow=10,  # Allow up to 15 total connections
-            pool_recycle=300,  # Recycle connections every 5 minutes
+            pool_size=_int_env("DB_POOL_SIZE", _DEFAULT_POOL_SIZE),
+            max_overflow=_int_env("DB_MAX_OVERFLOW", _DEFAULT_MAX_OVERFLOW),
+            # Kept short: Neon suspends idle compute, so long-lived
+            # connections mostly come back dead and fail the pre-ping.
+            pool_recycle=300,
             echo=False,  # Set to True for SQL debugging
             connect_args=connect_args,  # SSL and other connection args
         )
@@ -107,8 +136,6 @@ def get_engine() -> AsyncEngine:
         logger.info("Database engine created successfully")
     
     return _engine
-    
-    return _engine
 
 
 def get_session_maker() -> sessionmaker:
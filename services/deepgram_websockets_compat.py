@@ -13,20 +13,37 @@ separate work item with its own review surface.
 
 This shim wraps ``websockets.connect`` to translate the legacy kwarg.
 Idempotent on repeated imports. Remove when ``deepgram-sdk`` upgrades.
+
+Since it already intercepts every Deepgram live-socket connect, the shim
+also supplies one process-wide ``ssl.SSLContext`` for ``wss://`` URIs.
+Live transcription sockets are one long-lived WebSocket per session, so
+there is no connection pool to share; without an explicit context,
+``websockets`` builds a fresh default context (re-loading the CA bundle)
+on every session setup.
 """
 
 from __future__ import annotations
 
+import functools
+import ssl
+
 import websockets
 
 
+@functools.lru_cache(maxsize=1)
+def _shared_ssl_context() -> ssl.SSLContext:
+    """Default client TLS context, built once and reused across sessions."""
+    return ssl.create_default_context()
+
+
 def _wrap_websockets_connect() -> None:
     """Replace ``websockets.connect`` with a kwarg-translating wrapper.
 
     Calls with ``extra_headers=...`` get rewritten to
     ``additional_headers=...`` before delegating to the real connect.
     If ``additional_headers`` is already present, ``extra_headers`` is
-    dropped silently (the caller already migrated).
+    dropped silently (the caller already migrated). ``wss://`` connects
+    without an explicit ``ssl`` get the shared TLS context.
     """
     real = websockets.connect
     if getattr(real, "_deepgram_compat_wrapper", False):
@@ -36,6 +53,8 @@ def _wrap_websockets_connect() -> None:
         if "extra_headers" in kwargs:
             legacy = kwargs.pop("extra_headers")
             kwargs.setdefault("additional_headers", legacy)
+        if "ssl" not in kwargs and args and str(args[0]).startswith("wss://"):
+            kwargs["ssl"] = _shared_ssl_context()
         return real(*args, **kwargs)
 
     _connect_compat._deepgram_compat_wrapper = True  # type: ignore[attr-defined]
@@ -1,12 +1,32 @@
 import redis.asyncio as redis
+import asyncio
 import json
 import os
 import logging
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Dict
 
 logger = logging.getLogger(__name__)
 
+# Finalized transcript writes are buffered in memory and flushed to Redis in
+# one non-transactional pipeline once REDIS_BATCH_SIZE events are pending or
+# REDIS_FLUSH_INTERVAL_MS has elapsed, whichever comes first.
+REDIS_BATCH_SIZE = int(os.getenv("REDIS_BATCH_SIZE", "50"))
+REDIS_FLUSH_INTERVAL_MS = int(os.getenv("REDIS_FLUSH_INTERVAL_MS", "100"))
+
+# TTL applied to per-session transcript streams (24 hours)
+SESSION_TRANSCRIPT_TTL_S = 86400
+
+# Per-session transcript storage. Each session gets its own Redis Stream;
+# entries carry either a plain transcript chunk ("t") or a structured
+# desktop segment as JSON ("seg"). Sessions written by older builds used a
+# Redis List under SESSION_LIST_KEY, which get_final_transcript still reads;
+# drop that fallback once every instance has run the stream build for longer
+# than SESSION_TRANSCRIPT_TTL_S, after which no List keys can exist.
+SESSION_STREAM_KEY = "transcript:{session_id}"
+SESSION_LIST_KEY = "session:{session_id}:transcript"
+
+
 class EventPublisher:
     def __init__(self):
         redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
@@ -17,6 +37,92 @@ class EventPublisher:
             socket_connect_timeout=5
         )
         self.stream_name = "transcription_events"
+
+        # Pending writes, drained by flush(). Stream entries keep publish
+        # order; per-session entries are grouped per session and keep
+        # publish order within a session.
+        self._pending_stream: List[dict] = []
+        self._pending_sessions: Dict[str, List[Dict[str, str]]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: Optional[asyncio.Task] = None
+
+    def _enqueue(
+        self,
+        event_data: dict,
+        session_id: Optional[str],
+        session_entry: Dict[str, str],
+    ) -> bool:
+        """Buffer one stream entry (+ per-session entry when session-scoped).
+
+        Returns True when the buffer has reached REDIS_BATCH_SIZE and the
+        caller should flush immediately.
+        """
+        self._pending_stream.append(event_data)
+        if session_id:
+            self._pending_sessions.setdefault(session_id, []).append(session_entry)
+
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+        return len(self._pending_stream) >= REDIS_BATCH_SIZE
+
+    async def _flush_loop(self) -> None:
+        """Periodically flush buffered writes; exits once the buffer is idle."""
+        while True:
+            await asyncio.sleep(REDIS_FLUSH_INTERVAL_MS / 1000)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Periodic Redis flush failed: error={e}")
+            if not self._pending_stream:
+                return
+
+    async def flush(self) -> None:
+        """Write all buffered shared-stream and per-session entries in one pipeline.
+
+        Uses a non-transactional pipeline so a single failed command does
+        not abort the others — matches the previous dual-write semantics
+        where the two writes were attempted independently.
+        """
+        async with self._flush_lock:
+            if not self._pending_stream and not self._pending_sessions:
+                return
+
+            stream_entries = self._pending_stream
+            session_entries = self._pending_sessions
+            self._pending_stream = []
+            self._pending_sessions = {}
+
+            try:
+                pipe = self.redis_client.pipeline(transaction=False)
+                for event_data in stream_entries:
+                    pipe.xadd(self.stream_name, event_data, maxlen=10000)
+                for session_id, entries in session_entries.items():
+                    # No MAXLEN here: trimming would silently drop the start
+                    # of a long meeting. The TTL bounds the key instead.
+                    session_key = SESSION_STREAM_KEY.format(session_id=session_id)
+                    for entry in entries:
+                        pipe.xadd(session_key, entry)
+                    pipe.expire(session_key, SESSION_TRANSCRIPT_TTL_S)
+                results = await pipe.execute(raise_on_error=False)
+            except redis.RedisError as e:
+                logger.error(
+                    f"Redis batch write failed: events={len(stream_entries)}, "
+                    f"sessions={len(session_entries)}, error={e}"
+                )
+                return
+
+            errors = [r for r in results if isinstance(r, Exception)]
+            if errors:
+                logger.error(
+                    f"Redis batch write partially failed: "
+                    f"failed_commands={len(errors)}/{len(results)}, error={errors[0]}"
+                )
+            else:
+                logger.info(
+                    f"Flushed transcript batch: events={len(stream_entries)}, "
+                    f"sessions={len(session_entries)}"
+                )
     
     async def publish_transcript_event(
         self, 
@@ -25,7 +131,10 @@ class EventPublisher:
         tenant_id: Optional[str] = None,
         session_id: Optional[str] = None
     ):
-        """Publish completed transcript to Redis Stream and List (dual-write)"""
+        """Publish completed transcript to the shared and per-session Streams (dual-write).
+
+        Writes are buffered and flushed in batches; see ``flush``.
+        """
         event_data = {
             "event_type": "transcript_completed",
             "transcript": transcript,
@@ -39,26 +148,10 @@ class EventPublisher:
         if session_id:
             event_data["session_id"] = session_id
         
-        # Dual-write: Stream write (real-time)
-        try:
-            await self.redis_client.xadd(
-                self.stream_name,
-                event_data,
-                maxlen=10000
-            )
-            logger.info(f"Published transcript to stream: session_id={session_id}")
-        except redis.RedisError as e:
-            logger.error(f"Stream write failed: session_id={session_id}, error={e}")
-        
-        # Dual-write: List write (persistence)
-        if session_id:
-            try:
-                list_key = f"session:{session_id}:transcript"
-                await self.redis_client.rpush(list_key, transcript)
-                await self.redis_client.expire(list_key, 86400)  # 24 hour TTL
-                logger.info(f"Appended transcript to list: session_id={session_id}")
-            except redis.RedisError as e:
-                logger.error(f"List write failed: session_id={session_id}, error={e}")
+        # Dual-write (shared stream for real-time, per-session stream for
+        # persistence) is buffered and flushed as a single pipeline round-trip.
+        if self._enqueue(event_data, session_id, {"t": transcript}):
+            await self.flush()
     
     async def publish_structured_segment(
         self,
@@ -73,7 +166,7 @@ class EventPublisher:
     ):
         """Publish a structured transcript segment for desktop multichannel sessions.
 
-        Stores JSON segments in Redis List for later assembly into a diarized
+        Stores JSON segments in the per-session Stream for later assembly into a diarized
         transcript. Each segment includes channel, speaker label, timestamp,
         and confidence score.
         """
@@ -100,47 +193,49 @@ class EventPublisher:
         if session_id:
             event_data["session_id"] = session_id
 
-        try:
-            await self.redis_client.xadd(
-                self.stream_name,
-                event_data,
-                maxlen=10000
-            )
-        except redis.RedisError as e:
-            logger.error(f"Stream write failed: session_id={session_id}, error={e}")
-
-        # List write (structured JSON segment)
-        if session_id:
-            try:
-                list_key = f"session:{session_id}:transcript"
-                await self.redis_client.rpush(list_key, segment)
-                await self.redis_client.expire(list_key, 86400)
-            except redis.RedisError as e:
-                logger.error(f"List write failed: session_id={session_id}, error={e}")
+        # Shared stream write + per-session segment write, buffered
+        if self._enqueue(event_data, session_id, {"seg": segment}):
+            await self.flush()
 
     async def get_final_transcript(self, session_id: str) -> str:
-        """Retrieve and reconstruct full session transcript from Redis List.
+        """Retrieve and reconstruct full session transcript from its Redis Stream.
 
         Handles both plain string chunks (legacy browser sessions) and
-        structured JSON segments (desktop multichannel sessions).
+        structured JSON segments (desktop multichannel sessions). Falls back
+        to the pre-Streams Redis List for sessions written by older builds.
         """
-        try:
-            list_key = f"session:{session_id}:transcript"
-            chunks = await self.redis_client.lrange(list_key, 0, -1)
+        # Make sure every buffered chunk for this session has landed first
+        await self.flush()
 
-            if not chunks:
-                logger.warning(f"No transcript chunks found: session_id={session_id}")
-                return ""
+        try:
+            session_key = SESSION_STREAM_KEY.format(session_id=session_id)
+            list_key = SESSION_LIST_KEY.format(session_id=session_id)
+            entries = await self.redis_client.xrange(session_key, "-", "+")
 
-            # Detect format: structured JSON segments start with '{'
-            if chunks[0].startswith('{'):
-                full_transcript = self._assemble_diarized_transcript(chunks)
+            if entries:
+                # Stream entries are tagged, so no content sniffing is needed
+                segments = [fields["seg"] for _, fields in entries if "seg" in fields]
+                if segments:
+                    full_transcript = self._assemble_diarized_transcript(segments)
+                else:
+                    full_transcript = " ".join(fields.get("t", "") for _, fields in entries)
+                chunk_count = len(entries)
             else:
-                full_transcript = " ".join(chunks)
+                chunks = await self.redis_client.lrange(list_key, 0, -1)
+                if not chunks:
+                    logger.warning(f"No transcript chunks found: session_id={session_id}")
+                    return ""
+
+                # Detect format: structured JSON segments start with '{'
+                if chunks[0].startswith('{'):
+                    full_transcript = self._assemble_diarized_transcript(chunks)
+                else:
+                    full_transcript = " ".join(chunks)
+                chunk_count = len(chunks)
 
-            # Cleanup: delete the list after retrieval
-            await self.redis_client.delete(list_key)
-            logger.info(f"Retrieved and cleaned up transcript: session_id={session_id}, chunks={len(chunks)}")
+            # Cleanup: delete the session keys after retrieval
+            await self.redis_client.delete(session_key, list_key)
+            logger.info(f"Retrieved and cleaned up transcript: session_id={session_id}, chunks={chunk_count}")
 
             return full_transcript
 
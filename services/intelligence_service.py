@@ -12,10 +12,10 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 import instructor
-from sqlalchemy import text as sa_text
+from sqlalchemy import insert, text as sa_text
 from sqlmodel import select
 
-from models.extraction_models import InteractionAnalysis
+from models.extraction_models import InteractionAnalysis, RiskSeverityEnum
 from models.db_models import (
     PersonaModel,
     InteractionSummaryEntryModel,
@@ -24,12 +24,28 @@ from models.db_models import (
     ProfileTypeEnum,
     InsightTypeEnum,
     RiskSeverityDBEnum,
+    default_loader_options,
 )
 from services.database import get_async_session
 from services.tenant_scope import tenant_session
 
 logger = logging.getLogger(__name__)
 
+# content_hash is part of the interaction_insights idempotency key, so its
+# value must stay SHA-256("{type}:{content}") to keep matching rows already
+# written. The "{type}:" prefix is hashed once per insight type here; each
+# insight then only hashes its own content on a copy of that state.
+_CONTENT_HASH_PREFIXES = {
+    insight_type.value: hashlib.sha256(f"{insight_type.value}:".encode())
+    for insight_type in InsightTypeEnum
+}
+
+# Extraction severity -> DB severity, resolved once instead of a by-value
+# enum lookup per risk row.
+_RISK_SEVERITY_TO_DB = {
+    severity: RiskSeverityDBEnum(severity.value) for severity in RiskSeverityEnum
+}
+
 
 def _to_naive_utc(dt: Optional[datetime]) -> datetime:
     """Normalize an event-time for the naive TIMESTAMP columns Lane 2 writes.
@@ -247,7 +263,9 @@ Do not invent or assume information not stated."""
             ValueError: If persona not found.
         """
         result = await session.execute(
-            select(PersonaModel).where(PersonaModel.code == persona_code)
+            select(PersonaModel)
+            .options(*default_loader_options)
+            .where(PersonaModel.code == persona_code)
         )
         persona = result.scalar_one_or_none()
         
@@ -266,8 +284,12 @@ Do not invent or assume information not stated."""
         Returns:
             Hex digest of the hash.
         """
-        hash_input = f"{insight_type}:{content}"
-        return hashlib.sha256(hash_input.encode()).hexdigest()
+        prefix = _CONTENT_HASH_PREFIXES.get(insight_type)
+        if prefix is None:
+            return hashlib.sha256(f"{insight_type}:{content}".encode()).hexdigest()
+        digest = prefix.copy()
+        digest.update(content.encode())
+        return digest.hexdigest()
 
     
     async def _persist_intelligence(
@@ -310,7 +332,19 @@ Do not invent or assume information not stated."""
                 tenant_uuid = UUID(tenant_id)
                 trace_uuid = UUID(trace_id)
                 account_uuid = UUID(account_id) if account_id else None
+
+                # One clock read for every row in this batch instead of two
+                # default_factory calls per model; rows from one analysis
+                # share created_at/updated_at.
+                row_time = datetime.utcnow()
+                timestamps = {"created_at": row_time, "updated_at": row_time}
                 
+                # Rows are built as models (defaults + validation) and written
+                # with one multi-row INSERT per table rather than one ORM
+                # flush per object.
+                summary_rows: list[InteractionSummaryEntryModel] = []
+                insight_rows: list[InteractionInsightModel] = []
+
                 # Create summary entries (exactly 5, one per level)
                 summary_mappings = [
                     (SummaryLevelEnum.title, analysis.summaries.title),
@@ -334,8 +368,9 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(summary_entry)
+                    summary_rows.append(summary_entry)
                 
                 # Create insight entries for action items
                 for item in analysis.action_items:
@@ -352,8 +387,9 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(insight)
+                    insight_rows.append(insight)
                 
                 # Create insight entries for decisions
                 for item in analysis.decisions:
@@ -369,12 +405,13 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(insight)
+                    insight_rows.append(insight)
                 
                 # Create insight entries for risks
                 for item in analysis.risks:
-                    severity_db = RiskSeverityDBEnum(item.severity.value) if item.severity else None
+                    severity_db = _RISK_SEVERITY_TO_DB[item.severity] if item.severity else None
                     insight = InteractionInsightModel(
                         tenant_id=tenant_uuid,
                         interaction_id=interaction_uuid,
@@ -388,8 +425,9 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(insight)
+                    insight_rows.append(insight)
                 
                 # Create insight entries for key takeaways
                 for text in analysis.key_takeaways:
@@ -404,8 +442,9 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(insight)
+                    insight_rows.append(insight)
                 
                 # Create insight entries for product feedback (DIRECT mapping)
                 for item in analysis.product_feedback:
@@ -420,8 +459,9 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(insight)
+                    insight_rows.append(insight)
                 
                 # Create insight entries for market intelligence (DIRECT mapping)
                 for item in analysis.market_intelligence:
@@ -436,13 +476,24 @@ Do not invent or assume information not stated."""
                         interaction_type=interaction_type,
                         account_id=account_uuid,
                         interaction_timestamp=interaction_timestamp,
+                        **timestamps,
                     )
-                    session.add(insight)
+                    insight_rows.append(insight)
                 
+                await session.execute(
+                    insert(InteractionSummaryEntryModel),
+                    [row.model_dump() for row in summary_rows],
+                )
+                if insight_rows:
+                    await session.execute(
+                        insert(InteractionInsightModel),
+                        [row.model_dump() for row in insight_rows],
+                    )
+
                 # tenant_session owns the transaction; it commits on block exit.
                 logger.info(
                     f"Persisted intelligence: interaction_id={interaction_id}, "
-                    f"summaries=5, insights={len(analysis.action_items) + len(analysis.decisions) + len(analysis.risks) + len(analysis.key_takeaways) + len(analysis.product_feedback) + len(analysis.market_intelligence)}"
+                    f"summaries={len(summary_rows)}, insights={len(insight_rows)}"
                 )
                 
             except Exception as e:
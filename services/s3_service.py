@@ -32,13 +32,22 @@ PUT_URL_EXPIRY_SECONDS = 300  # 5 minutes for upload
 GET_URL_EXPIRY_SECONDS = 3600  # 1 hour for Deepgram to fetch
 
 
+def _tenant_upload_prefix(tenant_id: str) -> str:
+    """Key prefix under which every upload for ``tenant_id`` is stored."""
+    return f"tenant/{tenant_id}/uploads/"
+
+
 class S3ServiceError(Exception):
     """Raised when S3 operations fail."""
     pass
 
 
 class S3Service:
-    """S3 service for presigned URL generation and object verification."""
+    """S3 service for presigned URL generation and object verification.
+
+    Holds only configuration and a thread-safe boto3 client; callers share
+    one instance via :func:`services.shared_instances.shared`.
+    """
 
     def __init__(self):
         """Initialize S3 client with configured bucket and region."""
@@ -49,7 +58,9 @@ class S3Service:
         config = Config(
             region_name=self.region,
             signature_version='s3v4',
-            retries={'max_attempts': 3, 'mode': 'standard'}
+            retries={'max_attempts': 3, 'mode': 'standard'},
+            max_pool_connections=int(os.getenv("AWS_MAX_POOL_CONNECTIONS", "64")),
+            tcp_keepalive=True,
         )
 
         self.client = boto3.client('s3', config=config)
@@ -89,7 +100,7 @@ class S3Service:
             else:
                 safe_filename = safe_filename[:100]
 
-        return f"tenant/{tenant_id}/uploads/{job_id}/{safe_filename}"
+        return f"{_tenant_upload_prefix(tenant_id)}{job_id}/{safe_filename}"
 
     def generate_presigned_put_url(
         self,
@@ -230,7 +241,10 @@ class S3Service:
     def validate_key_belongs_to_tenant(self, file_key: str, tenant_id: str) -> bool:
         """Validate that a file key belongs to the specified tenant.
 
-        Security check to prevent cross-tenant access.
+        Security check to prevent cross-tenant access. A plain prefix
+        comparison against the same ``tenant/{tenant_id}/uploads/`` prefix
+        :meth:`generate_file_key` writes under, so only keys this service
+        could have issued to the tenant pass.
 
         Args:
             file_key: S3 object key
@@ -239,5 +253,4 @@ class S3Service:
         Returns:
             True if key belongs to tenant, False otherwise
         """
-        expected_prefix = f"tenant/{tenant_id}/"
-        return file_key.startswith(expected_prefix)
+        return file_key.startswith(_tenant_upload_prefix(tenant_id))
@@ -0,0 +1,59 @@
+"""Event-loop-scoped shared instances of the stateless pipeline services.
+
+``BatchService``, ``BatchCleanerService``, ``AWSEventPublisher``,
+``IntelligenceService`` and ``S3Service`` hold only configuration plus SDK
+clients (Deepgram, AsyncOpenAI / instructor, boto3). Building them per request re-resolves AWS
+credentials, creates fresh boto3 clients and throws away the OpenAI HTTP
+connection pool every time, and gives ``AWSEventPublisher``'s PutEvents
+batcher nothing to coalesce across requests. :func:`shared` builds each
+class once and hands back the same instance afterwards.
+
+Instances are scoped to the running event loop rather than the process:
+the async HTTP clients and the PutEvents batcher's futures are bound to the
+loop they were first used on, and DBOS runs async workflows (Granola
+ingestion -> ``text_clean_service.process``) on its own background loop.
+The registry is weakly keyed by loop, so a closed loop's instances are
+released with it (pytest-asyncio and ``TestClient`` open a loop per test).
+
+Call sites pass the class as imported into their own module, so
+``patch("routers.batch.BatchService")`` in tests still takes effect. A
+constructor that raises is not cached; the next call retries.
+"""
+import asyncio
+import threading
+import weakref
+from typing import Any, Dict, Type, TypeVar
+
+T = TypeVar("T")
+
+_instances_by_loop: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Any, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_lock = threading.Lock()
+
+
+def shared(cls: Type[T]) -> T:
+    """Return this event loop's instance of ``cls``, constructing it on first use.
+
+    Must be called from a coroutine (a running event loop is required).
+    """
+    loop = asyncio.get_running_loop()
+    instances = _instances_by_loop.get(loop)
+    if instances is not None:
+        instance = instances.get(cls)
+        if instance is not None:
+            return instance
+
+    with _lock:
+        instances = _instances_by_loop.setdefault(loop, {})
+        instance = instances.get(cls)
+        if instance is None:
+            instance = cls()
+            instances[cls] = instance
+        return instance
+
+
+def _reset_for_tests() -> None:
+    """Drop every cached instance (all loops)."""
+    with _lock:
+        _instances_by_loop.clear()
@@ -16,7 +16,8 @@ infrastructure:
 * the synchronous Lane 1 publish via :class:`AWSEventPublisher.publish_envelope`,
 * the fire-and-forget Lane 2 dispatch of
   :meth:`IntelligenceService.process_transcript` with the same
-  exception-routing + ``_on_done`` safety net the route handler used to inline.
+  exception-routing + ``_on_done`` safety net the route handler used to inline
+  (:func:`dispatch_lane2`, also used by ``/batch/process``).
 
 The Granola ingestion adapter (Phase 2d, PR-X2) calls :func:`process` directly
 from Python (NOT over HTTP per **LOCKED-41** — Railway's ~5-minute edge proxy
@@ -67,12 +68,13 @@ import asyncio
 import logging
 import os as _os
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Coroutine, Optional
 from uuid import UUID
 
 from models.envelope import EnvelopeV1
 from services.aws_event_publisher import AWSEventPublisher
 from services.intelligence_service import IntelligenceService
+from services.shared_instances import shared
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +150,64 @@ def release_lane2_slot() -> None:
     _INFLIGHT_LANE2[0] -= 1
 
 
+def dispatch_lane2(coro: Coroutine[Any, Any, Any], *, interaction_id: str) -> asyncio.Task:
+    """Run ``coro`` as a tracked Lane 2 background task, consuming a reserved slot.
+
+    The caller must hold a slot from :func:`try_reserve_lane2_slot`; from
+    the moment this returns, the slot belongs to the task and is released
+    by its done-callback. The task is registered in ``_BACKGROUND_TASKS``
+    so it is neither garbage-collected mid-flight nor skipped by the
+    shutdown drain. If the task cannot be created, ``coro`` is closed and
+    the error propagates with the slot still owned by the caller.
+
+    Used by :func:`process` and by ``/batch/process``, which keeps its own
+    non-fatal Lane 1 and hands only intelligence extraction to the
+    background.
+    """
+    def _on_done(task: asyncio.Task) -> None:
+        """Wrapper-level safety net for the Lane 2 background task.
+
+        Releases the Lane 2 backpressure slot AND surfaces wrapper-level
+        crashes (anything raised by Python machinery around the
+        coroutine that it didn't itself catch).
+        Under the pre-fire-and-forget synchronous-await model, such
+        failures became HTTP 5xx and were observable; after moving to
+        background, they MUST surface as a logger.error here or Python
+        only emits a "Task exception was never retrieved" GC warning
+        (invisible in production observability).
+        """
+        _BACKGROUND_TASKS.discard(task)
+        _INFLIGHT_LANE2[0] -= 1
+        if task.cancelled():
+            logger.warning(
+                f"Lane 2 background task cancelled: "
+                f"interaction_id={interaction_id}"
+            )
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error(
+                f"Lane 2 background task crashed (unhandled): "
+                f"interaction_id={interaction_id}, "
+                f"error={type(exc).__name__}: {exc}",
+                exc_info=exc,
+            )
+        else:
+            logger.info(
+                f"Lane 2 (intelligence) completed: "
+                f"interaction_id={interaction_id}"
+            )
+
+    try:
+        task = asyncio.create_task(coro)
+    except BaseException:
+        coro.close()
+        raise
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_on_done)
+    return task
+
+
 @dataclass(frozen=True)
 class Lane2Extras:
     """Optional Lane 2 inputs that don't live in :class:`EnvelopeV1` itself.
@@ -175,6 +235,9 @@ class Lane2Extras:
     enrichment_match_method: Optional[str] = None
 
 
+_NO_LANE2_EXTRAS = Lane2Extras()
+
+
 @dataclass(frozen=True)
 class ProcessResult:
     """Return value from :func:`process`.
@@ -258,6 +321,53 @@ def _check_envelope_identity(
         )
 
 
+async def _lane2_intelligence(
+    envelope: EnvelopeV1,
+    interaction_id: str,
+    cleaned_transcript: str,
+    lane2_extras: Optional[Lane2Extras],
+) -> Optional[object]:
+    """Run IntelligenceService.process_transcript inside the Lane 2 background task.
+
+    Internal exceptions are logged and re-raised so the ``_on_done``
+    callback can surface them at ERROR level. Pre-extraction this
+    log was in routers/text.py; pinned by
+    ``test_text_clean_lane2_exception_is_logged_not_silenced``.
+    """
+    extras = lane2_extras or _NO_LANE2_EXTRAS
+    try:
+        intelligence_service = shared(IntelligenceService)
+        return await intelligence_service.process_transcript(
+            cleaned_transcript=cleaned_transcript,
+            interaction_id=interaction_id,
+            tenant_id=str(envelope.tenant_id),
+            trace_id=envelope.trace_id or "",
+            interaction_type=envelope.interaction_type,
+            account_id=envelope.account_id,
+            # Single source of event-time: thread the envelope's
+            # timestamp into Lane 2 so raw_interactions /
+            # interaction_summary_entries.interaction_timestamp matches
+            # the envelope (now() for real-time, occurred_at for a
+            # backdated /text/clean, detail.created_at for Granola)
+            # instead of IntelligenceService defaulting to a fresh
+            # utcnow(). Centralizing here fixes every caller — including
+            # the latent Granola drift — in one place (EQ-231 / A2).
+            interaction_timestamp=envelope.timestamp,
+            contact_ids=extras.contact_ids,
+            calendar_event_id=extras.calendar_event_id,
+            enrichment_confidence=extras.enrichment_confidence,
+            enrichment_match_method=extras.enrichment_match_method,
+        )
+    except Exception as exc:
+        logger.error(
+            f"Lane 2 (intelligence) failed (non-fatal, background): "
+            f"interaction_id={interaction_id}, "
+            f"error={type(exc).__name__}: {exc}",
+            exc_info=True,
+        )
+        raise
+
+
 async def process(
     *,
     tenant_id: UUID,
@@ -291,7 +401,7 @@ async def process(
 
     Behavior:
       - Identity cross-check (above) — raises before any side effects.
-      - Lane 1: ``AWSEventPublisher().publish_envelope(envelope)`` is awaited
+      - Lane 1: ``shared(AWSEventPublisher).publish_envelope(envelope)`` is awaited
         synchronously. On exception, :class:`Lane1PublishError` is raised
         AFTER the slot has been internally released — the caller does
         NOT need to release on this path.
@@ -339,7 +449,7 @@ async def process(
         # = false) still returns null/null and is NOT treated as failure
         # — pinned by test_text_clean_allows_null_publish_when_aws_disabled.
         try:
-            publisher = AWSEventPublisher()
+            publisher = shared(AWSEventPublisher)
             lane1_result: Optional[dict[str, Any]] = await publisher.publish_envelope(envelope)
         except Exception as exc:
             logger.error(
@@ -392,97 +502,11 @@ async def process(
         cleaned_transcript: str = (
             extras_cleaned if extras_cleaned is not None else envelope.content.text
         )
-        contact_ids: Optional[list[str]] = lane2_extras.contact_ids if lane2_extras else None
-        calendar_event_id: Optional[str] = (
-            lane2_extras.calendar_event_id if lane2_extras else None
-        )
-        enrichment_confidence: Optional[str] = (
-            lane2_extras.enrichment_confidence if lane2_extras else None
-        )
-        enrichment_match_method: Optional[str] = (
-            lane2_extras.enrichment_match_method if lane2_extras else None
-        )
 
-        # Closures capture interaction_id_str + envelope fields by reference;
-        # Python's lexical scoping makes this safe even across the gap
-        # between create_task and the eventual coroutine execution.
-        async def _lane2_intelligence() -> Optional[object]:
-            """Run IntelligenceService.process_transcript inside the background task.
-
-            Internal exceptions are logged and re-raised so the ``_on_done``
-            callback can surface them at ERROR level. Pre-extraction this
-            log was in routers/text.py; pinned by
-            ``test_text_clean_lane2_exception_is_logged_not_silenced``.
-            """
-            try:
-                intelligence_service = IntelligenceService()
-                return await intelligence_service.process_transcript(
-                    cleaned_transcript=cleaned_transcript,
-                    interaction_id=interaction_id_str,
-                    tenant_id=str(envelope.tenant_id),
-                    trace_id=envelope.trace_id or "",
-                    interaction_type=envelope.interaction_type,
-                    account_id=envelope.account_id,
-                    # Single source of event-time: thread the envelope's
-                    # timestamp into Lane 2 so raw_interactions /
-                    # interaction_summary_entries.interaction_timestamp matches
-                    # the envelope (now() for real-time, occurred_at for a
-                    # backdated /text/clean, detail.created_at for Granola)
-                    # instead of IntelligenceService defaulting to a fresh
-                    # utcnow(). Centralizing here fixes every caller — including
-                    # the latent Granola drift — in one place (EQ-231 / A2).
-                    interaction_timestamp=envelope.timestamp,
-                    contact_ids=contact_ids,
-                    calendar_event_id=calendar_event_id,
-                    enrichment_confidence=enrichment_confidence,
-                    enrichment_match_method=enrichment_match_method,
-                )
-            except Exception as exc:
-                logger.error(
-                    f"Lane 2 (intelligence) failed (non-fatal, background): "
-                    f"interaction_id={interaction_id_str}, "
-                    f"error={type(exc).__name__}: {exc}",
-                    exc_info=True,
-                )
-                raise
-
-        def _on_done(task: asyncio.Task) -> None:
-            """Wrapper-level safety net for the Lane 2 background task.
-
-            Releases the Lane 2 backpressure slot AND surfaces wrapper-level
-            crashes (anything raised by Python machinery around the
-            coroutine that ``_lane2_intelligence`` didn't itself catch).
-            Under the pre-fire-and-forget synchronous-await model, such
-            failures became HTTP 5xx and were observable; after moving to
-            background, they MUST surface as a logger.error here or Python
-            only emits a "Task exception was never retrieved" GC warning
-            (invisible in production observability).
-            """
-            _BACKGROUND_TASKS.discard(task)
-            _INFLIGHT_LANE2[0] -= 1
-            if task.cancelled():
-                logger.warning(
-                    f"Lane 2 background task cancelled: "
-                    f"interaction_id={interaction_id_str}"
-                )
-                return
-            exc = task.exception()
-            if exc is not None:
-                logger.error(
-                    f"Lane 2 background task crashed (unhandled): "
-                    f"interaction_id={interaction_id_str}, "
-                    f"error={type(exc).__name__}: {exc}",
-                    exc_info=exc,
-                )
-            else:
-                logger.info(
-                    f"Lane 2 (intelligence) completed: "
-                    f"interaction_id={interaction_id_str}"
-                )
-
-        task = asyncio.create_task(_lane2_intelligence())
-        _BACKGROUND_TASKS.add(task)
-        task.add_done_callback(_on_done)
+        dispatch_lane2(
+            _lane2_intelligence(envelope, interaction_id_str, cleaned_transcript, lane2_extras),
+            interaction_id=interaction_id_str,
+        )
         # Slot is now consumed by the background task; ``_on_done`` owns
         # the decrement when the task completes. The outer ``finally``
         # leaves the counter alone (slot_handed_off=True).
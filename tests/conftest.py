@@ -206,3 +206,18 @@ async def _teardown_test_tenant_rows(tenant_id: str) -> None:
                 text("DELETE FROM accounts WHERE tenant_id = CAST(:tenant_id AS uuid)"),
                 {"tenant_id": tenant_id},
             )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_service_instances():
+    """Drop cached pipeline services so each test builds its own.
+
+    ``services.shared_instances`` caches per event loop; clearing it
+    guarantees a test that patches e.g. ``boto3`` never sees a client
+    built by an earlier test that happened to share a loop.
+    """
+    from services import shared_instances
+
+    shared_instances._reset_for_tests()
+    yield
+    shared_instances._reset_for_tests()
@@ -291,9 +291,9 @@ def mock_upload_status_session():
     with patch("routers.upload.get_async_session") as mock_session:
         async_session_cm = MagicMock()
         async_session_instance = AsyncMock()
-        # session.execute(...).scalar_one_or_none() → None (job not found)
+        # session.execute(...).one_or_none() → None (job not found)
         result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = None
+        result_mock.one_or_none.return_value = None
         async_session_instance.execute = AsyncMock(return_value=result_mock)
         async_session_cm.__aenter__.return_value = async_session_instance
         async_session_cm.__aexit__.return_value = None
@@ -349,12 +349,12 @@ async def test_worker_deserializes_participants_json_and_forwards_to_enrich():
         captured_enrich_kwargs.update(kwargs)
         return _FakeEnrichment()
 
-    # Session that returns our `job` once for the processing-update fetch,
-    # and again for the success-update fetch. Also tolerates the failure path.
+    # Session whose claiming UPDATE ... RETURNING yields our `job`; the
+    # terminal status UPDATE ignores the result.
     def _make_session_cm():
         sess = MagicMock()
         result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = job
+        result_mock.one_or_none.return_value = job
         sess.execute = AsyncMock(return_value=result_mock)
         sess.commit = AsyncMock()
 
@@ -466,7 +466,7 @@ async def test_worker_passes_none_when_participants_json_is_null():
     def _make_session_cm():
         sess = MagicMock()
         result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = job
+        result_mock.one_or_none.return_value = job
         sess.execute = AsyncMock(return_value=result_mock)
         sess.commit = AsyncMock()
 
@@ -573,7 +573,7 @@ async def test_worker_recovers_from_corrupt_participants_json():
     def _make_session_cm():
         sess = MagicMock()
         result_mock = MagicMock()
-        result_mock.scalar_one_or_none.return_value = job
+        result_mock.one_or_none.return_value = job
         sess.execute = AsyncMock(return_value=result_mock)
         sess.commit = AsyncMock()
 
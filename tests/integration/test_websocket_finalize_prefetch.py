@@ -0,0 +1,112 @@
+"""WebSocket /listen prefetches tenant internal domains during the drain.
+
+The internal-domain lookup depends only on the tenant, so finalization
+starts it before awaiting ``deepgram_socket.finish()`` instead of after the
+transcript has been read back. Deepgram and Redis are replaced with fakes;
+only the ordering of the finalize steps is asserted.
+"""
+
+import asyncio
+import os
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import jwt as pyjwt
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocket, WebSocketDisconnect
+
+# Set JWT test environment BEFORE importing the app so middleware picks it up.
+os.environ.setdefault("INTERNAL_JWT_SECRET", "test-secret-that-is-at-least-32-characters-long")
+os.environ.setdefault("INTERNAL_JWT_ISSUER", "eq-frontend")
+os.environ.setdefault("INTERNAL_JWT_AUDIENCE", "eq-backend")
+
+import main  # noqa: E402
+
+
+def _make_jwt() -> str:
+    now = int(time.time())
+    payload = {
+        "tenant_id": str(uuid.uuid4()),
+        "user_id": "auth0|test-user-ws",
+        "iss": os.environ["INTERNAL_JWT_ISSUER"],
+        "aud": os.environ["INTERNAL_JWT_AUDIENCE"],
+        "iat": now,
+        "exp": now + 300,
+    }
+    return pyjwt.encode(payload, os.environ["INTERNAL_JWT_SECRET"], algorithm="HS256")
+
+
+def test_internal_domains_lookup_overlaps_deepgram_drain():
+    order: list[str] = []
+
+    async def _finish():
+        order.append("finish_start")
+        await asyncio.sleep(0.05)
+        order.append("finish_done")
+
+    deepgram_socket = MagicMock()
+    deepgram_socket.finish = _finish
+
+    async def _domains(tenant_id):
+        order.append("domains_start")
+        return set()
+
+    with patch.object(main, "process_audio", AsyncMock(return_value=deepgram_socket)), \
+         patch.object(main, "get_tenant_internal_domains", _domains), \
+         patch.object(main.event_publisher, "get_final_transcript", AsyncMock(return_value="")):
+        client = TestClient(main.app)
+        with client.websocket_connect(
+            "/listen",
+            headers={"Authorization": f"Bearer {_make_jwt()}", "X-Account-ID": "acct-1"},
+        ) as ws:
+            ws.send_bytes(b"\x00\x01")
+            ws.send_text('{"type": "stop_recording"}')
+            # Empty transcript: the server finalizes and closes the socket.
+            with pytest.raises(WebSocketDisconnect):
+                ws.receive_text()
+
+    assert order.index("domains_start") < order.index("finish_done")
+
+
+def test_internal_domains_lookup_cancelled_when_finalization_fails():
+    order: list[str] = []
+
+    async def _domains(tenant_id):
+        order.append("domains_start")
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            order.append("domains_cancelled")
+            raise
+
+    async def _final_transcript(session_id):
+        await asyncio.sleep(0)
+        raise RuntimeError("redis down")
+
+    real_close = WebSocket.close
+
+    async def _close(self, *args, **kwargs):
+        # Let a requested cancellation land before recording the close.
+        await asyncio.sleep(0)
+        order.append("ws_close")
+        return await real_close(self, *args, **kwargs)
+
+    with patch.object(main, "process_audio", AsyncMock(return_value=MagicMock(finish=AsyncMock()))), \
+         patch.object(main, "get_tenant_internal_domains", _domains), \
+         patch.object(main.event_publisher, "get_final_transcript", _final_transcript), \
+         patch.object(WebSocket, "close", _close):
+        client = TestClient(main.app)
+        with client.websocket_connect(
+            "/listen",
+            headers={"Authorization": f"Bearer {_make_jwt()}", "X-Account-ID": "acct-1"},
+        ) as ws:
+            ws.send_bytes(b"\x00\x01")
+            ws.send_text('{"type": "stop_recording"}')
+            with pytest.raises(WebSocketDisconnect):
+                ws.receive_text()
+
+    # Cancelled by the handler before it closes the socket, not left to
+    # be torn down with the event loop.
+    assert order == ["domains_start", "domains_cancelled", "ws_close"]
@@ -11,7 +11,9 @@ schema with correct field types and formats.
 import uuid
 import json
 from datetime import datetime
+import pytest
 from hypothesis import given, strategies as st, settings
+from pydantic import ValidationError
 from models.batch_event import BatchProcessingCompletedEvent, EventData
 
 
@@ -173,3 +175,24 @@ def test_uuid_fields_are_valid_v4(interaction_id, tenant_id):
     # Verify string representation matches
     assert str(interaction_uuid) == interaction_id
     assert str(tenant_uuid) == tenant_id
+
+
+def test_event_is_immutable_and_ignores_unknown_fields():
+    """
+    Validated events are frozen, and unknown keys in the input are dropped
+    rather than carried into the published detail.
+    """
+    event = BatchProcessingCompletedEvent(
+        interaction_id=str(uuid.uuid4()),
+        tenant_id=str(uuid.uuid4()),
+        user_id="user-1",
+        timestamp=datetime.utcnow().isoformat() + "Z",
+        data={"cleaned_transcript": "c", "raw_transcript": "r"},
+        unexpected="dropped",
+    )
+
+    assert "unexpected" not in json.loads(event.model_dump_json())
+    with pytest.raises(ValidationError):
+        event.status = "failed"
+    with pytest.raises(ValidationError):
+        event.data.raw_transcript = "changed"
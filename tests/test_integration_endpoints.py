@@ -45,7 +45,10 @@ def mock_aws_clients():
     with patch('services.aws_event_publisher.boto3') as mock_boto3:
         # Mock Kinesis client
         mock_kinesis = MagicMock()
-        mock_kinesis.put_record.return_value = {"SequenceNumber": "12345"}
+        mock_kinesis.put_records.return_value = {
+            "FailedRecordCount": 0,
+            "Records": [{"SequenceNumber": "12345", "ShardId": "shardId-000000000000"}]
+        }
         
         # Mock EventBridge client
         mock_eventbridge = MagicMock()
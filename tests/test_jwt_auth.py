@@ -187,6 +187,45 @@ class TestJWTVerification:
 
         assert claims.pg_user_id is None
 
+    def test_claims_are_immutable(self):
+        """Verified claims are frozen and carry no per-instance __dict__."""
+        import dataclasses
+        from middleware.jwt_auth import verify_internal_jwt
+
+        claims = verify_internal_jwt(generate_test_jwt())
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            claims.tenant_id = str(uuid.uuid4())
+        assert not hasattr(claims, "__dict__")
+
+
+class TestJWTConfigCaching:
+    """Tests for the cached JWT configuration lookup."""
+
+    def test_config_is_cached_after_first_read(self):
+        """Repeated reads return the cached tuple without re-reading env."""
+        from middleware.jwt_auth import get_jwt_config
+
+        get_jwt_config.cache_clear()
+        first = get_jwt_config()
+        with patch.dict(os.environ, {"INTERNAL_JWT_ISSUER": "someone-else"}):
+            assert get_jwt_config() is first
+        get_jwt_config.cache_clear()
+
+    def test_missing_secret_is_not_cached(self):
+        """A misconfiguration error must not stick once the secret is set."""
+        from middleware.jwt_auth import get_jwt_config, JWTVerificationError
+
+        get_jwt_config.cache_clear()
+        with patch.dict(os.environ, {"INTERNAL_JWT_SECRET": ""}):
+            with pytest.raises(JWTVerificationError) as exc_info:
+                get_jwt_config()
+        assert exc_info.value.code == "JWT_NOT_CONFIGURED"
+
+        secret, _, _ = get_jwt_config()
+        assert secret == os.environ["INTERNAL_JWT_SECRET"]
+        get_jwt_config.cache_clear()
+
 
 class TestUnifiedAuthContext:
     """Tests for the unified get_auth_context function."""
@@ -312,3 +351,11 @@ class TestBearerTokenExtraction:
 
         assert extract_bearer_token("Bearer ") is None
         assert extract_bearer_token("Bearer") is None
+
+    def test_strips_whitespace_around_token(self):
+        """Surrounding whitespace is trimmed; whitespace-only tokens are rejected."""
+        from middleware.jwt_auth import extract_bearer_token
+
+        assert extract_bearer_token("Bearer   abc123xyz  ") == "abc123xyz"
+        assert extract_bearer_token("Bearer    ") is None
+        assert extract_bearer_token("bearer abc123xyz") is None
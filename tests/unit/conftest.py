@@ -0,0 +1,25 @@
+"""Shared fixtures for the unit tests."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def main(monkeypatch):
+    """The ``main`` module, imported with the required env vars set.
+
+    Imported lazily, same as ``test_main_lifespan.py``: at collection time
+    module-level ``validate_environment()`` would ``sys.exit``, and the
+    Deepgram client built at import validates its key, so the constructor
+    is patched to keep the import inert.
+    """
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost:5432/test")
+    with patch("deepgram.Deepgram", MagicMock()):
+        import main
+    return main
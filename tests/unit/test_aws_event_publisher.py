@@ -0,0 +1,284 @@
+"""Unit tests for services.aws_event_publisher.AWSEventPublisher.
+
+No AWS access: boto3 clients are replaced with ``MagicMock`` after
+construction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.envelope import ContentModel, EnvelopeV1
+from services import aws_event_publisher
+from services.aws_event_publisher import AWSEventPublisher
+
+
+def _envelope() -> EnvelopeV1:
+    return EnvelopeV1(
+        tenant_id=uuid.uuid4(),
+        user_id="test-user",
+        interaction_type="transcript",
+        content=ContentModel(text="hello", format="plain"),
+        timestamp=datetime.now(timezone.utc),
+        source="api",
+        interaction_id=uuid.uuid4(),
+        account_id="acct-1",
+    )
+
+
+def _put_events_ok(Entries):
+    return {
+        "FailedEntryCount": 0,
+        "Entries": [{"EventId": f"evt-{i}"} for i in range(len(Entries))],
+    }
+
+
+def _put_records_ok(StreamName, Records):
+    return {
+        "FailedRecordCount": 0,
+        "Records": [{"SequenceNumber": f"seq-{i}", "ShardId": "shard-0"} for i in range(len(Records))],
+    }
+
+
+@pytest.mark.asyncio
+async def test_concurrent_eventbridge_publishes_share_put_events_calls(monkeypatch):
+    monkeypatch.setenv("EVENTBRIDGE_BATCH_WINDOW_MS", "20")
+    publisher = AWSEventPublisher()
+    publisher.client = MagicMock()
+    publisher.client.put_events.side_effect = _put_events_ok
+
+    results = await asyncio.gather(
+        *(publisher._publish_to_eventbridge(_envelope()) for _ in range(12))
+    )
+
+    # 12 entries -> one full batch of 10, then the remaining 2.
+    batch_sizes = sorted(
+        len(call.kwargs["Entries"]) for call in publisher.client.put_events.call_args_list
+    )
+    assert batch_sizes == [2, 10]
+    assert all(event_id and event_id.startswith("evt-") for event_id in results)
+
+
+@pytest.mark.asyncio
+async def test_eventbridge_per_entry_failure_only_fails_that_publish(monkeypatch):
+    monkeypatch.setenv("EVENTBRIDGE_BATCH_WINDOW_MS", "20")
+    publisher = AWSEventPublisher()
+    publisher.client = MagicMock()
+    publisher.client.put_events.return_value = {
+        "FailedEntryCount": 1,
+        "Entries": [
+            {"EventId": "evt-0"},
+            {"ErrorCode": "InternalFailure", "ErrorMessage": "boom"},
+        ],
+    }
+
+    ok, failed = await asyncio.gather(
+        publisher._publish_to_eventbridge(_envelope()),
+        publisher._publish_to_eventbridge(_envelope()),
+    )
+
+    assert publisher.client.put_events.call_count == 1
+    assert ok == "evt-0"
+    assert failed is None
+
+
+@pytest.mark.asyncio
+async def test_eventbridge_api_error_fails_every_publish_in_batch(monkeypatch):
+    monkeypatch.setenv("EVENTBRIDGE_BATCH_WINDOW_MS", "20")
+    publisher = AWSEventPublisher()
+    publisher.client = MagicMock()
+    publisher.client.put_events.side_effect = RuntimeError("network down")
+
+    results = await asyncio.gather(
+        publisher._publish_to_eventbridge(_envelope()),
+        publisher._publish_to_eventbridge(_envelope()),
+    )
+
+    assert results == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_kinesis_record_is_utf8_json_of_wrapper():
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.kinesis_client.put_records.side_effect = _put_records_ok
+    envelope = _envelope().model_copy(
+        update={"content": ContentModel(text="réunion ✅", format="plain")}
+    )
+
+    assert await publisher._publish_to_kinesis(envelope) == "seq-0"
+
+    (record,) = publisher.kinesis_client.put_records.call_args.kwargs["Records"]
+    data = record["Data"]
+    assert isinstance(data, bytes)
+    assert "réunion ✅".encode("utf-8") in data
+    assert json.loads(data) == publisher._build_kinesis_payload(envelope)
+    assert json.loads(data)["envelope"]["timestamp"].endswith("Z")
+
+
+@pytest.mark.asyncio
+async def test_kinesis_routing_fields_come_from_single_envelope_dump():
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.kinesis_client.put_records.side_effect = _put_records_ok
+    envelope = _envelope().model_copy(update={"trace_id": "trace-abc"})
+
+    await publisher._publish_to_kinesis(envelope)
+
+    kwargs = publisher.kinesis_client.put_records.call_args.kwargs
+    (entry,) = kwargs["Records"]
+    record = json.loads(entry["Data"])
+    assert kwargs["StreamName"] == publisher.kinesis_stream
+    assert entry["PartitionKey"] == str(envelope.tenant_id)
+    assert record["tenant_id"] == record["envelope"]["tenant_id"] == str(envelope.tenant_id)
+    assert record["trace_id"] == record["envelope"]["trace_id"] == "trace-abc"
+    assert record["schema_version"] == record["envelope"]["schema_version"] == "v1"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_kinesis_publishes_share_put_records_calls(monkeypatch):
+    monkeypatch.setenv("KINESIS_BATCH_WINDOW_MS", "20")
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.kinesis_client.put_records.side_effect = _put_records_ok
+
+    results = await asyncio.gather(
+        *(publisher._publish_to_kinesis(_envelope()) for _ in range(5))
+    )
+
+    publisher.kinesis_client.put_records.assert_called_once()
+    assert len(publisher.kinesis_client.put_records.call_args.kwargs["Records"]) == 5
+    assert results == [f"seq-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_kinesis_per_record_failure_only_fails_that_publish(monkeypatch):
+    monkeypatch.setenv("KINESIS_BATCH_WINDOW_MS", "20")
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.kinesis_client.put_records.return_value = {
+        "FailedRecordCount": 1,
+        "Records": [
+            {"ErrorCode": "ProvisionedThroughputExceededException", "ErrorMessage": "slow down"},
+            {"SequenceNumber": "seq-1", "ShardId": "shard-0"},
+        ],
+    }
+
+    failed, ok = await asyncio.gather(
+        publisher._publish_to_kinesis(_envelope()),
+        publisher._publish_to_kinesis(_envelope()),
+    )
+
+    assert failed is None
+    assert ok == "seq-1"
+
+
+@pytest.mark.asyncio
+async def test_kinesis_batches_split_at_byte_limit(monkeypatch):
+    monkeypatch.setenv("KINESIS_BATCH_WINDOW_MS", "20")
+    monkeypatch.setattr(aws_event_publisher._PutRecordsBatcher, "max_bytes", 1)
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.kinesis_client.put_records.side_effect = _put_records_ok
+
+    results = await asyncio.gather(
+        *(publisher._publish_to_kinesis(_envelope()) for _ in range(3))
+    )
+
+    # Every record is over the limit on its own, so each gets its own call
+    batch_sizes = [
+        len(call.kwargs["Records"]) for call in publisher.kinesis_client.put_records.call_args_list
+    ]
+    assert batch_sizes == [1, 1, 1]
+    assert results == ["seq-0", "seq-0", "seq-0"]
+
+
+@pytest.mark.asyncio
+async def test_eventbridge_batches_split_at_byte_limit(monkeypatch):
+    monkeypatch.setenv("EVENTBRIDGE_BATCH_WINDOW_MS", "20")
+    publisher = AWSEventPublisher()
+    publisher.client = MagicMock()
+    publisher.client.put_events.side_effect = _put_events_ok
+
+    def _entry_size(entry):
+        return sum(len(entry[key].encode()) for key in ("Source", "DetailType", "Detail"))
+
+    # Room for two entries per call but not three
+    one_entry = _entry_size({
+        "Source": publisher.event_source,
+        "DetailType": "EnvelopeV1.transcript",
+        "Detail": _envelope().model_dump_json(),
+    })
+    monkeypatch.setattr(aws_event_publisher._PutEventsBatcher, "max_bytes", one_entry * 2 + 10)
+
+    results = await asyncio.gather(
+        *(publisher._publish_to_eventbridge(_envelope()) for _ in range(5))
+    )
+
+    calls = publisher.client.put_events.call_args_list
+    assert sorted(len(call.kwargs["Entries"]) for call in calls) == [1, 2, 2]
+    for call in calls:
+        assert sum(_entry_size(entry) for entry in call.kwargs["Entries"]) <= one_entry * 2 + 10
+    assert all(event_id and event_id.startswith("evt-") for event_id in results)
+
+
+def test_boto_clients_share_pooled_keepalive_config():
+    with patch.object(aws_event_publisher.boto3, "client") as client:
+        AWSEventPublisher()
+
+    configs = {call.args[0]: call.kwargs["config"] for call in client.call_args_list}
+    assert set(configs) == {"events", "kinesis"}
+    for config in configs.values():
+        assert config.max_pool_connections >= 10
+        assert config.tcp_keepalive is True
+
+
+@pytest.mark.asyncio
+async def test_publish_envelope_runs_kinesis_and_eventbridge_concurrently(monkeypatch):
+    monkeypatch.setenv("KINESIS_BATCH_WINDOW_MS", "0")
+    monkeypatch.setenv("EVENTBRIDGE_BATCH_WINDOW_MS", "0")
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.client = MagicMock()
+    events_called = threading.Event()
+
+    def _put_records(StreamName, Records):
+        # Only returns once EventBridge has been called as well
+        assert events_called.wait(timeout=5)
+        return _put_records_ok(StreamName, Records)
+
+    def _put_events(Entries):
+        events_called.set()
+        return _put_events_ok(Entries)
+
+    publisher.kinesis_client.put_records.side_effect = _put_records
+    publisher.client.put_events.side_effect = _put_events
+
+    results = await publisher.publish_envelope(_envelope())
+
+    assert results == {"kinesis_sequence": "seq-0", "eventbridge_id": "evt-0"}
+
+
+@pytest.mark.asyncio
+async def test_eventbridge_detail_matches_envelope_json(monkeypatch):
+    monkeypatch.setenv("EVENTBRIDGE_BATCH_WINDOW_MS", "0")
+    publisher = AWSEventPublisher()
+    publisher.kinesis_client = MagicMock()
+    publisher.kinesis_client.put_records.side_effect = _put_records_ok
+    publisher.client = MagicMock()
+    publisher.client.put_events.side_effect = _put_events_ok
+    envelope = _envelope().model_copy(
+        update={"content": ContentModel(text="réunion ✅", format="plain"), "extras": {"n": 1}}
+    )
+
+    await publisher.publish_envelope(envelope)
+
+    (entry,) = publisher.client.put_events.call_args.kwargs["Entries"]
+    assert entry["Detail"] == envelope.model_dump_json()
@@ -0,0 +1,146 @@
+"""Unit tests for :class:`services.batch_cleaner_service.BatchCleanerService`.
+
+``_clean_chunk`` is replaced with a fake, so no OpenAI call is made; the
+tests cover how ``clean_transcript`` fans chunks out and reassembles them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.batch_cleaner_service import BatchCleanerService
+
+
+def _service(monkeypatch, max_concurrent: str = "3") -> BatchCleanerService:
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("CLEANER_MAX_CONCURRENT_CHUNKS", max_concurrent)
+    with patch("services.batch_cleaner_service.AsyncOpenAI"):
+        return BatchCleanerService()
+
+
+@pytest.mark.asyncio
+async def test_chunks_cleaned_concurrently_up_to_limit_in_order(monkeypatch):
+    service = _service(monkeypatch, "3")
+    in_flight = 0
+    peak = 0
+
+    async def _fake_clean(chunk: str) -> str:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later chunks finish first; output order must still follow input.
+        await asyncio.sleep(0.01 * (10 - int(chunk.split("_")[1].split(":")[0])))
+        in_flight -= 1
+        return chunk.upper()
+
+    service._clean_chunk = _fake_clean
+    raw = "\n".join(f"SPEAKER_{i}: line {i}" for i in range(8))
+
+    cleaned = await service.clean_transcript(raw)
+
+    assert cleaned == raw.upper()
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_chunk_keeps_its_raw_text(monkeypatch):
+    service = _service(monkeypatch)
+
+    async def _fake_clean(chunk: str) -> str:
+        if chunk.startswith("SPEAKER_1"):
+            # Mirrors _clean_chunk's own fallback on an OpenAI error
+            return chunk
+        return chunk.upper()
+
+    service._clean_chunk = _fake_clean
+
+    cleaned = await service.clean_transcript("SPEAKER_0: a\nSPEAKER_1: b\nSPEAKER_2: c")
+
+    assert cleaned == "SPEAKER_0: A\nSPEAKER_1: b\nSPEAKER_2: C"
+
+
+@pytest.mark.parametrize("raw", ["0", "-2"])
+def test_concurrency_floor_is_one(monkeypatch, raw):
+    assert _service(monkeypatch, raw).max_concurrent_chunks == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("raw", ["SPEAKER_0: Sounds good.", "SPEAKER_0: Can you hear me?  \n"])
+async def test_short_punctuated_transcript_skips_llm(monkeypatch, raw):
+    service = _service(monkeypatch)
+    service._clean_chunk = AsyncMock()
+
+    assert await service.clean_transcript(raw) == raw
+    service._clean_chunk.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "SPEAKER_0: um so yeah",  # no terminal punctuation
+        "SPEAKER_0: " + "word " * 40 + "end.",  # over the length threshold
+    ],
+)
+async def test_unpunctuated_or_long_transcript_is_cleaned(monkeypatch, raw):
+    service = _service(monkeypatch)
+    service._clean_chunk = AsyncMock(return_value="cleaned")
+
+    assert await service.clean_transcript(raw) == "cleaned"
+    service._clean_chunk.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "SPEAKER_0: um so yeah we ship friday\nSPEAKER_1: Sounds good.",
+        "SPEAKER_0: ok so SPEAKER_1: Yes.",
+    ],
+)
+async def test_short_multi_speaker_transcript_is_cleaned(monkeypatch, raw):
+    service = _service(monkeypatch)
+    service._clean_chunk = AsyncMock(side_effect=lambda chunk: chunk)
+
+    await service.clean_transcript(raw)
+
+    assert service._clean_chunk.await_count >= 1
+
+
+@pytest.mark.asyncio
+async def test_skip_threshold_zero_always_cleans(monkeypatch):
+    monkeypatch.setenv("CLEANER_SKIP_BELOW_CHARS", "0")
+    service = _service(monkeypatch)
+    service._clean_chunk = AsyncMock(return_value="SPEAKER_0: Ok.")
+
+    await service.clean_transcript("SPEAKER_0: ok.")
+
+    service._clean_chunk.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_chunk_requests_share_system_prefix_and_cache_key(monkeypatch):
+    service = _service(monkeypatch)
+    message = SimpleNamespace(parsed=SimpleNamespace(cleaned_text="ok"))
+    parsed = AsyncMock(
+        return_value=SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    )
+    service.client.beta.chat.completions.parse = parsed
+
+    await service._clean_chunk("SPEAKER_0: one")
+    await service._clean_chunk("SPEAKER_1: two")
+
+    first, second = (call.kwargs for call in parsed.await_args_list)
+    assert first["messages"][0] == second["messages"][0]
+    assert first["messages"][0]["role"] == "system"
+    assert first["messages"][-1] == {"role": "user", "content": "SPEAKER_0: one"}
+    cache_key = first["extra_body"]["prompt_cache_key"]
+    assert cache_key == second["extra_body"]["prompt_cache_key"]
+    assert cache_key == _service(monkeypatch)._prompt_cache_key
+
+    monkeypatch.setenv("OPENAI_MODEL", "gpt-4o-mini")
+    assert _service(monkeypatch)._prompt_cache_key != cache_key
@@ -0,0 +1,181 @@
+"""Deepgram concurrency cap and circuit breaker in :mod:`services.batch_service`.
+
+The Deepgram SDK client is a mock; outage failures are modelled with the
+same ``http_library_error`` shape the SDK attaches to ``DeepgramApiError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+import pytest
+
+from services.batch_service import (
+    BatchService,
+    DeepgramCircuitBreaker,
+    DeepgramUnavailableError,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _http_error(status: int) -> Exception:
+    exc = Exception(f"DG: {status}")
+    exc.http_library_error = MagicMock(status=status)
+    return exc
+
+
+def _service(monkeypatch, **env) -> BatchService:
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    with patch("services.batch_service.Deepgram", MagicMock()):
+        return BatchService()
+
+
+# ---------------------------------------------------------------------------
+# DeepgramCircuitBreaker
+# ---------------------------------------------------------------------------
+
+
+def test_breaker_opens_after_threshold_and_sheds():
+    clock = _FakeClock()
+    breaker = DeepgramCircuitBreaker(failure_threshold=3, reset_timeout_s=30, clock=clock)
+
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert not breaker.is_open
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.is_open
+
+    clock.now += 10
+    with pytest.raises(DeepgramUnavailableError) as exc_info:
+        breaker.before_call()
+    assert exc_info.value.retry_after_s == pytest.approx(20)
+
+
+def test_success_resets_consecutive_count():
+    breaker = DeepgramCircuitBreaker(failure_threshold=2, reset_timeout_s=30, clock=_FakeClock())
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert not breaker.is_open
+
+
+def test_half_open_admits_one_probe_then_closes_on_success():
+    clock = _FakeClock()
+    breaker = DeepgramCircuitBreaker(failure_threshold=1, reset_timeout_s=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 31
+    breaker.before_call()  # the probe
+    with pytest.raises(DeepgramUnavailableError):
+        breaker.before_call()  # everyone else waits for its outcome
+
+    breaker.record_success()
+    assert not breaker.is_open
+    breaker.before_call()
+
+
+def test_failed_probe_reopens_for_a_fresh_timeout():
+    clock = _FakeClock()
+    breaker = DeepgramCircuitBreaker(failure_threshold=1, reset_timeout_s=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 31
+    breaker.before_call()
+    breaker.record_failure()
+
+    clock.now += 29
+    with pytest.raises(DeepgramUnavailableError):
+        breaker.before_call()
+    clock.now += 2
+    breaker.before_call()
+
+
+def test_abandoned_probe_frees_the_slot():
+    clock = _FakeClock()
+    breaker = DeepgramCircuitBreaker(failure_threshold=1, reset_timeout_s=30, clock=clock)
+    breaker.record_failure()
+    clock.now += 31
+    breaker.before_call()
+
+    breaker.record_abandoned()
+
+    breaker.before_call()
+
+
+# ---------------------------------------------------------------------------
+# BatchService._prerecorded
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error, trips",
+    [
+        (_http_error(503), True),
+        (_http_error(429), True),
+        (aiohttp.ClientConnectionError("reset"), True),
+        (asyncio.TimeoutError(), True),
+        (_http_error(400), False),
+        (ValueError("bad body"), False),
+    ],
+)
+async def test_only_outage_failures_trip_the_breaker(monkeypatch, error, trips):
+    service = _service(monkeypatch, DEEPGRAM_BREAKER_FAILURES="1")
+    service.client.transcription.prerecorded = AsyncMock(side_effect=error)
+
+    with pytest.raises(type(error)):
+        await service._prerecorded({"url": "https://example.com/a.wav"}, {})
+
+    assert service.breaker.is_open is trips
+
+
+@pytest.mark.asyncio
+async def test_open_breaker_fails_fast_without_calling_deepgram(monkeypatch):
+    service = _service(monkeypatch, DEEPGRAM_BREAKER_FAILURES="2")
+    service.client.transcription.prerecorded = AsyncMock(side_effect=_http_error(502))
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            await service.transcribe_audio(b"audio", "audio/wav")
+
+    with pytest.raises(DeepgramUnavailableError):
+        await service.transcribe_audio(b"audio", "audio/wav")
+    assert service.client.transcription.prerecorded.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_capped(monkeypatch):
+    service = _service(monkeypatch, DEEPGRAM_MAX_CONCURRENCY="2")
+    in_flight = 0
+    peak = 0
+
+    async def _call(source, options):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return {}
+
+    service.client.transcription.prerecorded = AsyncMock(side_effect=_call)
+
+    await asyncio.gather(*(service._prerecorded({"url": "u"}, {}) for _ in range(6)))
+
+    assert peak == 2
+    assert service.client.transcription.prerecorded.await_count == 6
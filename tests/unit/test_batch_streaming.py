@@ -0,0 +1,370 @@
+"""POST /batch/process: upload streaming and background Lane 2 dispatch.
+
+The route is mounted on a bare FastAPI app with auth, enrichment and both
+lanes patched out. The tests cover the file handling between Starlette's
+upload spool and ``BatchService.transcribe_audio``, and that intelligence
+extraction runs after the response under the shared Lane 2 cap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+
+from models.envelope import EnvelopeV1
+from models.request_context import RequestContext
+from routers import batch
+from services import text_clean_service
+from services.batch_service import BatchService, DeepgramUnavailableError
+from utils import context_utils
+
+
+def _context() -> RequestContext:
+    return RequestContext(
+        tenant_id=str(uuid.uuid4()),
+        user_id="auth0|batch-user",
+        account_id="acct-1",
+        interaction_id=str(uuid.uuid4()),
+        trace_id=str(uuid.uuid4()),
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_lane2_state():
+    text_clean_service._INFLIGHT_LANE2[0] = 0
+    text_clean_service._BACKGROUND_TASKS.clear()
+    yield
+    text_clean_service._INFLIGHT_LANE2[0] = 0
+    text_clean_service._BACKGROUND_TASKS.clear()
+
+
+@pytest.fixture
+def route_mocks():
+    app = FastAPI()
+    app.include_router(batch.router)
+
+    received = {}
+
+    async def _transcribe(audio, mimetype):
+        # Read inside the call: the route must pass a live, rewound file
+        received["type"] = type(audio)
+        received["data"] = audio.read()
+        received["mimetype"] = mimetype
+        return "SPEAKER_0: hello"
+
+    batch_service = MagicMock()
+    batch_service.transcribe_audio = AsyncMock(side_effect=_transcribe)
+
+    enrichment = MagicMock(front_matter="", contact_ids=[], calendar_event_id=None)
+    enrichment.to_extras_dict.return_value = {}
+    enrichment_service = MagicMock()
+    enrichment_service.enrich = AsyncMock(return_value=enrichment)
+
+    cleaner = MagicMock()
+    cleaner.clean_transcript = AsyncMock(return_value="Speaker 0: Hello.")
+    publisher = MagicMock()
+    publisher.publish_envelope = AsyncMock(return_value={})
+    intelligence = MagicMock()
+    intelligence.process_transcript = AsyncMock(return_value=None)
+
+    mocks = MagicMock(
+        app=app,
+        batch_service=batch_service,
+        publisher=publisher,
+        intelligence=intelligence,
+        received=received,
+    )
+    with patch.object(context_utils, "get_auth_context_ingestion", return_value=_context()), \
+         patch.object(batch, "BatchService", return_value=batch_service), \
+         patch.object(batch, "TranscriptEnrichmentService", return_value=enrichment_service), \
+         patch.object(batch, "get_tenant_internal_domains", AsyncMock(return_value=set())), \
+         patch.object(batch, "BatchCleanerService", return_value=cleaner), \
+         patch.object(batch, "AWSEventPublisher", return_value=publisher), \
+         patch.object(batch, "IntelligenceService", return_value=intelligence):
+        yield mocks
+
+
+@pytest.fixture
+def client_and_batch_service(route_mocks):
+    return TestClient(route_mocks.app), route_mocks.batch_service, route_mocks.received
+
+
+def test_upload_is_passed_to_deepgram_as_a_file_object(client_and_batch_service):
+    client, batch_service, received = client_and_batch_service
+    audio = b"RIFF" + b"\x00" * (2 * 1024 * 1024)  # past Starlette's 1MB spool
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.mp3", io.BytesIO(audio), "audio/mpeg")},
+    )
+
+    assert response.status_code == 200, response.text
+    assert received["type"] is not bytes
+    assert received["data"] == audio
+    assert received["mimetype"] == "audio/mpeg"
+
+
+def test_oversized_upload_rejected_before_transcription(client_and_batch_service, monkeypatch):
+    client, batch_service, _ = client_and_batch_service
+    monkeypatch.setattr(batch, "MAX_FILE_SIZE", 1024)
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"\x00" * 2048), "audio/wav")},
+    )
+
+    assert response.status_code == 413
+    assert "File too large" in response.json()["detail"]
+    batch_service.transcribe_audio.assert_not_called()
+
+
+def test_declared_content_length_over_limit_rejected_before_parsing(
+    client_and_batch_service, monkeypatch
+):
+    client, batch_service, _ = client_and_batch_service
+    monkeypatch.setattr(batch, "MAX_FILE_SIZE", 1024)
+    monkeypatch.setattr(batch, "MULTIPART_OVERHEAD_ALLOWANCE", 0)
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"\x00" * 4096), "audio/wav")},
+    )
+
+    assert response.status_code == 413
+    # The handler (auth context first) never ran: the form was not parsed
+    context_utils.get_auth_context_ingestion.assert_not_called()
+    batch_service.transcribe_audio.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_undeclared_body_cut_off_once_over_limit(route_mocks, monkeypatch):
+    monkeypatch.setattr(batch, "MAX_FILE_SIZE", 1024)
+    monkeypatch.setattr(batch, "MULTIPART_OVERHEAD_ALLOWANCE", 0)
+    boundary = "batchboundary"
+    chunks_sent = 0
+
+    async def _chunked_body():
+        nonlocal chunks_sent
+        yield (
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="meeting.wav"\r\n'
+            "Content-Type: audio/wav\r\n\r\n"
+        ).encode()
+        for _ in range(64):
+            chunks_sent += 1
+            yield b"\x00" * 512
+        yield f"\r\n--{boundary}--\r\n".encode()
+
+    transport = ASGITransport(app=route_mocks.app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/batch/process",
+            content=_chunked_body(),
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+        )
+
+    assert response.status_code == 413
+    assert chunks_sent < 64
+    route_mocks.batch_service.transcribe_audio.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_transcribe_audio_forwards_file_object_to_sdk(monkeypatch):
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    with patch("services.batch_service.Deepgram", MagicMock()):
+        service = BatchService()
+    service.client.transcription.prerecorded = AsyncMock(return_value={
+        "results": {"channels": [{"alternatives": [{"words": [
+            {"word": "hi", "punctuated_word": "Hi.", "speaker": 0},
+        ]}]}]},
+    })
+    audio = io.BytesIO(b"audio")
+
+    transcript = await service.transcribe_audio(audio, "audio/wav")
+
+    source = service.client.transcription.prerecorded.call_args.args[0]
+    assert source == {"buffer": audio, "mimetype": "audio/wav"}
+    assert transcript == "SPEAKER_0: Hi."
+
+
+def test_mime_type_map_is_read_only():
+    with pytest.raises(TypeError):
+        batch.MIME_TYPE_MAP["ogg"] = "audio/ogg"
+
+
+@pytest.mark.asyncio
+async def test_response_does_not_wait_for_lane2(route_mocks):
+    release = asyncio.Event()
+
+    async def _slow_intelligence(**kwargs):
+        await release.wait()
+
+    route_mocks.intelligence.process_transcript = AsyncMock(side_effect=_slow_intelligence)
+
+    transport = ASGITransport(app=route_mocks.app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/batch/process",
+            files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+        )
+
+    assert response.status_code == 200, response.text
+    route_mocks.publisher.publish_envelope.assert_awaited_once()
+    assert text_clean_service.get_lane2_in_flight() == 1
+    (task,) = text_clean_service._BACKGROUND_TASKS
+    assert not task.done()
+
+    release.set()
+    await task
+    await asyncio.sleep(0)  # let the done-callback run
+
+    route_mocks.intelligence.process_transcript.assert_awaited_once()
+    assert route_mocks.intelligence.process_transcript.call_args.kwargs["interaction_type"] == "batch_upload"
+    assert text_clean_service.get_lane2_in_flight() == 0
+    assert not text_clean_service._BACKGROUND_TASKS
+
+
+def test_lane1_failure_is_not_fatal(client_and_batch_service, route_mocks):
+    client, _, _ = client_and_batch_service
+    route_mocks.publisher.publish_envelope = AsyncMock(side_effect=RuntimeError("kinesis down"))
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 200, response.text
+
+
+def test_rejected_with_503_when_lane2_cap_reached(client_and_batch_service, monkeypatch):
+    client, batch_service, _ = client_and_batch_service
+    monkeypatch.setenv("TEXT_CLEAN_MAX_BG_TASKS", "1")
+    text_clean_service._INFLIGHT_LANE2[0] = 1
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "60"
+    batch_service.transcribe_audio.assert_not_called()
+    assert text_clean_service.get_lane2_in_flight() == 1
+
+
+def test_slot_released_when_transcription_fails(client_and_batch_service):
+    client, batch_service, _ = client_and_batch_service
+    batch_service.transcribe_audio.side_effect = RuntimeError("deepgram down")
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 500
+    assert text_clean_service.get_lane2_in_flight() == 0
+
+
+def test_constructed_envelope_matches_a_validated_one(client_and_batch_service, route_mocks):
+    client, _, _ = client_and_batch_service
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 200, response.text
+    envelope = route_mocks.publisher.publish_envelope.call_args.args[0]
+    validated = EnvelopeV1.model_validate(envelope.model_dump())
+    assert envelope.model_dump(mode="json") == validated.model_dump(mode="json")
+
+
+@pytest.mark.parametrize(
+    "filename, mimetype",
+    [("Meeting.M4A", "audio/mp4"), ("call.2024.01.mp3", "audio/mpeg"), ("a.b.webm", "audio/webm")],
+)
+def test_extension_resolves_mime_type(client_and_batch_service, filename, mimetype):
+    client, _, received = client_and_batch_service
+
+    response = client.post(
+        "/batch/process",
+        files={"file": (filename, io.BytesIO(b"audio"), "application/octet-stream")},
+    )
+
+    assert response.status_code == 200, response.text
+    assert received["mimetype"] == mimetype
+
+
+@pytest.mark.parametrize("filename", ["notes.txt", "recording", "clip.wav.exe"])
+def test_unlisted_extension_rejected(client_and_batch_service, filename):
+    client, batch_service, _ = client_and_batch_service
+
+    response = client.post(
+        "/batch/process",
+        files={"file": (filename, io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == (
+        "Invalid file format. Allowed formats: wav, mp3, flac, m4a, webm, mp4"
+    )
+    batch_service.transcribe_audio.assert_not_called()
+
+
+def test_open_deepgram_breaker_returns_503(client_and_batch_service):
+    client, batch_service, _ = client_and_batch_service
+    batch_service.transcribe_audio.side_effect = DeepgramUnavailableError(retry_after_s=12.4)
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "12"
+    assert text_clean_service.get_lane2_in_flight() == 0
+
+
+def test_auth_context_resolved_once_and_before_upload_validation(client_and_batch_service):
+    client, batch_service, _ = client_and_batch_service
+
+    response = client.post(
+        "/batch/process",
+        files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+    )
+
+    assert response.status_code == 200, response.text
+    # Shared between validate_audio_upload and the handler via dependency caching
+    context_utils.get_auth_context_ingestion.assert_called_once()
+
+    context_utils.get_auth_context_ingestion.side_effect = HTTPException(status_code=401, detail="nope")
+    response = client.post(
+        "/batch/process",
+        files={"file": ("notes.txt", io.BytesIO(b"audio"), "text/plain")},
+    )
+
+    assert response.status_code == 401
+    batch_service.transcribe_audio.assert_called_once()
+
+
+def test_processing_ids_are_unique_per_request(client_and_batch_service, caplog):
+    client, _, _ = client_and_batch_service
+
+    with caplog.at_level("INFO", logger="routers.batch"):
+        for _ in range(2):
+            client.post(
+                "/batch/process",
+                files={"file": ("meeting.wav", io.BytesIO(b"audio"), "audio/wav")},
+            )
+
+    started = [r.args[0] for r in caplog.records if r.msg.startswith("Batch processing started")]
+    assert len(started) == 2
+    assert started[0] != started[1]
+    assert all(pid.startswith(batch._PROCESSING_ID_PREFIX) for pid in started)
@@ -0,0 +1,65 @@
+"""Unit tests for :func:`services.database.get_engine` pool configuration.
+
+``create_async_engine`` is patched out, so no database is contacted; the
+tests only check the pool arguments the engine is built with.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import database
+
+
+@pytest.fixture(autouse=True)
+def _fresh_engine(monkeypatch):
+    """Each test builds its own engine from a clean pool env."""
+    monkeypatch.setattr(database, "_engine", None)
+    monkeypatch.setattr(database, "_async_session_maker", None)
+    monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@db.example.com/app")
+    monkeypatch.delenv("DB_POOL_SIZE", raising=False)
+    monkeypatch.delenv("DB_MAX_OVERFLOW", raising=False)
+
+
+def _engine_kwargs() -> dict:
+    with patch.object(database, "create_async_engine", MagicMock()) as create:
+        database.get_engine()
+    create.assert_called_once()
+    return create.call_args.kwargs
+
+
+def test_engine_pool_defaults():
+    kwargs = _engine_kwargs()
+
+    assert kwargs["pool_size"] == 10
+    assert kwargs["max_overflow"] == 20
+    assert kwargs["pool_pre_ping"] is True
+    assert kwargs["pool_recycle"] == 300
+
+
+def test_engine_pool_size_env_override(monkeypatch):
+    monkeypatch.setenv("DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DB_MAX_OVERFLOW", "0")
+
+    kwargs = _engine_kwargs()
+
+    assert kwargs["pool_size"] == 4
+    assert kwargs["max_overflow"] == 0
+
+
+@pytest.mark.parametrize("raw", ["ten", "-1", "  "])
+def test_engine_pool_size_bad_env_falls_back_to_default(monkeypatch, raw):
+    monkeypatch.setenv("DB_POOL_SIZE", raw)
+
+    assert _engine_kwargs()["pool_size"] == 10
+
+
+def test_engine_is_created_once():
+    with patch.object(database, "create_async_engine", MagicMock()) as create:
+        first = database.get_engine()
+        second = database.get_engine()
+
+    assert first is second
+    create.assert_called_once()
@@ -0,0 +1,118 @@
+"""Index and enum declarations on the intelligence mirror and upload job models.
+
+The tables are owned by schema.prisma; the SQLModel mirrors must declare the
+same tenant-leading indexes and idempotency keys so the model stays an
+accurate description of what Postgres can serve from an index.
+"""
+
+from sqlalchemy import UniqueConstraint
+
+from models.db_models import InteractionInsightModel, InteractionSummaryEntryModel
+
+
+def _index_columns(model) -> set[tuple[str, ...]]:
+    return {tuple(c.name for c in index.columns) for index in model.__table__.indexes}
+
+
+def _unique_columns(model) -> set[tuple[str, ...]]:
+    return {
+        tuple(c.name for c in constraint.columns)
+        for constraint in model.__table__.constraints
+        if isinstance(constraint, UniqueConstraint)
+    }
+
+
+def test_summary_entries_indexed_by_tenant_and_interaction():
+    assert ("tenant_id", "interaction_id") in _index_columns(InteractionSummaryEntryModel)
+    assert ("tenant_id", "interaction_id", "persona_id", "level") in _unique_columns(
+        InteractionSummaryEntryModel
+    )
+
+
+def test_insights_indexed_by_tenant_and_interaction():
+    indexes = _index_columns(InteractionInsightModel)
+
+    assert ("tenant_id", "interaction_id") in indexes
+    assert ("tenant_id", "persona_id", "type") in indexes
+
+
+def test_insight_idempotency_key_is_scoped_to_interaction_persona_and_type():
+    assert _unique_columns(InteractionInsightModel) == {
+        ("tenant_id", "interaction_id", "persona_id", "type", "content_hash"),
+    }
+
+
+def test_index_names_fit_postgres_identifier_limit():
+    for model in (InteractionSummaryEntryModel, InteractionInsightModel):
+        for index in model.__table__.indexes:
+            assert len(index.name) <= 63, index.name
+
+
+def test_mirror_enums_bind_as_their_plain_values():
+    from models.db_models import (
+        InsightTypeEnum,
+        ProfileTypeEnum,
+        RiskSeverityDBEnum,
+        SummaryLevelEnum,
+    )
+
+    for enum_cls in (SummaryLevelEnum, ProfileTypeEnum, InsightTypeEnum, RiskSeverityDBEnum):
+        column_enum = next(
+            c.type for c in (
+                *InteractionSummaryEntryModel.__table__.columns,
+                *InteractionInsightModel.__table__.columns,
+            )
+            if getattr(c.type, "enum_class", None) is enum_cls
+        )
+        # Native Postgres enum type, values identical to member names
+        assert column_enum.native_enum
+        assert column_enum.enums == [str(member) for member in enum_cls]
+
+
+def test_upload_jobs_created_at_brin_matches_migration():
+    from pathlib import Path
+
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    from models.job_models import UploadJob
+
+    brin = next(
+        index for index in UploadJob.__table__.indexes
+        if index.name == "brin_upload_jobs_created_at"
+    )
+    ddl = str(CreateIndex(brin).compile(dialect=postgresql.dialect()))
+    assert "USING brin (created_at)" in ddl
+    assert "pages_per_range = 32" in ddl
+
+    migration = (
+        Path(__file__).resolve().parents[2]
+        / "migrations"
+        / "006_upload_jobs_created_at_brin.sql"
+    ).read_text()
+    assert "brin_upload_jobs_created_at" in migration
+    assert "USING BRIN (created_at)" in migration
+
+
+def test_upload_jobs_reaper_partial_index_matches_migration():
+    from pathlib import Path
+
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.schema import CreateIndex
+
+    from models.job_models import UploadJob
+
+    partial = next(
+        index for index in UploadJob.__table__.indexes
+        if index.name == "ix_upload_jobs_processing_started_at"
+    )
+    ddl = str(CreateIndex(partial).compile(dialect=postgresql.dialect()))
+    assert "ON upload_jobs (started_at) WHERE status = 'processing'" in ddl
+
+    migration = (
+        Path(__file__).resolve().parents[2]
+        / "migrations"
+        / "008_upload_jobs_processing_partial_index.sql"
+    ).read_text()
+    assert "ix_upload_jobs_processing_started_at" in migration
+    assert "WHERE status = 'processing'" in migration
@@ -86,5 +86,29 @@ def test_compat_preserves_additional_headers_if_already_passed() -> None:
     assert "extra_headers" not in captured["kwargs"]
 
 
+def test_compat_injects_shared_ssl_context_for_wss(monkeypatch) -> None:
+    # Wrap a recorder (no compat marker) so the real wrapper code runs.
+    from services.deepgram_websockets_compat import (
+        _shared_ssl_context,
+        _wrap_websockets_connect,
+    )
+
+    calls: list = []
+
+    def fake_real(*args, **kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(websockets, "connect", fake_real)
+    _wrap_websockets_connect()
+
+    websockets.connect("wss://api.deepgram.com/v1/listen", extra_headers={})
+    websockets.connect("wss://api.deepgram.com/v1/listen", extra_headers={})
+    websockets.connect("ws://localhost:1234")
+
+    assert calls[0]["ssl"] is _shared_ssl_context()
+    assert calls[1]["ssl"] is calls[0]["ssl"]
+    assert "ssl" not in calls[2]
+
+
 # pytest is imported at runtime for the monkeypatch fixture signature.
 import pytest  # noqa: E402  (kept at bottom to match the test layout)
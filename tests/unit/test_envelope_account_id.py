@@ -35,3 +35,30 @@ def test_envelope_accepts_string_account_id():
 def test_envelope_rejects_none_account_id():
     with pytest.raises(ValidationError):
         EnvelopeV1(**_base_kwargs(), account_id=None)  # type: ignore[arg-type]
+
+
+def test_envelope_account_id_cannot_be_reassigned():
+    env = EnvelopeV1(**_base_kwargs(), account_id="acct-123")
+    with pytest.raises(ValidationError):
+        env.account_id = "acct-other"
+
+
+def test_envelope_serializes_uuid_and_utc_timestamp_as_strings():
+    kwargs = _base_kwargs()
+    kwargs["timestamp"] = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    env = EnvelopeV1(**kwargs, account_id="acct-123")
+
+    # Both the python-mode dict (Kinesis wrapper) and JSON output carry strings.
+    for dumped in (env.model_dump(), env.model_dump(mode="json")):
+        assert dumped["tenant_id"] == str(kwargs["tenant_id"])
+        assert dumped["interaction_id"] == str(kwargs["interaction_id"])
+        assert dumped["timestamp"] == "2026-01-02T03:04:05Z"
+
+
+def test_envelope_serializes_missing_interaction_id_as_null():
+    kwargs = _base_kwargs()
+    kwargs["interaction_id"] = None
+    env = EnvelopeV1(**kwargs, account_id="acct-123")
+
+    assert env.model_dump()["interaction_id"] is None
+    assert '"interaction_id":null' in env.model_dump_json()
@@ -136,6 +136,16 @@ class TestRiskModel:
         assert medium_risk.severity.value == "medium"
         assert high_risk.severity.value == "high"
     
+    def test_risk_severity_coerces_plain_string(self):
+        """Severity strings from the LLM become StrEnum members that are
+        themselves plain strings."""
+        risk = Risk(risk="Timeline delay possible", severity="medium")
+
+        assert risk.severity is RiskSeverityEnum.medium
+        assert risk.severity == "medium"
+        assert str(risk.severity) == "medium"
+        assert f"{risk.severity}" == "medium"
+
     def test_risk_rejects_invalid_severity(self):
         """Test that Risk rejects invalid severity values."""
         with pytest.raises(ValidationError):
@@ -83,6 +83,22 @@ class TestContentHashGeneration:
         assert hash1 == hash2, "Special characters should hash consistently"
         assert len(hash1) == 64
 
+    @pytest.mark.parametrize("insight_type", [
+        "action_item", "decision_made", "risk", "key_takeaway",
+        "product_feedback", "market_intelligence", "not_a_known_type",
+    ])
+    def test_content_hash_matches_stored_sha256_format(self, service, insight_type):
+        """Hashes must stay SHA-256("{type}:{content}") so re-runs dedupe
+        against rows already in interaction_insights."""
+        import hashlib
+
+        content = "Follow up with légal 🎉"
+        expected = hashlib.sha256(f"{insight_type}:{content}".encode()).hexdigest()
+
+        assert service._generate_content_hash(insight_type, content) == expected
+        # The cached prefix state must not be mutated between calls
+        assert service._generate_content_hash(insight_type, content) == expected
+
 
 class TestExtractIntelligence:
     """Tests for _extract_intelligence method."""
@@ -610,3 +626,181 @@ async def test_process_transcript_threads_account_id_to_persist_contact_links(se
         f"process_transcript must thread account_id={account_id!r} to "
         f"_persist_contact_links, got kwargs={call_kwargs!r}"
     )
+
+
+@pytest.mark.asyncio
+async def test_persist_intelligence_rows_share_one_timestamp(service):
+    """All rows built from one analysis get the same created_at/updated_at
+    (one clock read per batch, not two default_factory calls per model)."""
+    from uuid import uuid4
+
+    analysis = InteractionAnalysis(
+        summaries=Summaries(
+            title="T", headline="H", brief="B", detailed="D", spotlight="S"
+        ),
+        action_items=[ActionItem(description="Do it")],
+        decisions=[Decision(decision="Decided")],
+        key_takeaways=["Takeaway"],
+    )
+
+    mock_session = MagicMock()
+    mock_session.execute = AsyncMock()
+    mock_ctx = MagicMock()
+    mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    service._get_persona_id = AsyncMock(return_value=uuid4())
+
+    with patch("services.intelligence_service.tenant_session", return_value=mock_ctx):
+        await service._persist_intelligence(
+            analysis=analysis,
+            interaction_id=str(uuid4()),
+            tenant_id=str(uuid4()),
+            trace_id=str(uuid4()),
+            persona_code="gtm",
+            interaction_type="meeting",
+            account_id=None,
+            interaction_timestamp=datetime(2026, 1, 1),
+        )
+
+    rows = [row for call in mock_session.execute.call_args_list for row in call.args[1]]
+    assert len(rows) == 5 + 3
+    assert len({row["created_at"] for row in rows}) == 1
+    assert all(row["updated_at"] == row["created_at"] for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_persist_intelligence_bulk_inserts_one_statement_per_table(service):
+    """Summaries and insights are each written with a single multi-row INSERT."""
+    from uuid import uuid4
+
+    analysis = InteractionAnalysis(
+        summaries=Summaries(
+            title="T", headline="H", brief="B", detailed="D", spotlight="S"
+        ),
+        action_items=[ActionItem(description="Do it"), ActionItem(description="And this")],
+        key_takeaways=["Takeaway"],
+    )
+
+    mock_session = MagicMock()
+    mock_session.add = MagicMock()
+    mock_session.execute = AsyncMock()
+    mock_ctx = MagicMock()
+    mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    service._get_persona_id = AsyncMock(return_value=uuid4())
+
+    with patch("services.intelligence_service.tenant_session", return_value=mock_ctx):
+        await service._persist_intelligence(
+            analysis=analysis,
+            interaction_id=str(uuid4()),
+            tenant_id=str(uuid4()),
+            trace_id=str(uuid4()),
+            persona_code="gtm",
+            interaction_type="meeting",
+            account_id=None,
+            interaction_timestamp=datetime(2026, 1, 1),
+        )
+
+    mock_session.add.assert_not_called()
+    summary_call, insight_call = mock_session.execute.call_args_list
+    assert summary_call.args[0].table.name == "interaction_summary_entries"
+    assert len(summary_call.args[1]) == 5
+    assert insight_call.args[0].table.name == "interaction_insights"
+    assert [row["type"].value for row in insight_call.args[1]] == [
+        "action_item",
+        "action_item",
+        "key_takeaway",
+    ]
+    # Every row carries its own client-generated primary key
+    all_rows = summary_call.args[1] + insight_call.args[1]
+    assert len({row["id"] for row in all_rows}) == len(all_rows)
+
+
+@pytest.mark.asyncio
+async def test_persist_intelligence_skips_insight_insert_when_none_extracted(service):
+    from uuid import uuid4
+
+    analysis = InteractionAnalysis(
+        summaries=Summaries(
+            title="T", headline="H", brief="B", detailed="D", spotlight="S"
+        ),
+    )
+
+    mock_session = MagicMock()
+    mock_session.execute = AsyncMock()
+    mock_ctx = MagicMock()
+    mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    service._get_persona_id = AsyncMock(return_value=uuid4())
+
+    with patch("services.intelligence_service.tenant_session", return_value=mock_ctx):
+        await service._persist_intelligence(
+            analysis=analysis,
+            interaction_id=str(uuid4()),
+            tenant_id=str(uuid4()),
+            trace_id=str(uuid4()),
+            persona_code="gtm",
+            interaction_type="meeting",
+            account_id=None,
+            interaction_timestamp=datetime(2026, 1, 1),
+        )
+
+    assert mock_session.execute.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_persona_lookup_applies_default_loader_options(service):
+    """Mirror-model selects opt into raiseload('*') so a future relationship
+    can't be lazy-loaded (N+1) without an explicit loader option."""
+    from uuid import uuid4
+
+    from models.db_models import default_loader_options
+
+    persona = MagicMock(id=uuid4())
+    result = MagicMock()
+    result.scalar_one_or_none = MagicMock(return_value=persona)
+    session = MagicMock()
+    session.execute = AsyncMock(return_value=result)
+
+    assert await service._get_persona_id(session, "gtm") == persona.id
+
+    stmt = session.execute.call_args.args[0]
+    assert tuple(stmt._with_options) == default_loader_options
+
+
+@pytest.mark.asyncio
+async def test_persist_intelligence_maps_every_risk_severity(service):
+    from uuid import uuid4
+
+    analysis = InteractionAnalysis(
+        summaries=Summaries(
+            title="T", headline="H", brief="B", detailed="D", spotlight="S"
+        ),
+        risks=[Risk(risk=f"Risk {s.value}", severity=s) for s in RiskSeverityEnum],
+    )
+
+    mock_session = MagicMock()
+    mock_session.execute = AsyncMock()
+    mock_ctx = MagicMock()
+    mock_ctx.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_ctx.__aexit__ = AsyncMock(return_value=None)
+    service._get_persona_id = AsyncMock(return_value=uuid4())
+
+    with patch("services.intelligence_service.tenant_session", return_value=mock_ctx):
+        await service._persist_intelligence(
+            analysis=analysis,
+            interaction_id=str(uuid4()),
+            tenant_id=str(uuid4()),
+            trace_id=str(uuid4()),
+            persona_code="gtm",
+            interaction_type="meeting",
+            account_id=None,
+            interaction_timestamp=datetime(2026, 1, 1),
+        )
+
+    _, insight_call = mock_session.execute.call_args_list
+    assert [(row["risk"], row["severity"].value) for row in insight_call.args[1]] == [
+        ("Risk low", "low"),
+        ("Risk medium", "medium"),
+        ("Risk high", "high"),
+    ]
@@ -0,0 +1,43 @@
+"""Startup environment validation in ``main``.
+
+Both validators read from a single ``dict(os.environ)`` snapshot taken at
+import time rather than re-querying ``os.environ``. ``main`` comes from
+the lazy-import fixture in ``conftest.py``.
+"""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+
+def test_validate_environment_reports_all_missing_vars(main, caplog):
+    env = {"DEEPGRAM_API_KEY": "k", "REDIS_URL": ""}
+
+    with caplog.at_level(logging.ERROR), pytest.raises(SystemExit):
+        main.validate_environment(env)
+
+    assert "['REDIS_URL', 'OPENAI_API_KEY', 'DATABASE_URL']" in caplog.text
+
+
+def test_validate_environment_uses_given_snapshot_not_os_environ(main, monkeypatch):
+    monkeypatch.delenv("DATABASE_URL")
+
+    # The snapshot still has every var, so this must not exit.
+    main.validate_environment({var: "x" for var in main.REQUIRED_ENV_VARS})
+
+
+def test_validate_aws_credentials_reads_snapshot(main, monkeypatch, caplog):
+    monkeypatch.delenv("AWS_ACCESS_KEY_ID", raising=False)
+    env = {
+        "AWS_ACCESS_KEY_ID": "AKIA",
+        "AWS_SECRET_ACCESS_KEY": "secret",
+        "EVENTBRIDGE_BUS_NAME": "snapshot-bus",
+    }
+
+    with caplog.at_level(logging.INFO):
+        main.validate_aws_credentials(env)
+
+    assert "EventBridge integration ENABLED" in caplog.text
+    assert "snapshot-bus" in caplog.text
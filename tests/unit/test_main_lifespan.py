@@ -93,3 +93,78 @@ async def test_lifespan_closes_pool_even_if_startup_raises(monkeypatch):
 
     # Pool still closed despite the startup failure.
     assert "close_pool" in order
+
+
+@pytest.mark.asyncio
+async def test_lifespan_builds_openapi_schema_before_serving(monkeypatch):
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost:5432/test")
+
+    with patch("deepgram.Deepgram", MagicMock()):
+        import main
+
+    @asynccontextmanager
+    async def _fake_dbos_lifespan(_app):
+        yield
+
+    monkeypatch.setattr(main, "dbos_lifespan", _fake_dbos_lifespan)
+    monkeypatch.setattr(main, "close_asyncpg_pool", AsyncMock())
+    monkeypatch.setattr(main, "reap_stuck_jobs", AsyncMock())
+    monkeypatch.setattr(main, "_drain_text_clean_background_tasks", AsyncMock())
+    monkeypatch.setattr(main.app, "openapi_schema", None)
+
+    async with main.lifespan(main.app):
+        schema = main.app.openapi_schema
+        assert schema is not None
+        assert "/text/clean" in schema["paths"]
+        # Later calls are served from the cached document
+        assert main.app.openapi() is schema
+
+
+def test_openapi_warm_up_failure_does_not_raise(monkeypatch):
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost:5432/test")
+
+    with patch("deepgram.Deepgram", MagicMock()):
+        import main
+
+    app = MagicMock()
+    app.openapi.side_effect = RuntimeError("bad schema")
+
+    main._warm_openapi_schema(app)
+
+    app.openapi.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_shared_services_warmed_and_failures_tolerated(monkeypatch):
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "test-key")
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DATABASE_URL", "postgresql://localhost:5432/test")
+
+    with patch("deepgram.Deepgram", MagicMock()):
+        import main
+
+    built = []
+
+    class _Unconfigured:
+        def __init__(self):
+            raise ValueError("no key")
+
+    monkeypatch.setattr(main, "BatchService", _Unconfigured)
+    for name in ("BatchCleanerService", "AWSEventPublisher", "IntelligenceService", "S3Service"):
+        monkeypatch.setattr(
+            main, name, type(name, (), {"__init__": lambda self, n=name: built.append(n)})
+        )
+
+    main._warm_shared_services()
+
+    assert built == ["BatchCleanerService", "AWSEventPublisher", "IntelligenceService", "S3Service"]
+    # Warmed instances are the ones handed out afterwards
+    assert main.shared(main.AWSEventPublisher) is main.shared(main.AWSEventPublisher)
+    assert built.count("AWSEventPublisher") == 1
@@ -0,0 +1,67 @@
+"""Fire-and-forget transcript publishing in ``main`` (WebSocket /listen).
+
+The Deepgram transcript callback schedules Redis publishes as tasks
+instead of awaiting them; ``_drain_inflight_publishes`` must wait for
+every scheduled publish of a session before the final transcript read.
+A session's set is registered by ``websocket_endpoint`` before Deepgram
+opens; the tests register it the same way.
+
+``main`` comes from the lazy-import fixture in ``conftest.py``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_scheduled_publishes_in_order(main, monkeypatch):
+    written: list[str] = []
+
+    async def _publish(text: str) -> None:
+        await asyncio.sleep(0)
+        written.append(text)
+
+    monkeypatch.setitem(main._INFLIGHT_PUBLISHES, "sess-1", set())
+    for text in ["a", "b", "c"]:
+        main._schedule_publish("sess-1", _publish(text))
+
+    assert written == []
+    await main._drain_inflight_publishes("sess-1")
+
+    assert written == ["a", "b", "c"]
+    assert "sess-1" not in main._INFLIGHT_PUBLISHES
+
+
+@pytest.mark.asyncio
+async def test_drain_swallows_publish_errors(main, monkeypatch):
+    async def _boom() -> None:
+        raise RuntimeError("redis down")
+
+    monkeypatch.setitem(main._INFLIGHT_PUBLISHES, "sess-2", set())
+    main._schedule_publish("sess-2", _boom())
+
+    # Must not raise — a failed publish is logged, not fatal to finalization.
+    await main._drain_inflight_publishes("sess-2")
+    await main._drain_inflight_publishes("never-seen")
+
+
+@pytest.mark.asyncio
+async def test_publish_after_drain_is_dropped(main, monkeypatch):
+    written: list[str] = []
+
+    async def _publish(text: str) -> None:
+        written.append(text)
+
+    monkeypatch.setitem(main._INFLIGHT_PUBLISHES, "sess-3", set())
+    await main._drain_inflight_publishes("sess-3")
+
+    # A late Deepgram callback after finalization started must not leave a
+    # new entry behind: nothing would ever drain it.
+    main._schedule_publish("sess-3", _publish("late"))
+    await asyncio.sleep(0)
+
+    assert "sess-3" not in main._INFLIGHT_PUBLISHES
+    assert written == []
@@ -0,0 +1,29 @@
+"""Default response class for the FastAPI app in ``main``.
+
+``main`` sets ``ORJSONResponse`` as the app-wide default so every JSON
+route — including the included routers — serializes through orjson.
+``main`` comes from the lazy-import fixture in ``conftest.py``.
+"""
+
+from __future__ import annotations
+
+from fastapi.responses import ORJSONResponse
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+
+def test_included_routers_inherit_orjson_response(main):
+    routes = {
+        route.path: route for route in main.app.routes if isinstance(route, APIRoute)
+    }
+
+    for path in ("/health", "/batch/process", "/text/clean"):
+        assert routes[path].response_class is ORJSONResponse, path
+
+
+def test_health_served_as_orjson(main):
+    # No ``with`` block: the lifespan (DB pool, DBOS) is not started.
+    response = TestClient(main.app).get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
@@ -0,0 +1,71 @@
+"""Final session output delivery in ``main`` (WebSocket /listen).
+
+``_send_session_complete`` keeps the legacy single ``session_complete``
+frame by default and splits it into summary / transcript-chunk / done
+frames when the client opts in with ``?chunked_results=true``. ``main``
+comes from the lazy-import fixture in ``conftest.py``.
+"""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def _frames(ws) -> list[dict]:
+    return [json.loads(call.args[0]) for call in ws.send_text.await_args_list]
+
+
+def _output(cleaned: str):
+    return SimpleNamespace(
+        summary="Short summary",
+        action_items=["Follow up"],
+        cleaned_transcript=cleaned,
+    )
+
+
+@pytest.mark.asyncio
+async def test_default_sends_single_legacy_frame(main):
+    ws = MagicMock(send_text=AsyncMock())
+
+    await main._send_session_complete(ws, _output("cleaned"), "raw")
+
+    assert _frames(ws) == [{
+        "type": "session_complete",
+        "summary": "Short summary",
+        "action_items": ["Follow up"],
+        "cleaned_transcript": "cleaned",
+        "raw_transcript": "raw",
+    }]
+
+
+@pytest.mark.asyncio
+async def test_chunked_splits_cleaned_transcript(main, monkeypatch):
+    monkeypatch.setattr(main, "SESSION_RESULT_CHUNK_CHARS", 4)
+    ws = MagicMock(send_text=AsyncMock())
+
+    await main._send_session_complete(ws, _output("abcdefghij"), "raw", chunked=True)
+
+    frames = _frames(ws)
+    assert frames[0] == {
+        "type": "session_summary",
+        "summary": "Short summary",
+        "action_items": ["Follow up"],
+    }
+    chunks = [f for f in frames if f["type"] == "cleaned_transcript_chunk"]
+    assert [c["index"] for c in chunks] == [0, 1, 2]
+    assert "".join(c["text"] for c in chunks) == "abcdefghij"
+    assert frames[-1] == {"type": "session_complete", "done": True, "chunks": 3}
+
+
+@pytest.mark.asyncio
+async def test_chunked_with_empty_transcript_sends_no_chunks(main):
+    ws = MagicMock(send_text=AsyncMock())
+
+    await main._send_session_complete(ws, _output(""), "raw", chunked=True)
+
+    assert [f["type"] for f in _frames(ws)] == ["session_summary", "session_complete"]
+    assert _frames(ws)[-1]["chunks"] == 0
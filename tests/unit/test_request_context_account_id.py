@@ -29,3 +29,42 @@ def test_request_context_accepts_account_id():
         trace_id="trace-1",
     )
     assert ctx.account_id == "acct-1"
+
+
+def test_request_context_is_frozen_and_slotted():
+    import dataclasses
+
+    ctx = RequestContext(
+        tenant_id="t", user_id="u", account_id="a", interaction_id="i", trace_id="tr"
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ctx.account_id = "other"
+    assert not hasattr(ctx, "__dict__")
+
+
+def test_request_context_uuid_accessors_parse_once():
+    import uuid
+
+    tenant, interaction = uuid.uuid4(), uuid.uuid4()
+    ctx = RequestContext(
+        tenant_id=str(tenant),
+        user_id="u",
+        account_id="a",
+        interaction_id=str(interaction),
+        trace_id="tr",
+    )
+
+    assert ctx.tenant_uuid == tenant
+    assert ctx.tenant_uuid is ctx.tenant_uuid
+    assert ctx.interaction_uuid == interaction
+    assert ctx.interaction_uuid is ctx.interaction_uuid
+    # The cache does not leak into equality or repr
+    assert ctx == RequestContext(
+        tenant_id=str(tenant),
+        user_id="u",
+        account_id="a",
+        interaction_id=str(interaction),
+        trace_id="tr",
+    )
+    assert "_tenant_uuid" not in repr(ctx)
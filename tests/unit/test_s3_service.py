@@ -0,0 +1,44 @@
+"""Unit tests for :class:`services.s3_service.S3Service` key handling.
+
+The boto3 client is patched out; only the local key logic is exercised.
+"""
+
+from __future__ import annotations
+
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from services.s3_service import S3Service
+
+
+@pytest.fixture
+def s3_service() -> S3Service:
+    with patch("services.s3_service.boto3"):
+        return S3Service()
+
+
+def test_generated_key_belongs_to_its_tenant(s3_service):
+    tenant_id = str(uuid.uuid4())
+    key = s3_service.generate_file_key(tenant_id, str(uuid.uuid4()), "call.wav")
+
+    assert key.startswith(f"tenant/{tenant_id}/uploads/")
+    assert s3_service.validate_key_belongs_to_tenant(key, tenant_id)
+    assert not s3_service.validate_key_belongs_to_tenant(key, str(uuid.uuid4()))
+
+
+@pytest.mark.parametrize(
+    "file_key",
+    [
+        "tenant/{tenant}/other/job/call.wav",  # outside the uploads prefix
+        "tenant/{tenant}-x/uploads/job/call.wav",  # tenant id is only a prefix
+        "tenants/{tenant}/uploads/job/call.wav",
+    ],
+)
+def test_keys_outside_tenant_upload_prefix_rejected(s3_service, file_key):
+    tenant_id = str(uuid.uuid4())
+
+    assert not s3_service.validate_key_belongs_to_tenant(
+        file_key.format(tenant=tenant_id), tenant_id
+    )
@@ -0,0 +1,91 @@
+"""Unit tests for :mod:`services.shared_instances`."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.shared_instances import shared
+
+
+class _Service:
+    created = 0
+
+    def __init__(self):
+        type(self).created += 1
+
+
+@pytest.fixture(autouse=True)
+def _reset_counter():
+    _Service.created = 0
+
+
+@pytest.mark.asyncio
+async def test_same_instance_within_a_loop():
+    first = shared(_Service)
+    second = shared(_Service)
+
+    assert first is second
+    assert _Service.created == 1
+
+
+@pytest.mark.asyncio
+async def test_distinct_classes_get_distinct_instances():
+    class _Other:
+        pass
+
+    assert shared(_Service) is not shared(_Other)
+
+
+@pytest.mark.asyncio
+async def test_other_event_loop_gets_its_own_instance():
+    here = shared(_Service)
+    result = {}
+
+    def _other_thread():
+        async def _get():
+            return shared(_Service)
+        result["instance"] = asyncio.run(_get())
+
+    thread = threading.Thread(target=_other_thread)
+    thread.start()
+    thread.join()
+
+    assert result["instance"] is not here
+    assert _Service.created == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_construction_is_not_cached():
+    calls = []
+
+    class _Flaky:
+        def __init__(self):
+            calls.append(1)
+            if len(calls) == 1:
+                raise ValueError("missing credentials")
+
+    with pytest.raises(ValueError):
+        shared(_Flaky)
+
+    assert isinstance(shared(_Flaky), _Flaky)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_patched_class_is_honoured_by_call_sites():
+    """Call sites pass the class as bound in their own module, so patching
+    that name swaps the shared instance too."""
+    from routers import batch
+
+    fake = MagicMock()
+    with patch.object(batch, "BatchService", return_value=fake):
+        assert shared(batch.BatchService) is fake
+
+
+def test_requires_running_loop():
+    with pytest.raises(RuntimeError):
+        shared(_Service)
@@ -23,6 +23,18 @@ def test_rejects_empty_account_id():
         TextCleanRequest(text="hello", account_id="")
 
 
+@pytest.mark.parametrize("text", ["", " ", "\n\t  \r", "\u00a0\u2003", "\x1c\x1f"])
+def test_rejects_whitespace_only_text(text):
+    assert not text.strip()
+    with pytest.raises(ValidationError, match="only whitespace"):
+        TextCleanRequest(text=text, account_id="acct-1")
+
+
+def test_accepts_text_with_leading_whitespace():
+    req = TextCleanRequest(text=" " * 10_000 + "x", account_id="acct-1")
+    assert req.text.endswith("x")
+
+
 def test_text_clean_accepts_participants():
     req = TextCleanRequest(
         text="meeting note",
@@ -131,7 +143,7 @@ def test_occurred_at_float_rejected():
 
 
 def test_occurred_at_assignment_naive_revalidated():
-    # validate_assignment closes the post-construction mutation bypass: a naive
+    # The frozen model closes the post-construction mutation bypass: a naive
     # value can't be smuggled in by setting the attribute after construction.
     req = _req(occurred_at="2026-01-10T09:00:00Z")
     with pytest.raises(ValidationError):
@@ -0,0 +1,296 @@
+"""POST /upload/complete and the upload job worker pool.
+
+S3 and the database session are faked; the handler is called directly
+with a resolved auth context.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from models.job_models import JobStatus, UploadCompleteRequest
+from models.request_context import RequestContext
+from routers import upload
+
+TENANT_ID = str(uuid.uuid4())
+FILE_KEY = f"tenant/{TENANT_ID}/uploads/job/call.wav"
+
+
+def _context() -> RequestContext:
+    return RequestContext(
+        tenant_id=TENANT_ID,
+        user_id="auth0|user",
+        account_id="acct-1",
+        interaction_id=str(uuid.uuid4()),
+        trace_id=str(uuid.uuid4()),
+    )
+
+
+def _session_cm(job, on_execute=None, session=None):
+    session = session or MagicMock()
+    session.commit = AsyncMock()
+    session.refresh = AsyncMock()
+
+    async def _execute(stmt):
+        if on_execute:
+            on_execute()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = job
+        return result
+
+    session.execute = _execute
+
+    class _CM:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    return _CM()
+
+
+async def _complete(s3, job, on_execute=None, queue=None, session=None):
+    queue = queue or MagicMock(submit=MagicMock(return_value=True))
+    with patch.object(upload, "S3Service", return_value=s3), \
+         patch.object(upload, "get_async_session", lambda: _session_cm(job, on_execute, session)), \
+         patch.object(upload, "UploadJobQueue", return_value=queue):
+        return await upload.upload_complete(UploadCompleteRequest(file_key=FILE_KEY), _context())
+
+
+def _queued_job() -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(), interaction_id=uuid.uuid4(), status=JobStatus.queued,
+        file_name=None, mime_type=None, file_size=None, updated_at=None,
+    )
+
+
+def _s3_with_file() -> MagicMock:
+    s3 = MagicMock()
+    s3.validate_key_belongs_to_tenant.return_value = True
+    s3.verify_object_exists.return_value = True
+    return s3
+
+
+@pytest.mark.asyncio
+async def test_head_object_overlaps_job_lookup():
+    head_started = threading.Event()
+    db_queried = threading.Event()
+
+    def _head(file_key):
+        head_started.set()
+        # Only returns once the DB lookup has run, so a serial
+        # implementation would time out here.
+        return db_queried.wait(timeout=5)
+
+    s3 = MagicMock()
+    s3.validate_key_belongs_to_tenant.return_value = True
+    s3.verify_object_exists.side_effect = _head
+    job = _queued_job()
+
+    response = await _complete(s3, job, on_execute=db_queried.set)
+
+    assert head_started.is_set()
+    assert response.status == JobStatus.queued
+    assert response.job_id == str(job.id)
+
+
+@pytest.mark.asyncio
+async def test_missing_file_reported_before_missing_job():
+    s3 = MagicMock()
+    s3.validate_key_belongs_to_tenant.return_value = True
+    s3.verify_object_exists.return_value = False
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _complete(s3, job=None)
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.detail == "File not found in storage"
+
+
+@pytest.mark.asyncio
+async def test_complete_enqueues_job_on_worker_pool():
+    queue = MagicMock(submit=MagicMock(return_value=True))
+    job = _queued_job()
+
+    await _complete(_s3_with_file(), job, queue=queue)
+
+    queue.submit.assert_called_once_with(str(job.id), TENANT_ID)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_with_503():
+    queue = MagicMock(submit=MagicMock(return_value=False))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _complete(_s3_with_file(), _queued_job(), queue=queue)
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "5"}
+
+
+@pytest.mark.asyncio
+async def test_job_queue_bounds_concurrency_and_size(monkeypatch):
+    monkeypatch.setenv("UPLOAD_JOB_WORKERS", "2")
+    monkeypatch.setenv("UPLOAD_JOB_QUEUE_SIZE", "3")
+    in_flight = 0
+    peak = 0
+    release = asyncio.Event()
+    processed = []
+
+    async def _fake_process(job_id, tenant_id):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await release.wait()
+        processed.append(job_id)
+        in_flight -= 1
+
+    monkeypatch.setattr(upload, "_process_upload_job", _fake_process)
+    queue = upload.UploadJobQueue()
+    try:
+        # Two picked up by the workers, three waiting, the sixth rejected.
+        assert queue.submit("j0", TENANT_ID) and queue.submit("j1", TENANT_ID)
+        await asyncio.sleep(0)
+        assert all(queue.submit(f"j{i}", TENANT_ID) for i in range(2, 5))
+        assert not queue.submit("j5", TENANT_ID)
+
+        release.set()
+        await asyncio.wait_for(queue._queue.join(), timeout=5)
+    finally:
+        await queue.stop()
+
+    assert peak == 2
+    assert sorted(processed) == ["j0", "j1", "j2", "j3", "j4"]
+
+
+@pytest.mark.asyncio
+async def test_job_queue_worker_survives_failed_job(monkeypatch):
+    monkeypatch.setenv("UPLOAD_JOB_WORKERS", "1")
+    calls = []
+
+    async def _fake_process(job_id, tenant_id):
+        calls.append(job_id)
+        if job_id == "bad":
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(upload, "_process_upload_job", _fake_process)
+    queue = upload.UploadJobQueue()
+    try:
+        queue.submit("bad", TENANT_ID)
+        queue.submit("good", TENANT_ID)
+        await asyncio.wait_for(queue._queue.join(), timeout=5)
+    finally:
+        await queue.stop()
+
+    assert calls == ["bad", "good"]
+
+
+@pytest.mark.asyncio
+async def test_job_queue_ignores_duplicate_submit(monkeypatch):
+    monkeypatch.setenv("UPLOAD_JOB_WORKERS", "1")
+    release = asyncio.Event()
+    calls = []
+
+    async def _fake_process(job_id, tenant_id):
+        calls.append(job_id)
+        await release.wait()
+
+    monkeypatch.setattr(upload, "_process_upload_job", _fake_process)
+    queue = upload.UploadJobQueue()
+    try:
+        assert queue.submit("running", TENANT_ID)
+        await asyncio.sleep(0)
+        # A retried /complete for a job still waiting does not enqueue it again.
+        assert queue.submit("waiting", TENANT_ID)
+        assert queue.submit("waiting", TENANT_ID)
+        assert "waiting" in queue and "running" not in queue
+        assert queue._queue.qsize() == 1
+
+        release.set()
+        await asyncio.wait_for(queue._queue.join(), timeout=5)
+    finally:
+        await queue.stop()
+
+    assert calls == ["running", "waiting"]
+
+
+@pytest.mark.asyncio
+async def test_complete_returns_queued_job_already_enqueued():
+    job = _queued_job()
+    session = MagicMock()
+    queue = MagicMock()
+    queue.__contains__.return_value = True
+
+    response = await _complete(_s3_with_file(), job, queue=queue, session=session)
+
+    assert response.status == JobStatus.queued
+    queue.submit.assert_not_called()
+    session.commit.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_job_queue_stop_fails_jobs_still_queued(monkeypatch):
+    monkeypatch.setenv("UPLOAD_JOB_WORKERS", "1")
+    started = asyncio.Event()
+
+    async def _fake_process(job_id, tenant_id):
+        started.set()
+        await asyncio.Event().wait()
+
+    statements = []
+    session = MagicMock()
+    session.commit = AsyncMock()
+
+    async def _execute(stmt):
+        statements.append(stmt)
+        return MagicMock(all=MagicMock(return_value=[]))
+
+    session.execute = _execute
+
+    class _CM:
+        async def __aenter__(self):
+            return session
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(upload, "_process_upload_job", _fake_process)
+    monkeypatch.setattr(upload, "get_async_session", _CM)
+    job_ids = [str(uuid.uuid4()) for _ in range(3)]
+    queue = upload.UploadJobQueue()
+    for job_id in job_ids:
+        assert queue.submit(job_id, TENANT_ID)
+    await asyncio.wait_for(started.wait(), timeout=5)
+
+    await queue.stop()
+
+    # One UPDATE covers the waiting jobs and the one cut off before it was
+    # claimed; the status guard leaves claimed ('processing') rows to the reaper.
+    assert len(statements) == 1
+    params = statements[0].compile().params
+    assert params["status"] == JobStatus.failed
+    assert params["error_code"] == "SHUTDOWN"
+    assert params["status_1"] == JobStatus.queued
+    assert {str(u) for u in params["id_1"]} == set(job_ids)
+    session.commit.assert_awaited_once()
+    assert queue._queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_complete_commits_without_refresh():
+    session = MagicMock()
+    job = _queued_job()
+
+    response = await _complete(_s3_with_file(), job, session=session)
+
+    session.commit.assert_awaited_once()
+    session.refresh.assert_not_awaited()
+    assert response.interaction_id == str(job.interaction_id)
@@ -53,3 +53,20 @@ def test_upload_init_accepts_participants():
     )
     assert req.participants is not None
     assert len(req.participants) == 1
+
+
+@pytest.mark.parametrize(
+    "reported, expected",
+    [
+        ("audio/wav", "audio/wav"),
+        ("audio/x-m4a", "audio/mp4"),
+        ("Audio/X-M4A ", "audio/mp4"),
+        ("video/webm", "audio/webm"),
+        ("audio/ogg", "audio/ogg"),
+        ("Audio/OGG", "Audio/OGG"),
+    ],
+)
+def test_normalize_audio_mime_type(reported, expected):
+    from routers.upload import _normalize_audio_mime_type
+
+    assert _normalize_audio_mime_type(reported) == expected
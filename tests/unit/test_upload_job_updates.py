@@ -0,0 +1,161 @@
+"""Job status writes in :mod:`routers.upload` (worker and startup reaper).
+
+The database session is a fake that records each executed statement, so
+the tests check the SQL the worker issues rather than a live Postgres.
+The tenant internal-domain lookup is faked the same way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Update
+
+from models.job_models import JobStatus
+from routers import upload
+
+
+def _claimed_row() -> SimpleNamespace:
+    return SimpleNamespace(
+        file_key="tenant/t/uploads/j/call.wav",
+        file_name="call.wav",
+        file_size=2048,
+        mime_type="audio/wav",
+        interaction_id=uuid.uuid4(),
+        user_id="auth0|user",
+        pg_user_id=None,
+        user_name=None,
+        trace_id="trace-1",
+        account_id="acct-1",
+        participants_json=None,
+    )
+
+
+@pytest.fixture
+def executed(monkeypatch):
+    statements = []
+    row = _claimed_row()
+
+    class _Session:
+        async def execute(self, stmt):
+            statements.append(stmt)
+            result = MagicMock()
+            result.one_or_none.return_value = row
+            return result
+
+        commit = AsyncMock()
+
+    class _CM:
+        async def __aenter__(self):
+            return _Session()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(upload, "get_async_session", lambda: _CM())
+    monkeypatch.setattr(upload, "get_tenant_internal_domains", AsyncMock(return_value=set()))
+    return statements
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_empty_transcript_job_uses_two_updates_and_no_select(executed):
+    tx_result = SimpleNamespace(transcript="  ", duration_seconds=3, channels=1, words=0)
+    s3 = MagicMock()
+    batch_service = MagicMock(transcribe_from_url=AsyncMock(return_value=tx_result))
+
+    with patch.object(upload, "S3Service", return_value=s3), \
+         patch.object(upload, "BatchService", return_value=batch_service), \
+         patch.object(upload, "_normalize_audio_mime_type") as normalize:
+        await upload._process_upload_job(str(uuid.uuid4()), str(uuid.uuid4()))
+
+    # The stored MIME type is already canonical; the worker uses it as is.
+    normalize.assert_not_called()
+    assert batch_service.transcribe_from_url.await_args.args[1] == "audio/wav"
+
+    assert [type(stmt) for stmt in executed] == [Update, Update]
+    claim, finish = executed
+    assert "RETURNING upload_jobs.file_key" in _sql(claim)
+    assert claim.compile().params["status"] == JobStatus.processing
+    assert "upload_jobs.status = %(status_1)s" in _sql(claim)
+    assert claim.compile().params["status_1"] == JobStatus.queued
+    assert "RETURNING" not in _sql(finish)
+    params = finish.compile().params
+    assert params["status"] == JobStatus.failed
+    assert params["error_code"] == "EMPTY_TRANSCRIPT"
+    assert "file_size=2048" in params["error_message"]
+
+
+@pytest.mark.asyncio
+async def test_job_not_queued_is_skipped(executed, monkeypatch):
+    # The guarded claim matches no row: already claimed, finished or failed.
+    class _Session:
+        async def execute(self, stmt):
+            executed.append(stmt)
+            return MagicMock(one_or_none=MagicMock(return_value=None))
+
+        commit = AsyncMock()
+
+    class _CM:
+        async def __aenter__(self):
+            return _Session()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(upload, "get_async_session", _CM)
+    batch_service = MagicMock(transcribe_from_url=AsyncMock())
+
+    with patch.object(upload, "S3Service"), \
+         patch.object(upload, "BatchService", return_value=batch_service):
+        await upload._process_upload_job(str(uuid.uuid4()), str(uuid.uuid4()))
+
+    assert len(executed) == 1
+    batch_service.transcribe_from_url.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_internal_domains_lookup_overlaps_transcription(executed, monkeypatch):
+    lookup_started = asyncio.Event()
+
+    async def _domains(tenant_id):
+        lookup_started.set()
+        return {"acme.com"}
+
+    async def _transcribe(audio_url, mime_type):
+        # Only returns once the lookup is running, so a serial worker
+        # would time out here.
+        await asyncio.wait_for(lookup_started.wait(), timeout=5)
+        return SimpleNamespace(transcript="", duration_seconds=1, channels=1, words=0)
+
+    monkeypatch.setattr(upload, "get_tenant_internal_domains", _domains)
+    batch_service = MagicMock(transcribe_from_url=_transcribe)
+
+    with patch.object(upload, "S3Service", return_value=MagicMock()), \
+         patch.object(upload, "BatchService", return_value=batch_service):
+        await upload._process_upload_job(str(uuid.uuid4()), str(uuid.uuid4()))
+
+    assert lookup_started.is_set()
+    assert executed[-1].compile().params["error_code"] == "EMPTY_TRANSCRIPT"
+
+
+@pytest.mark.asyncio
+async def test_reaper_fails_stuck_jobs_with_one_update(executed):
+    await upload.reap_stuck_jobs(max_age_minutes=30)
+
+    (stmt,) = executed
+    assert isinstance(stmt, Update)
+    sql = _sql(stmt)
+    assert "upload_jobs.started_at <" in sql
+    assert "RETURNING upload_jobs.id, upload_jobs.started_at" in sql
+    params = stmt.compile().params
+    assert params["status"] == JobStatus.failed
+    assert params["error_code"] == "PROCESSING_TIMEOUT"
@@ -0,0 +1,96 @@
+"""GET /upload/status/{job_id}: column-only job lookup.
+
+The database session is faked and records the executed statement.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from models.job_models import JobStatus
+from models.request_context import RequestContext
+from routers import upload
+
+TENANT_ID = str(uuid.uuid4())
+
+
+def _context() -> RequestContext:
+    return RequestContext(
+        tenant_id=TENANT_ID,
+        user_id="auth0|user",
+        account_id=None,
+        interaction_id=str(uuid.uuid4()),
+        trace_id=str(uuid.uuid4()),
+    )
+
+
+def _row(tenant_id=TENANT_ID) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        tenant_id=uuid.UUID(tenant_id),
+        status=JobStatus.queued,
+        interaction_id=uuid.uuid4(),
+        created_at=datetime.now(timezone.utc),
+        started_at=None,
+        completed_at=None,
+        result_summary=None,
+        error_message=None,
+        error_code=None,
+    )
+
+
+@pytest.fixture
+def executed(monkeypatch):
+    statements = []
+    state = SimpleNamespace(row=None)
+
+    class _Session:
+        async def execute(self, stmt):
+            statements.append(stmt)
+            result = MagicMock()
+            result.one_or_none.return_value = state.row
+            return result
+
+    class _CM:
+        async def __aenter__(self):
+            return _Session()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(upload, "get_async_session", lambda: _CM())
+    return SimpleNamespace(statements=statements, state=state)
+
+
+@pytest.mark.asyncio
+async def test_status_selects_only_response_columns(executed):
+    row = _row()
+    executed.state.row = row
+
+    response = await upload.upload_status(str(row.id), _context())
+
+    (stmt,) = executed.statements
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "upload_jobs.result_summary" in sql
+    for unused in ("file_key", "participants_json", "user_name"):
+        assert f"upload_jobs.{unused}" not in sql
+    assert response.job_id == str(row.id)
+    assert response.status == JobStatus.queued
+    assert response.interaction_id == str(row.interaction_id)
+
+
+@pytest.mark.asyncio
+async def test_status_rejects_other_tenants_job(executed):
+    executed.state.row = _row(tenant_id=str(uuid.uuid4()))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await upload.upload_status(str(executed.state.row.id), _context())
+
+    assert exc_info.value.status_code == 403
@@ -0,0 +1,39 @@
+"""Unit tests for utils.uuid_utils.uuid7."""
+
+import time
+from uuid import UUID
+
+from utils.uuid_utils import uuid7
+
+
+def test_uuid7_sets_version_and_variant():
+    value = uuid7()
+
+    assert isinstance(value, UUID)
+    assert value.version == 7
+    assert value.variant == "specified in RFC 4122"
+
+
+def test_uuid7_embeds_current_unix_millis():
+    before = time.time_ns() // 1_000_000
+    value = uuid7()
+    after = time.time_ns() // 1_000_000
+
+    ts_ms = value.int >> 80
+    # May borrow a millisecond ahead when the per-ms counter overflows.
+    assert before <= ts_ms <= after + 1
+
+
+def test_uuid7_is_monotonic_within_process():
+    values = [uuid7() for _ in range(5000)]
+
+    assert values == sorted(values)
+    assert len(set(values)) == len(values)
+
+
+def test_models_default_to_uuid7_primary_keys():
+    from models.db_models import PersonaModel
+    from models.job_models import UploadJob
+
+    assert PersonaModel.model_fields["id"].default_factory is uuid7
+    assert UploadJob.model_fields["id"].default_factory is uuid7
@@ -33,6 +33,13 @@ Four extraction modes are available:
      (the sentinel empty-string makes accidental writes loud rather than silent)
    - Use for: GET /upload/status/{job_id}, any other non-mutating route
 
+ingestion_context() / polling_context() wrap 3 and 4 as async FastAPI
+dependencies (``Annotated[RequestContext, Depends(ingestion_context)]``).
+FastAPI caches a dependency's result for the request, so the JWT is
+verified once even when several dependencies of one route need the
+context; being async, they run on the event loop rather than in the
+threadpool.
+
 The ingestion/polling split (T1.26.4, 2026-05-14) replaces the legacy
 get_auth_context() helper. The split is documented in
 docs/contacts-architecture.md Section 3.5.
@@ -246,6 +253,16 @@ def get_auth_context_polling(request: Request) -> RequestContext:
     return _resolve_auth_context(request, require_account_id=False)
 
 
+async def ingestion_context(request: Request) -> RequestContext:
+    """:func:`get_auth_context_ingestion` as a FastAPI dependency."""
+    return get_auth_context_ingestion(request)
+
+
+async def polling_context(request: Request) -> RequestContext:
+    """:func:`get_auth_context_polling` as a FastAPI dependency."""
+    return get_auth_context_polling(request)
+
+
 def _resolve_auth_context(
     request: Request,
     *,
@@ -0,0 +1,61 @@
+"""Time-ordered UUIDv7 generation (RFC 9562).
+
+Random v4 primary keys scatter inserts across the whole B-tree, so every
+insert into a large table touches a cold index page. UUIDv7 puts a 48-bit
+Unix-millisecond timestamp in the high bits, so new rows land at the tail of
+the primary-key index.
+
+Layout (128 bits):
+    unix_ts_ms (48) | ver=7 (4) | rand_a (12) | var=0b10 (2) | rand_b (62)
+
+``rand_a`` is used as a per-millisecond counter (RFC 9562 §6.2, method 1)
+so ids generated within the same millisecond by this process still sort in
+creation order. The column type stays ``UUID``; existing v4 rows are left
+as-is.
+
+Python's stdlib gains ``uuid.uuid7`` only in 3.14; this module can be
+dropped in favour of it once the runtime moves past that.
+"""
+
+import os
+import threading
+import time
+from uuid import UUID
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+_COUNTER_MAX = 0xFFF
+
+
+def uuid7() -> UUID:
+    """Return a new time-ordered UUIDv7."""
+    global _last_ms, _counter
+
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            # Start each millisecond at a random point in the lower half so
+            # the counter rarely overflows.
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x7FF
+        else:
+            _counter += 1
+            if _counter > _COUNTER_MAX:
+                # Counter exhausted (or clock went backwards): borrow the
+                # next millisecond to stay monotonic.
+                _last_ms += 1
+                _counter = 0
+        ts_ms = _last_ms
+        counter = _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (
+        (ts_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | counter << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return UUID(int=value)